@@ -6,19 +6,90 @@ config.py - 설정 및 상수 관리 모듈
 VWORLD_GEOCODE_URL = "http://api.vworld.kr/req/address"
 VWORLD_SEARCH_URL  = "http://api.vworld.kr/req/search"
 VWORLD_STATIC_MAP_URL = "http://api.vworld.kr/req/image"
+# 배경지도 타일 (WMTS, Web Mercator XYZ 타일 - 키는 URL 경로에 포함)
+VWORLD_WMTS_URL = "http://api.vworld.kr/req/wmts/1.0.0/{key}/Base/{z}/{y}/{x}.png"
 
 # 네이버 지도 API 엔드포인트
 NAVER_GEOCODE_URL = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
 NAVER_STATIC_MAP_URL = "https://maps.apigw.ntruss.com/map-static/v2/raster"
 
 # 기본 지도 서비스 제공자
-DEFAULT_PROVIDER = "vworld"  # "vworld" 또는 "naver"
+DEFAULT_PROVIDER = "vworld"  # "vworld", "naver" 또는 "offline"(로컬 타일 파일, 지오코딩은 오프라인 색인만 사용)
 
 # 하위 호환성을 위한 별칭
 GEOCODE_URL = VWORLD_GEOCODE_URL
 SEARCH_URL = VWORLD_SEARCH_URL
 STATIC_MAP_URL = VWORLD_STATIC_MAP_URL
 
+# 지오코딩 영구 캐시 (config.json과 같은 폴더에 생성)
+GEOCODE_CACHE_FILE = "geocode_cache.db"
+GEOCODE_CACHE_TTL_DAYS = 90
+GEOCODE_CACHE_MAX_ENTRIES = 200000
+GEOCODE_NEGATIVE_TTL_HOURS = 72  # 찾지 못한 주소(실패 캐시)의 보관 기간
+
+# 오프라인 주소 색인 (python -m utils.address_index build 로 생성, config.json과 같은 폴더)
+ADDRESS_INDEX_FILE = "address_index.bin"
+
+# 병렬 지오코딩 설정 (프로바이더별 초당 요청 수 제한)
+GEOCODE_WORKERS = 8
+PROVIDER_QPS = {"vworld": 10, "naver": 10}
+GEOCODE_REQUEST_BUDGET = 12  # 주소 하나가 폴백 단계에서 사용할 수 있는 최대 HTTP 요청 수
+
+# HTTP 전송 계층 (호스트별 연결 풀 크기, 429/5xx 재시도 및 지수 백오프)
+HTTP_POOL_SIZE = 16
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 8.0
+
+# 지오코딩 작업 체크포인트 (중단 후 이어서 진행)
+CHECKPOINT_DIR = "checkpoints"
+CHECKPOINT_INTERVAL = 100  # 이 행 수마다 디스크에 기록
+
+# 진행률 표시 갱신 주기 (워커 이벤트를 모아 초당 몇 번만 화면에 반영)
+PROGRESS_POLL_MS = 250
+
+# 실행 로그: 화면 버퍼 크기, 화면 반영 주기, 로그 창 최대 줄 수, 표시 레벨(debug/info/error)
+LOG_BUFFER_LINES = 2000
+LOG_FLUSH_MS = 200
+LOG_WIDGET_MAX_LINES = 5000
+LOG_LEVEL = "info"
+# 파일 로그 (빈 문자열이면 사용 안 함, 예: "emap.log" → 실행 폴더에 2MB × 3개 회전 기록)
+LOG_FILE = ""
+LOG_FILE_MAX_BYTES = 2 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+# 지오코딩 전 전처리(정제/검증)를 한 번에 수행할 행 수 (스트리밍 입력을 이 단위로 묶음)
+PREPROCESS_CHUNK_ROWS = 1000
+
+# 지오코딩 결과를 엑셀/CSV에 덧붙일 때의 컬럼 이름 (다시 불러오면 좌표 컬럼으로 인식됨)
+RESULT_COLUMNS = ["경도", "위도", "정제주소", "상태"]
+
+# 지오코딩 중 찾은 핀을 지도에 반영하는 최소 간격(ms)과, 화면 가장자리에서 이만큼(px) 벗어난 점이 생기면 뷰를 다시 맞춤
+LIVE_MAP_INTERVAL_MS = 1500
+LIVE_MAP_EDGE_PX = 30
+
+# 베이스 지도 타일: 메모리에 보관할 디코딩된 타일 수(256×256 RGBA 한 장 약 256KB)와 동시 요청 수
+TILE_MEMORY_CACHE = 256
+TILE_FETCH_WORKERS = 6
+
+# 받은 베이스 지도(타일, 정적 지도)를 보관하는 디스크 캐시 폴더와 최대 크기(MB).
+# 정적 지도는 중심을 이 간격(px)의 격자에 맞춰 요청하여 거의 같은 뷰끼리 같은 이미지를 재사용
+MAP_CACHE_DIR = "map_cache"
+MAP_CACHE_MAX_MB = 200
+MAP_CACHE_SNAP_PX = 16
+
+# 뷰가 멈추고 이만큼(ms) 지나면 다음에 볼 가능성이 높은 뷰를 최대 PREFETCH_MAX_VIEWS개 미리 받아 디스크 캐시에 저장
+# (화면 갱신과 경쟁하지 않도록 동시 요청은 PREFETCH_WORKERS개로 제한)
+PREFETCH_DELAY_MS = 500
+PREFETCH_MAX_VIEWS = 3
+PREFETCH_WORKERS = 2
+
+# 화면 갱신용 베이스 지도 요청 워커 수 (느린 응답 하나가 새 요청을 막지 않도록 2개 이상)
+BASEMAP_LOAD_WORKERS = 2
+
+# 오프라인 지도(MBTiles) 파일을 mmap으로 읽을 최대 크기(MB)
+MBTILES_MMAP_MB = 256
+
 # 투영법 및 지도 관련 상수
 TILE_SIZE = 256
 DEFAULT_MAP_SIZE = (800, 800)
@@ -0,0 +1,103 @@
+"""
+geocode_cli.py - GUI 없이 엑셀/CSV 주소 목록을 일괄 지오코딩하는 명령줄 도구
+
+사용 예:
+    python geocode_cli.py 지점목록.xlsx -o 결과.csv --provider vworld --workers 16
+
+결과 CSV에는 원본 컬럼 뒤에 경도/위도/정제주소/상태 컬럼이 붙으며, 행이 완료되는 대로 파일에 기록됩니다.
+입력은 한 행씩 스트리밍으로 읽으므로 (xlsx/csv/parquet) 대용량 파일도 메모리 사용량이 일정합니다.
+(tkinter/ttkbootstrap을 불러오지 않으므로 서버에서 야간 배치로 실행할 수 있습니다.)
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import deque
+from typing import List, Optional
+from config import DEFAULT_PROVIDER, GEOCODE_WORKERS, RESULT_COLUMNS
+from utils.app_config import get_app_dir, load_api_keys, create_geocode_engine
+from utils.sheet_reader import open_sheet
+from utils.geo_utils import find_coordinate_columns, parse_coordinate
+
+def run(input_path: str, output_path: str, provider: str, workers: int,
+        address_col: str = "주소", sheet=0, retry_failed: bool = False, quiet: bool = False) -> int:
+    """입력 파일을 지오코딩하여 결과를 CSV로 스트리밍 기록합니다. 종료 코드를 반환합니다."""
+    def log(message: str, level: str = "info"):
+        if not quiet or level == "error":
+            print(f"[{level.upper()}] {message}", file=sys.stderr)
+
+    stream = open_sheet(input_path, sheet)
+    if address_col not in stream.columns:
+        stream.close()
+        log(f"'{address_col}' 컬럼을 찾을 수 없습니다. (컬럼: {', '.join(stream.columns)})", "error")
+        return 2
+
+    api_keys = load_api_keys(get_app_dir())
+    # 엔진 내부의 상세 로그는 stderr를 어지럽히지 않도록 오류만 표시
+    engine = create_geocode_engine(api_keys, log_fn=lambda m, lv="info": log(m, lv) if lv == "error" else None)
+    engine.provider = provider
+
+    # 이전 결과 컬럼이 이미 있으면 새 결과로 대체
+    columns: List[str] = [c for c in stream.columns if c not in RESULT_COLUMNS]
+    coord_cols = find_coordinate_columns(stream.columns)
+    total = stream.total_hint
+    counts = {"ok": 0, "failed": 0}
+    started = time.monotonic()
+
+    # 읽은 행은 결과가 나올 때까지만 보관 (결과가 입력 순서대로 나오므로 앞에서부터 꺼냄)
+    rows: deque = deque()
+    def addresses():
+        for _, row in stream:
+            # 좌표가 이미 있는 행은 빈 주소로 넘겨 조회를 생략하고 기존 좌표를 그대로 기록
+            coord = parse_coordinate(row.get(coord_cols[0]), row.get(coord_cols[1])) if coord_cols else None
+            rows.append(([row.get(c) for c in columns], coord))
+            addr = row.get(address_col)
+            yield "" if addr is None or coord else str(addr)
+
+    with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns + RESULT_COLUMNS)
+        for idx, (lon, lat, refined), status in engine.geocode_batch(addresses(), provider, workers, retry_failed):
+            values, coord = rows.popleft()
+            row = ["" if v is None else v for v in values]
+            if coord:
+                lon, lat, status = coord[0], coord[1], "given"
+                refined = row[columns.index(address_col)]
+            if lon is not None:
+                counts["ok"] += 1
+                writer.writerow(row + [f"{lon:.7f}", f"{lat:.7f}", refined or "", status])
+            else:
+                counts["failed"] += 1
+                writer.writerow(row + ["", "", "", status])
+
+            done = idx + 1
+            if done % 200 == 0:
+                f.flush()
+                rate = done / max(time.monotonic() - started, 1e-6)
+                log(f"{done}/{total}행 ({rate:.1f}행/초)")
+
+    cs = engine.cache.stats()
+    log(f"완료: 성공 {counts['ok']}건, 실패 {counts['failed']}건, API 호출 {engine.api_calls}회, "
+        f"캐시 적중률 {cs['hit_rate']:.0%} → {output_path}")
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="엑셀/CSV 주소 목록을 GUI 없이 일괄 지오코딩합니다.")
+    parser.add_argument("input", help="입력 파일 (.xlsx, .xls, .csv, .parquet)")
+    parser.add_argument("-o", "--output", help="결과 CSV 경로 (기본: <입력파일>_geocoded.csv)")
+    parser.add_argument("--provider", choices=["vworld", "naver", "offline"], default=DEFAULT_PROVIDER)
+    parser.add_argument("--workers", type=int, default=GEOCODE_WORKERS, help="동시 지오코딩 작업 수")
+    parser.add_argument("--address-col", default="주소", help="주소 컬럼 이름")
+    parser.add_argument("--sheet", default=0, help="엑셀 시트 이름 또는 번호")
+    parser.add_argument("--retry-failed", action="store_true", help="실패 캐시를 무시하고 다시 조회")
+    parser.add_argument("-q", "--quiet", action="store_true", help="오류 외 진행 로그 숨김")
+    args = parser.parse_args(argv)
+
+    sheet = int(args.sheet) if str(args.sheet).isdigit() else args.sheet
+    output = args.output or os.path.splitext(args.input)[0] + "_geocoded.csv"
+    return run(args.input, output, args.provider, args.workers, args.address_col, sheet,
+               args.retry_failed, args.quiet)
+
+if __name__ == "__main__":
+    sys.exit(main())
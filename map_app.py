@@ -7,38 +7,45 @@ try:
 except:
     PRIMARY, SECONDARY, SUCCESS, DANGER, DARK, STRIPED = "primary", "secondary", "success", "danger", "dark", "striped"
 
-from ttkbootstrap.widgets.scrolled import ScrolledFrame # type: ignore
 import pandas as pd # type: ignore
-import requests # type: ignore
-from io import BytesIO
-from PIL import Image, ImageTk # type: ignore
+from PIL import ImageTk # type: ignore
 import json
 import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import math
 import sys
-from typing import Optional, Tuple, Dict, List, Any, cast, TYPE_CHECKING
-if TYPE_CHECKING:
-    from ttkbootstrap.widgets.scrolled import ScrolledFrame # type: ignore
-
-def get_app_dir():
-    """실행 파일 또는 스크립트가 위치한 디렉토리를 반환합니다."""
-    if getattr(sys, 'frozen', False):
-        # PyInstaller로 빌드된 경우 실행 파일(.exe)의 위치
-        return os.path.dirname(sys.executable)
-    # 스크립트로 실행되는 경우
-    return os.path.dirname(os.path.abspath(__file__))
+from typing import Optional, Tuple, Dict, List, Any, cast
 
 # 모듈별 기능 임포트
 from config import ( # type: ignore
-    DEFAULT_PROVIDER, TYPE_COLOR_MAP, PRESET_PALETTES, DIR_ICON_MAP,
-    VWORLD_STATIC_MAP_URL, NAVER_STATIC_MAP_URL, ZOOM_RANGE, TILE_SIZE
+    DEFAULT_PROVIDER, TYPE_COLOR_MAP, PRESET_PALETTES,
+    TILE_SIZE,
+    CHECKPOINT_DIR, CHECKPOINT_INTERVAL, RESULT_COLUMNS, PREPROCESS_CHUNK_ROWS,
+    PROGRESS_POLL_MS, LOG_BUFFER_LINES, LOG_FLUSH_MS, LOG_WIDGET_MAX_LINES, LOG_LEVEL, LOG_FILE, LOG_FILE_MAX_BYTES, LOG_FILE_BACKUPS,
+    LIVE_MAP_INTERVAL_MS, LIVE_MAP_EDGE_PX, GEOCODE_WORKERS
+)
+from utils.geo_utils import ( # type: ignore
+    calculate_zoom_and_center, find_coordinate_columns, coords_in_view, base_map_covers_view
 )
-from utils.geo_utils import latlon_to_pixel, calculate_zoom_and_center # type: ignore
 from utils.geocoding import GeocodeEngine # type: ignore
+from utils.app_config import get_app_dir, load_api_keys, create_geocode_engine, create_map_cache # type: ignore
+from utils.checkpoint import GeocodeCheckpoint, file_digest # type: ignore
+from utils.log_sink import LogSink # type: ignore
+from utils.progress import ProgressTracker, format_progress # type: ignore
+from utils.project_file import ProjectFile, save_project, PROJECT_EXT, FILE_DIALOG_TYPES as PROJECT_DIALOG_TYPES # type: ignore
+from utils.sheet_reader import SheetStream, open_sheet, list_sheets, read_table, FILE_DIALOG_TYPES # type: ignore
+from utils.preprocess import prepare_stream, summarize_rejections # type: ignore
 from renderer.map_renderer import MapRenderer # type: ignore
+from renderer.tile_engine import TileEngine # type: ignore
+from renderer.basemap import BasemapFetcher, BasemapLoader # type: ignore
+from renderer.prefetch import ViewPrefetcher # type: ignore
+from ui.place_list import VirtualPlaceList # type: ignore
+from ui.direction_editor import DirectionEditor # type: ignore
+from ui.sheet_picker import ask_sheets # type: ignore
 
 # ─────────────────────────────────────────────────────────────────────────────
 class ToolTip:
@@ -65,6 +72,27 @@ class ToolTip:
             tw.destroy()
 
 
+# 진행률 캐시 적중률 집계용: 지오코딩 상태 → 캐시 적중 여부 (없는 상태는 캐시를 거치지 않음)
+CACHE_HIT_STATUS = {"cached": True, "negative": True, "ok": False, "failed": False}
+
+class SheetJob:
+    """
+    시트 하나의 불러오기 작업. sheet가 None이면 첫 시트(또는 CSV/Parquet 파일 전체)
+    group: 이 시트 장소들의 타입(핀 색상 그룹)
+    resumed: 체크포인트에서 복원한 {행 번호: (결과, 상태)}, session: 변경분 모드의 {행 식별자: 기존 장소들}
+    """
+
+    def __init__(self, sheet: Optional[str] = None, group: str = "A",
+                 checkpoint: Optional[GeocodeCheckpoint] = None,
+                 resumed: Optional[Dict[int, Any]] = None,
+                 session: Optional[Dict[str, deque]] = None):
+        self.sheet = sheet
+        self.group = group
+        self.checkpoint = checkpoint
+        self.resumed = resumed or {}
+        self.session = session
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # ─────────────────────────────────────────────────────────────────────────────
 class AddressMapApp:
@@ -77,18 +105,38 @@ class AddressMapApp:
         except:
             self.style = None
 
+        # 모든 스레드의 로그를 모아 LOG_FLUSH_MS마다 로그 창에 한 번에 반영
+        self.log_sink = LogSink(LOG_BUFFER_LINES, LOG_LEVEL,
+                                file_path=os.path.join(get_app_dir(), LOG_FILE) if LOG_FILE else None,
+                                max_bytes=LOG_FILE_MAX_BYTES, backups=LOG_FILE_BACKUPS)
+
         # ── 상태 변수 ────────────────────────────────────────────────────────
         self.api_keys = self.load_api_keys()
         v_key = self.api_keys.get("vworld_key", "")
         n_id  = self.api_keys.get("naver_client_id", "")
         n_sec = self.api_keys.get("naver_client_secret", "")
         
-        self.geo_engine = GeocodeEngine(vworld_key=v_key, naver_client_id=n_id, naver_client_secret=n_sec, log_fn=self.add_log)
+        # 영구 캐시 + 오프라인 주소 색인이 연결된 엔진 (CLI와 동일한 구성)
+        self.geo_engine: GeocodeEngine = create_geocode_engine(self.api_keys, log_fn=self.add_log)
         self.map_provider = tk.StringVar(value=DEFAULT_PROVIDER)
         self.geo_engine.provider = self.map_provider.get()
 
         self.marker_positions = []
-        self.place_data       = []   # {lon, lat, name, addr, type, label_dir, visible, var}
+        self.place_data       = []   # {lon, lat, name, addr, type, order, label_dir, visible, success_idx, key, sheet}
+        # 워커 스레드가 찾은 장소를 모아 두었다가 메인 스레드에서 한 번에 목록에 추가
+        self._pending_places: List[Dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+        self._place_flush_scheduled = False
+        # 지오코딩 중 핀을 LIVE_MAP_INTERVAL_MS 간격으로 지도에 반영 (로딩 중일 때만)
+        self._live_map = False
+        self._live_map_scheduled = False
+        self._live_map_fitted = False
+        # 최종 맞춤에서 요청한 베이스 지도가 도착해야 '지도 생성' 단계를 끝냄
+        self._map_phase_pending = False
+        # 마지막으로 불러온 엑셀, [(시트, 그룹)] 목록과 시트별 행 결과 (좌표 포함 엑셀 저장, 변경분 다시 불러오기용)
+        self.loaded_path: str = ""
+        self.loaded_sheets: List[Tuple[Optional[str], str]] = []
+        self.row_results: Dict[Optional[str], Dict[int, Tuple[Optional[float], Optional[float], Optional[str], str]]] = {}
         self.current_center   = (37.5666, 126.9784)
         self.current_zoom     = 12.0
         self.last_api_zoom    = 12
@@ -104,6 +152,16 @@ class AddressMapApp:
         self.old_last_zoom = 12.0
         self.blend_alpha  = 1.0
         self.blend_timer  = None
+        # Vworld 배경지도 타일 조립기 (디코딩된 타일 메모리 LRU 포함)와 받은 지도 이미지 디스크 캐시
+        self.map_cache = create_map_cache()
+        self.tile_engine = TileEngine(disk_cache=self.map_cache)
+        self.basemap = BasemapFetcher(self.api_keys, self.map_cache, self.tile_engine, log_fn=self.add_log)
+        # 지도 요청은 백그라운드 워커에서 처리하고, 가장 최근 요청의 결과만 메인 스레드에서 반영
+        self.basemap_loader = BasemapLoader(
+            self.basemap, on_result=lambda *result: self.root.after(0, lambda: self._apply_basemap(*result)),
+            on_requests=lambda n: self.progress.add_api_calls(n))
+        # 다음에 볼 뷰를 유휴 시간에 미리 받아 두는 프리페처 (디스크 캐시가 있을 때만)
+        self.prefetcher = ViewPrefetcher(self.map_cache, log_fn=self.add_log) if self.map_cache else None
 
         # ── 커스터마이징 설정 ───────────────────────────────────────────────
         self.type_color_idx = dict(TYPE_COLOR_MAP)
@@ -114,15 +172,20 @@ class AddressMapApp:
         
         # UI 관련 추가 변수 (Lint 에러 방지용 초기화 및 타입 힌트)
         self.progress_var = tk.DoubleVar()
+        self.progress_text = tk.StringVar()
+        # 워커는 progress에 이벤트만 기록하고, UI는 PROGRESS_POLL_MS마다 읽어서 갱신
+        self.progress = ProgressTracker()
         self.select_all_var = tk.BooleanVar(value=True)
         self.vworld_key_var = tk.StringVar(value=v_key)
         self.naver_id_var = tk.StringVar(value=n_id)
         self.naver_sec_var = tk.StringVar(value=n_sec)
+        self.offline_path_var = tk.StringVar(value=self.api_keys.get("offline_tiles", ""))
         
         # 위젯 변수들 - 타입 지정을 통해 린트 에러 최소화
         self.dynamic_input_container: tb.Frame = cast(tb.Frame, None)
         self.vworld_input_frame: tb.Frame = cast(tb.Frame, None)
         self.naver_input_frame: tb.Frame = cast(tb.Frame, None)
+        self.offline_input_frame: tb.Frame = cast(tb.Frame, None)
         self.progress_frame: tb.Frame = cast(tb.Frame, None)
         self.map_container: tb.Labelframe = cast(tb.Labelframe, None)
         self.map_label: tb.Label = cast(tb.Label, None)
@@ -130,15 +193,32 @@ class AddressMapApp:
         self._pin_size_btns: Dict[str, tb.Button] = {}
         self.list_container: tb.Labelframe = cast(tb.Labelframe, None)
         self._color_btns: Dict[str, tk.Button] = {}
-        self.scrollable_frame: ScrolledFrame = cast(ScrolledFrame, None)
+        self.color_bar: tb.Frame = cast(tb.Frame, None)
+        self.place_list: VirtualPlaceList = cast(VirtualPlaceList, None)
         self.log_text: tk.Text = cast(tk.Text, None)
         self.context_menu: tk.Menu = cast(tk.Menu, None)
         self.focus_widget: tk.Widget = cast(tk.Widget, None)
         self.tooltip = ToolTip(self.root)
+        # 라벨 방향 리모콘은 모든 장소가 공유하는 창 하나 (⚙️를 누른 장소에 연결)
+        self.dir_editor = DirectionEditor(self.root, on_change=self._on_label_dir_changed)
+        self.active_checkpoints: List[GeocodeCheckpoint] = []
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._apply_macos_shortcuts()
         self.setup_ui()
+        self.root.after(LOG_FLUSH_MS, self._flush_logs)
+        self.root.after(PROGRESS_POLL_MS, self._poll_progress)
         self._log_current_keys()
 
+    def _on_close(self):
+        """창을 닫을 때 진행 중인 지오코딩 작업의 체크포인트를 디스크에 기록합니다."""
+        for checkpoint in self.active_checkpoints:
+            try:
+                checkpoint.flush()
+            except Exception:
+                pass
+        self.log_sink.close()
+        self.root.destroy()
+
     def _log_current_keys(self):
         """현재 로드된 API 키의 앞뒤 일부를 로그에 출력하여 확인을 돕습니다."""
         def mask(s):
@@ -313,7 +393,7 @@ class AddressMapApp:
 
         # 서비스 선택
         tb.Label(api_frame, text="🗺️ 지도:", font=("Malgun Gothic", 9, "bold")).pack(side=tk.LEFT, padx=(0, 4))
-        provider_combo = tb.Combobox(api_frame, textvariable=self.map_provider, values=["vworld", "naver"], width=8, state="readonly")
+        provider_combo = tb.Combobox(api_frame, textvariable=self.map_provider, values=["vworld", "naver", "offline"], width=8, state="readonly")
         provider_combo.pack(side=tk.LEFT, padx=(0, 10))
         provider_combo.bind("<<ComboboxSelected>>", lambda e: self.on_provider_change()) # type: ignore
 
@@ -340,6 +420,13 @@ class AddressMapApp:
         n_sec_entry.pack(side=tk.LEFT, padx=(0, 4))
         tb.Button(self.naver_input_frame, text="📋", width=3, command=lambda: self._btn_paste(self.naver_sec_var), bootstyle="outline-secondary").pack(side=tk.LEFT, padx=(0, 8))
 
+        # 오프라인 지도 컨테이너 (MBTiles 파일 또는 타일 폴더)
+        self.offline_input_frame = tb.Frame(self.dynamic_input_container)
+        tb.Label(self.offline_input_frame, text="타일 경로:", font=("Malgun Gothic", 8)).pack(side=tk.LEFT, padx=(0, 2))
+        tb.Entry(self.offline_input_frame, textvariable=self.offline_path_var, width=32).pack(side=tk.LEFT, padx=(0, 4))
+        tb.Button(self.offline_input_frame, text="MBTiles", command=self._browse_offline_file, bootstyle="outline-secondary").pack(side=tk.LEFT, padx=(0, 4))
+        tb.Button(self.offline_input_frame, text="폴더", command=self._browse_offline_folder, bootstyle="outline-secondary").pack(side=tk.LEFT, padx=(0, 8))
+
         # 초기 가시성 설정
         self.update_api_field_visibility()
 
@@ -352,8 +439,13 @@ class AddressMapApp:
 
         tb.Button(control_frame, text="엑셀양식 다운로드", command=self.download_template, bootstyle=SECONDARY).pack(side=tk.LEFT, padx=6)
         tb.Button(control_frame, text="엑셀파일 등록하기", command=self.load_excel,         bootstyle=DARK).pack(side=tk.LEFT, padx=6)
+        tb.Button(control_frame, text="변경분 다시 불러오기", command=self.reload_changes,   bootstyle="outline-dark").pack(side=tk.LEFT, padx=6)
         tb.Button(control_frame, text="주소 전체보기",     command=self.reset_view_to_all,  bootstyle=SECONDARY).pack(side=tk.LEFT, padx=6)
         tb.Button(control_frame, text="PNG 저장",          command=self.save_final_image,   bootstyle=DANGER).pack(side=tk.LEFT, padx=6)
+        tb.Button(control_frame, text="좌표 포함 엑셀 저장", command=self.export_enriched_excel, bootstyle=SECONDARY).pack(side=tk.LEFT, padx=6)
+        tb.Button(control_frame, text="프로젝트 저장",     command=self.save_project_file,  bootstyle="outline-primary").pack(side=tk.LEFT, padx=6)
+        tb.Button(control_frame, text="프로젝트 열기",     command=self.open_project_file,  bootstyle="outline-primary").pack(side=tk.LEFT, padx=6)
+        tb.Button(control_frame, text="실패 주소 재시도",  command=self.purge_failed_cache, bootstyle="outline-secondary").pack(side=tk.LEFT, padx=6)
 
         # ── 하단 진행률 ───────────────────────────────────────────────────────
         self.progress_frame = tb.Frame(self.root, padding="5")
@@ -361,6 +453,8 @@ class AddressMapApp:
         tb.Progressbar(self.progress_frame, variable=self.progress_var,
                        maximum=100, length=300,
                        bootstyle=(SUCCESS, STRIPED)).pack(side=tk.RIGHT, padx=10)
+        tb.Label(self.progress_frame, textvariable=self.progress_text,
+                 font=("Malgun Gothic", 9), foreground="#555555").pack(side=tk.RIGHT, padx=10)
 
         # ── 메인 수평 분할 ────────────────────────────────────────────────────
         main_h_pane = ttk.Panedwindow(self.root, orient=tk.HORIZONTAL)
@@ -397,18 +491,12 @@ class AddressMapApp:
         right_v_pane.add(self.list_container, weight=4)
 
         # 타입 색상 설정 UI
-        color_bar = tb.Frame(self.list_container)
-        color_bar.pack(fill=tk.X, pady=(0, 4))
-        tb.Label(color_bar, text="타입 색상 (클릭→순환):",
+        self.color_bar = tb.Frame(self.list_container)
+        self.color_bar.pack(fill=tk.X, pady=(0, 4))
+        tb.Label(self.color_bar, text="타입 색상 (클릭→순환):",
                  font=("Malgun Gothic", 9, "bold")).pack(side=tk.LEFT, padx=(0, 6))
         self._color_btns = {}
-        for t in ["색상변경"]:
-            btn = tk.Button(color_bar, text=f" {t} ",
-                            command=lambda tp=t: self.cycle_type_color(tp), # type: ignore
-                            relief="raised", bd=2, padx=4, pady=2,
-                            font=("Malgun Gothic", 9, "bold"))
-            btn.pack(side=tk.LEFT, padx=3)
-            self._color_btns[t] = btn
+        self._add_color_button("색상변경")
         self._refresh_color_btn_styles()
 
         tb.Separator(self.list_container, orient="horizontal").pack(fill=tk.X, pady=6)
@@ -420,9 +508,13 @@ class AddressMapApp:
                        command=self.toggle_all_visibility,
                        bootstyle="dark-round-toggle").pack(anchor="w", pady=(0, 6))
 
-        # 스크롤 가능한 장소 목록
-        self.scrollable_frame = ScrolledFrame(self.list_container, autohide=True)
-        self.scrollable_frame.pack(expand=True, fill=tk.BOTH)
+        # 장소 목록 (보이는 행만 위젯을 만들어 재사용하는 가상화 목록)
+        self.place_list = VirtualPlaceList(
+            self.list_container, self.place_data,
+            on_toggle=lambda item: self.refresh_map(),
+            on_edit=self._toggle_dir_controls,
+            color_fn=lambda t: self.type_colors.get(t) or self.type_colors.get("색상변경", "#1A3A8F"))
+        self.place_list.pack(expand=True, fill=tk.BOTH)
 
         # ── 오른쪽 하단: 실행 로그 ────────────────────────────────────────────
         log_container = tb.Labelframe(right_v_pane, text=" 실행 로그 ", padding=5)
@@ -449,46 +541,8 @@ class AddressMapApp:
     # API 키
     # ─────────────────────────────────────────────────────────────────────────
     def load_api_keys(self) -> Dict[str, str]:
-        """
-        보안 강화를 위해 환경 변수(.env 파일 포함)와 config.json을 병합하여 읽어옵니다.
-        우선순위: 시스템 환경 변수 > .env 파일 > config.json
-        """
-        keys = {
-            "vworld_key": os.getenv("VWORLD_API_KEY", ""),
-            "naver_client_id": os.getenv("NAVER_CLIENT_ID", ""),
-            "naver_client_secret": os.getenv("NAVER_CLIENT_SECRET", "")
-        }
-
-        # .env 파일 파싱 (환경 변수가 비어있는 항목만 채움)
-        app_dir = get_app_dir()
-        env_path = os.path.join(app_dir, ".env")
-        if os.path.exists(env_path):
-            try:
-                with open(env_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if "=" in line and not line.startswith("#"):
-                            k, v = line.split("=", 1)
-                            k, v = k.strip(), v.strip()
-                            if k == "VWORLD_API_KEY" and not keys["vworld_key"]: keys["vworld_key"] = v
-                            elif k == "NAVER_CLIENT_ID" and not keys["naver_client_id"]: keys["naver_client_id"] = v
-                            elif k == "NAVER_CLIENT_SECRET" and not keys["naver_client_secret"]: keys["naver_client_secret"] = v
-            except: pass
-
-        # config.json 로드 (여전히 비어있는 항목만 채움)
-        cfg = os.path.join(app_dir, "config.json")
-        if os.path.exists(cfg):
-            try:
-                with open(cfg, "r") as f:
-                    data = json.load(f)
-                    if not keys["vworld_key"]: 
-                        keys["vworld_key"] = data.get("vworld_key") or data.get("api_key") or ""
-                    if not keys["naver_client_id"]: 
-                        keys["naver_client_id"] = data.get("naver_client_id", "")
-                    if not keys["naver_client_secret"]: 
-                        keys["naver_client_secret"] = data.get("naver_client_secret", "")
-            except: pass
-        
-        return keys
+        """환경 변수, .env, config.json 순으로 API 키를 읽어옵니다. (utils.app_config 참고)"""
+        return load_api_keys(get_app_dir())
 
     def save_api_keys(self):
         v_key = self.vworld_key_var.get().strip()
@@ -498,7 +552,8 @@ class AddressMapApp:
         self.api_keys = {
             "vworld_key": v_key,
             "naver_client_id": n_id,
-            "naver_client_secret": n_sec
+            "naver_client_secret": n_sec,
+            "offline_tiles": self.offline_path_var.get().strip()
         }
         
         # 엔진 업데이트
@@ -528,12 +583,29 @@ class AddressMapApp:
     def update_api_field_visibility(self):
         """선택된 프로바이더에 따라 API 입력 필드를 표시하거나 숨깁니다."""
         provider = self.map_provider.get()
-        if provider == "naver":
-            self.vworld_input_frame.pack_forget()
-            self.naver_input_frame.pack(side=tk.LEFT, padx=(0, 10))
-        else:
-            self.naver_input_frame.pack_forget()
-            self.vworld_input_frame.pack(side=tk.LEFT, padx=(0, 10))
+        frames = {"naver": self.naver_input_frame, "offline": self.offline_input_frame}
+        shown = frames.get(provider, self.vworld_input_frame)
+        for frame in (self.vworld_input_frame, self.naver_input_frame, self.offline_input_frame):
+            if frame is not shown:
+                frame.pack_forget()
+        shown.pack(side=tk.LEFT, padx=(0, 10))
+
+    def _browse_offline_file(self):
+        path = filedialog.askopenfilename(filetypes=[("MBTiles", "*.mbtiles"), ("All files", "*.*")])
+        if path:
+            self._set_offline_path(path)
+
+    def _browse_offline_folder(self):
+        path = filedialog.askdirectory(title="{z}/{x}/{y} 타일 폴더 선택")
+        if path:
+            self._set_offline_path(path)
+
+    def _set_offline_path(self, path: str):
+        self.offline_path_var.set(path)
+        self.api_keys["offline_tiles"] = path
+        self.add_log(f"오프라인 지도 타일: {path}")
+        if self.place_data and self.map_provider.get() == "offline":
+            self.refresh_map()
 
     def show_api_help(self):
         help_win = tk.Toplevel(self.root)
@@ -571,8 +643,34 @@ class AddressMapApp:
         self.type_color_idx[type_key] = next_idx
         self.type_colors[type_key] = PRESET_PALETTES[next_idx]
         self._refresh_color_btn_styles()
+        self.place_list.refresh()
         self.render_current_view()
 
+    def _add_color_button(self, type_key):
+        btn = tk.Button(self.color_bar, text=f" {type_key} ",
+                        command=lambda tp=type_key: self.cycle_type_color(tp), # type: ignore
+                        relief="raised", bd=2, padx=4, pady=2,
+                        font=("Malgun Gothic", 9, "bold"))
+        btn.pack(side=tk.LEFT, padx=3)
+        self._color_btns[type_key] = btn
+
+    def _register_groups(self, groups):
+        """
+        시트별 그룹(타입)에 아직 색상이 없으면 다른 그룹과 겹치지 않는 팔레트 색을 배정하고,
+        기본 타입(A) 외의 그룹마다 색상 순환 버튼을 추가합니다.
+        """
+        groups = list(dict.fromkeys(groups))
+        for group in groups:
+            if group not in self.type_colors:
+                used = {self.type_color_idx.get(g) for g in [*self._color_btns, *groups] if g != "색상변경"}
+                free = [i for i in range(len(PRESET_PALETTES)) if i not in used]
+                idx = free[0] if free else groups.index(group) % len(PRESET_PALETTES)
+                self.type_color_idx[group] = idx
+                self.type_colors[group] = PRESET_PALETTES[idx]
+            if group != "A" and group not in self._color_btns and self.color_bar:
+                self._add_color_button(group)
+        self._refresh_color_btn_styles()
+
     def _refresh_color_btn_styles(self):
         """타입 색상 버튼의 배경색을 현재 선택 색상으로 업데이트"""
         for t, btn in self._color_btns.items():
@@ -599,17 +697,30 @@ class AddressMapApp:
     # 로그
     # ─────────────────────────────────────────────────────────────────────────
     def add_log(self, message: str, level: str = "info"):
-        """로그를 출력창에 추가합니다. (스레드 안전)"""
-        def _append():
-            log_box = self.log_text
-            if log_box:
-                log_box.config(state=tk.NORMAL)
-                timestamp = pd.Timestamp.now().strftime('%H:%M:%S')
-                prefix = "[INFO]" if level == "info" else "[ERROR]"
-                log_box.insert(tk.END, f"[{timestamp}] {prefix} {message}\n")
-                log_box.see(tk.END)
-                log_box.config(state=tk.DISABLED)
-        self.root.after(0, _append)
+        """로그를 버퍼에 추가합니다. (스레드 안전, 로그 창에는 _flush_logs가 주기적으로 반영)"""
+        self.log_sink.emit(message, level)
+
+    def _poll_progress(self):
+        """진행 상태를 읽어 진행 막대와 상태 표시줄을 한 번에 갱신합니다."""
+        snap = self.progress.snapshot()
+        if snap:
+            self.progress_var.set(snap["percent"])
+            self.progress_text.set(format_progress(snap))
+        self.root.after(PROGRESS_POLL_MS, self._poll_progress)
+
+    def _flush_logs(self):
+        """쌓인 로그를 한 번의 insert로 로그 창에 붙이고, 오래된 줄은 잘라냅니다."""
+        lines = self.log_sink.drain()
+        log_box = self.log_text
+        if lines and log_box:
+            log_box.config(state=tk.NORMAL)
+            log_box.insert(tk.END, "\n".join(line for line, _ in lines) + "\n")
+            line_count = int(log_box.index("end-1c").split(".")[0])
+            if line_count > LOG_WIDGET_MAX_LINES:
+                log_box.delete("1.0", f"{line_count - LOG_WIDGET_MAX_LINES}.0")
+            log_box.see(tk.END)
+            log_box.config(state=tk.DISABLED)
+        self.root.after(LOG_FLUSH_MS, self._flush_logs)
 
     # ─────────────────────────────────────────────────────────────────────────
     # 엑셀 양식 다운로드
@@ -653,17 +764,109 @@ class AddressMapApp:
         """주소 변환 엔진을 호출합니다."""
         return self.geo_engine.geocode(address)
 
+    def purge_failed_cache(self):
+        """실패 캐시를 비워 다음 로드 때 찾지 못했던 주소를 다시 조회하도록 합니다."""
+        count = self.geo_engine.cache.failure_count()
+        if not count:
+            messagebox.showinfo("알림", "저장된 실패 주소가 없습니다.")
+            return
+        if not messagebox.askyesno("실패 주소 재시도", f"찾지 못한 주소 {count}건의 실패 기록을 삭제할까요?\n다음 엑셀 등록 시 다시 조회합니다."):
+            return
+        removed = self.geo_engine.cache.purge_failures()
+        self.add_log(f"실패 캐시 {removed}건 삭제 완료")
+
     # ─────────────────────────────────────────────────────────────────────────
     # 엑셀 로드
     # ─────────────────────────────────────────────────────────────────────────
     def load_excel(self):
         """엑셀 로딩 프로세스를 별도의 백그라운드 스레드에서 실행합니다."""
+        provider = self._sync_api_keys()
+        if not provider:
+            return
+        file_path = filedialog.askopenfilename(filetypes=FILE_DIALOG_TYPES)
+        if not file_path:
+            return
+
+        # 시트가 여러 개인 통합 문서는 불러올 시트와 시트별 그룹을 선택
+        try:
+            sheets = list_sheets(file_path)
+        except Exception as e:
+            messagebox.showerror("오류", f"파일 읽기 실패: {e}")
+            return
+        if len(sheets) > 1:
+            chosen = ask_sheets(self.root, sheets)
+            if not chosen:
+                return
+        else:
+            chosen = [(None, "A")]
+
+        # 같은 파일(시트)의 중단된 작업이 있으면 이어서 진행할지 한 번에 확인
+        # 파일 해시는 한 번만 계산하여 모든 시트의 체크포인트가 공유
+        checkpoint_dir = os.path.join(get_app_dir(), CHECKPOINT_DIR)
+        try:
+            digest = file_digest(file_path)
+        except OSError as e:
+            messagebox.showerror("오류", f"파일 읽기 실패: {e}")
+            return
+        jobs = []
+        for sheet, group in chosen:
+            checkpoint = GeocodeCheckpoint(checkpoint_dir, file_path, provider,
+                                           flush_every=CHECKPOINT_INTERVAL, sheet=sheet, digest=digest)
+            jobs.append(SheetJob(sheet, group, checkpoint, checkpoint.load()))
+        resumable = sum(len(job.resumed) for job in jobs)
+        if resumable:
+            if not messagebox.askyesno("이어서 진행",
+                                       f"이 파일의 이전 작업이 {resumable}행에서 중단되었습니다.\n"
+                                       "마지막 체크포인트부터 이어서 진행할까요?\n(아니오: 처음부터 다시 시작)"):
+                for job in jobs:
+                    job.resumed = {}
+
+        # 백그라운드 처리 스레드 시작 (이전 로드의 지도 생성 단계가 새 단계를 끝내지 않도록 해제)
+        self._map_phase_pending = False
+        thread = threading.Thread(target=self._process_excel_thread, args=(file_path, jobs), daemon=True)
+        thread.start()
+
+    def reload_changes(self):
+        """
+        수정된 엑셀을 현재 세션과 비교하여 새로 생기거나 바뀐 행만 지오코딩합니다.
+        정규화 주소 + 장소명 해시가 같은 행은 기존 장소(라벨 방향, 표시 여부 포함)를 그대로 유지하고,
+        엑셀에서 사라진 행의 장소는 목록과 지도에서 제거합니다.
+        """
+        if not self.place_data:
+            messagebox.showwarning("알림", "먼저 엑셀 파일을 등록해 주세요.")
+            return
+        provider = self._sync_api_keys()
+        if not provider:
+            return
+        initial = self.loaded_path if self.loaded_path else ""
+        file_path = filedialog.askopenfilename(filetypes=FILE_DIALOG_TYPES,
+                                               initialdir=os.path.dirname(initial) or None,
+                                               initialfile=os.path.basename(initial) or None)
+        if not file_path:
+            return
+
+        # 현재 장소를 시트별·행 식별자별로 묶음 (같은 주소·이름이 여러 행이면 개수만큼 매칭)
+        # 지난번에 불러온 시트를 같은 그룹으로 다시 비교하며, 그 밖의 시트에 있던 장소는 제거됨
+        sheets = self.loaded_sheets or [(None, "A")]
+        sessions: Dict[Optional[str], Dict[str, deque]] = {sheet: {} for sheet, _ in sheets}
+        for item in self.place_data:
+            if item.get("key") and item.get("sheet") in sessions:
+                sessions[item.get("sheet")].setdefault(item["key"], deque()).append(item)
+        jobs = [SheetJob(sheet, group, session=sessions[sheet]) for sheet, group in sheets]
+        self._map_phase_pending = False
+        thread = threading.Thread(target=self._process_excel_thread, args=(file_path, jobs, True), daemon=True)
+        thread.start()
+
+    def _sync_api_keys(self) -> Optional[str]:
+        """입력란의 API 키를 엔진에 반영하고, 선택된 제공자의 키가 있으면 제공자 이름을 반환합니다."""
         # UI 입력값을 최신으로 동기화 (저장 버튼 누르지 않았을 때 대비)
         v_key = self.vworld_key_var.get().strip()
         n_id  = self.naver_id_var.get().strip()
         n_sec = self.naver_sec_var.get().strip()
         
-        self.api_keys = {"vworld_key": v_key, "naver_client_id": n_id, "naver_client_secret": n_sec}
+        offline = self.offline_path_var.get().strip()
+        self.api_keys = {"vworld_key": v_key, "naver_client_id": n_id, "naver_client_secret": n_sec,
+                         "offline_tiles": offline}
         self.geo_engine.vworld_key = v_key
         self.geo_engine.naver_client_id = n_id
         self.geo_engine.naver_client_secret = n_sec
@@ -673,316 +876,509 @@ class AddressMapApp:
         has_key = False
         if provider == "vworld":
             if v_key: has_key = True
+        elif provider == "offline":
+            if not os.path.exists(offline):
+                messagebox.showerror("오류", "오프라인 지도 타일 경로(MBTiles 파일 또는 타일 폴더)가 필요합니다.")
+                return None
+            if self.geo_engine.local_index is None:
+                self.add_log("오프라인 주소 색인이 없어 좌표 컬럼이 있는 행과 이전에 찾은 주소만 표시됩니다.", "error")
+            has_key = True
         else: # naver
             if n_id and n_sec: has_key = True
         
         if not has_key:
             messagebox.showerror("오류", f"{provider.capitalize()} API 키 정보가 필요합니다.")
-            return
-        file_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls")])
-        if not file_path:
-            return
-
-        # 백그라운드 처리 스레드 시작
-        thread = threading.Thread(target=self._process_excel_thread, args=(file_path,), daemon=True)
-        thread.start()
+            return None
+        return provider
 
-    def _process_excel_thread(self, file_path: str):
+    def _process_excel_thread(self, file_path: str, jobs: List[SheetJob], incremental: bool = False):
         """
         엑셀 파싱 및 지오코딩을 위한 백그라운드 워커입니다.
         무거운 I/O 및 CPU 작업을 분리하여 UI 응답성을 유지합니다.
+        시트가 여러 개면 시트마다 스레드를 두고 동시에 전처리·지오코딩하며, 캐시와 QPS 제한은 엔진 하나를 공유합니다.
+        incremental=True(변경분 모드)이면 기존 목록을 지우지 않고 각 시트의 session에 없는 행만 조회한 뒤
+        _apply_reload_changes로 추가/삭제를 반영합니다.
         """
-        self.add_log(f"파일 로드 중: {os.path.basename(file_path)}")
+        kept: List[Tuple[Dict[str, Any], int]] = []
+        if incremental and any(job.sheet is not None for job in jobs):
+            # 새 파일에서 사라진 시트는 비교하지 않음 (그 시트의 장소는 _apply_reload_changes에서 제거)
+            try:
+                available = set(list_sheets(file_path))
+            except Exception:
+                available = set()
+            missing = [job.sheet for job in jobs if job.sheet is not None and job.sheet not in available]
+            if missing:
+                self.add_log(f"새 파일에 없는 시트의 장소는 제거합니다: {', '.join(missing)}")
+            jobs = [job for job in jobs if job.sheet is None or job.sheet in available]
+            if not jobs:
+                self.root.after(0, lambda: messagebox.showerror("오류", "불러왔던 시트가 새 파일에 없습니다."))
+                return
+        multi = len(jobs) > 1
+        sheet_note = f" (시트 {len(jobs)}개: {', '.join(str(job.sheet) for job in jobs)})" if multi else ""
+        self.add_log(f"{'변경분 비교' if incremental else '파일 로드'} 중: {os.path.basename(file_path)}{sheet_note}")
         self.add_log("1단계: 지오코딩(주소 변환) 시작...")
 
-        success_idx: int = 0
-        fail_idx: int = 0
+        streams: List[SheetStream] = []
         try:
             try:
-                df = pd.read_excel(file_path)
+                for job in jobs:
+                    streams.append(open_sheet(file_path, job.sheet))
             except ImportError as ie:
-                self.add_log("Excel 엔진(openpyxl)이 누락되었습니다. 빌드 옵션을 확인해 주세요.", "error")
-                self.root.after(0, lambda: messagebox.showerror("오류", "Excel 엔진이 누락되었습니다. 빌드 시 openpyxl을 포함해야 합니다."))
+                for stream in streams:
+                    stream.close()
+                msg = str(ie)
+                self.add_log(f"파일 읽기 엔진이 누락되었습니다: {msg}", "error")
+                self.root.after(0, lambda m=msg: messagebox.showerror("오류", f"파일 읽기 엔진이 누락되었습니다.\n{m}"))
                 return
-            df.columns = [str(c).strip() for c in df.columns]
 
-            if '주소' not in df.columns:
-                self.root.after(0, lambda: messagebox.showerror("오류", "'주소' 컬럼을 찾을 수 없습니다."))
-                return
-
-            total_rows = len(df)
-            temp_place_data = []
-
-            # 메인 스레드에서 기존 UI 목록 초기화
-            self.root.after(0, self._clear_ui_on_load)
-
-            for i, row in df.iterrows():
-                # 프로그레스 바 업데이트
-                self.progress_var.set((i + 1) / total_rows * 50)
-
-                addr_raw = row.get('주소')
-                if pd.isna(addr_raw): continue # type: ignore
-                addr = str(addr_raw).strip()
-                if not addr or addr.lower() == "nan": continue
-
-                type_val  = 'A'
-
-                order_raw = row.get('순서', None)
-                try:
-                    order_val = int(float(order_raw)) if order_raw is not None and not pd.isna(order_raw) else i
-                except: # type: ignore
-                    order_val = i
-
-                lon, lat, road_addr_from_geo = self.geocode(addr)
-
-                if lon and lat:
-                    success_idx = int(success_idx) + 1 # type: ignore
-                    # Use geocoded road_addr if available, otherwise original address
-                    road_addr = road_addr_from_geo if road_addr_from_geo else addr
-                    
-                    # Use '장소명' from excel if available, otherwise original address
-                    name_raw  = row.get('장소명')
-                    name      = str(name_raw).strip() if not pd.isna(name_raw) and str(name_raw).strip() else addr # type: ignore
-                    
-                    item_data = {
-                        "lon": lon, "lat": lat, "name": name, "addr": road_addr,
-                        "type": type_val, "order": order_val, "label_dir": "top",
-                        "visible": True, "success_idx": success_idx
-                    }
-                    self.root.after(0, lambda d=item_data: self._add_place_to_ui(d))
-                    self.add_log(f"✓ {name} [{type_val}]")
-                else:
-                    fail_idx = int(fail_idx) + 1 # type: ignore
-                    self.add_log(f"✗ 실패: {addr}", "error")
+            for job, stream in zip(jobs, streams):
+                if '주소' not in stream.columns:
+                    for s in streams:
+                        s.close()
+                    where = f"'{job.sheet}' 시트에서 " if job.sheet else ""
+                    self.root.after(0, lambda: messagebox.showerror("오류", f"{where}'주소' 컬럼을 찾을 수 없습니다."))
+                    return
 
-            self.add_log(f"1단계 완료: {success_idx}개 성공, {fail_idx}개 실패")
-            self.root.after(0, lambda: self._finalize_loading_ui())
+            self.progress.start_phase("지오코딩", sum(stream.total_hint for stream in streams), span=(0, 50))
+
+            # 메인 스레드에서 기존 UI 목록 초기화 (변경분 모드는 기존 목록 유지)
+            if not incremental:
+                self.root.after(0, self._clear_ui_on_load)
+            groups = [job.group for job in jobs]
+            self.root.after(0, lambda: self._register_groups(groups))
+            self.root.after(0, lambda: self._begin_live_map(keep_view=incremental))
+
+            calls_before = self.geo_engine.api_calls
+            self.loaded_path = file_path
+            self.loaded_sheets = [(job.sheet, job.group) for job in jobs]
+            self.row_results = {job.sheet: {} for job in jobs}
+            self.active_checkpoints = [job.checkpoint for job in jobs if job.checkpoint]
+
+            # 시트가 여러 개면 시트별 워커 수를 나눠 전체 동시 요청 수는 한 시트일 때와 비슷하게 유지
+            workers = max(2, GEOCODE_WORKERS // len(jobs))
+            if multi:
+                with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="sheet") as pool:
+                    futures = [pool.submit(self._geocode_sheet, job, stream, kept, workers, calls_before,
+                                           f"[{job.sheet}] ") for job, stream in zip(jobs, streams)]
+                    summaries = [f.result() for f in futures]
+            else:
+                summaries = [self._geocode_sheet(jobs[0], streams[0], kept, workers, calls_before, "")]
+
+            self.progress.finish_phase()
+            total = {key: sum(sm[key] for sm in summaries) for key in
+                     ("success", "fail", "known_fail", "local", "given", "job_rows", "unique", "order_fallbacks")}
+            if multi:
+                for job, sm in zip(jobs, summaries):
+                    self.add_log(f"  · [{job.sheet}] → 그룹 '{job.group}': {sm['success']}개 성공, {sm['fail']}개 실패")
+            self.add_log(f"1단계 완료: {total['success']}개 성공, {total['fail']}개 실패, 이전 실패 {total['known_fail']}개")
+            if total["known_fail"]:
+                self.add_log("이전에 찾지 못한 주소는 재조회하지 않았습니다. [실패 주소 재시도]로 실패 캐시를 비울 수 있습니다.")
+            if total["local"]:
+                self.add_log(f"오프라인 색인으로 {total['local']}건 변환 (API 호출 없음)")
+            if total["given"]:
+                self.add_log(f"엑셀 좌표 사용: {total['given']}건")
+            for job, sm in zip(jobs, summaries):
+                if sm["rejected"]:
+                    self.add_log(f"{sm['prefix']}제외된 행 총 {len(sm['rejected'])}개 (사유는 위 로그 참고)", "error")
+            if total["order_fallbacks"]:
+                self.add_log(f"'순서' 값이 숫자가 아닌 {total['order_fallbacks']}행은 행 순서를 사용했습니다.")
+            if total["job_rows"] > total["unique"]:
+                self.add_log(f"중복 주소 통합: {total['job_rows']}행 → 고유 주소 {total['unique']}건만 조회")
+            counts = self.geo_engine.request_counts
+            if counts:
+                self.add_log(f"API 호출: 총 {self.geo_engine.api_calls - calls_before}회 (주소당 최대 {max(counts.values())}회)")
+            cs = self.geo_engine.cache.stats()
+            self.add_log(f"캐시: 적중 {cs['hits']}건 / 미스 {cs['misses']}건 (적중률 {cs['hit_rate']:.0%}, 저장 {cs['entries']}건)")
+            for job in jobs:
+                if job.checkpoint:
+                    job.checkpoint.finish()
+            self.active_checkpoints = []
+            if incremental:
+                self.root.after(0, lambda: self._apply_reload_changes(kept, total["success"]))
+            else:
+                self.root.after(0, lambda: self._finalize_loading_ui())
 
         except Exception as e:
+            self.progress.finish_phase()
+            for stream in streams:
+                stream.close()
+            for job in jobs:
+                if job.checkpoint:
+                    job.checkpoint.flush()
+            self._live_map = False
             self.add_log(f"엑셀 추출 오류: {e}")
-            self.root.after(0, lambda: messagebox.showerror("오류", f"파일 읽기 실패: {e}"))
+            self.root.after(0, lambda msg=str(e): messagebox.showerror("오류", f"파일 읽기 실패: {msg}"))
+
+    def _geocode_sheet(self, job: SheetJob, stream: SheetStream, kept: List[Tuple[Dict[str, Any], int]],
+                       max_workers: int, calls_before: int, prefix: str) -> Dict[str, Any]:
+        """
+        시트 하나를 청크 단위로 정제하고 지오코딩하여 찾은 장소를 목록 대기열에 넣습니다. (워커 스레드에서 실행)
+        checkpoint가 있으면 완료된 행을 주기적으로 기록하고, resumed에 있는 행은 다시 조회하지 않습니다.
+        반환값: 이 시트의 집계 (성공/실패 수, 제외된 행 등)
+        """
+        checkpoint, resumed, session = job.checkpoint, job.resumed, job.session
+        known = {key: len(items) for key, items in session.items()} if session is not None else None
+        summary: Dict[str, Any] = {"prefix": prefix, "success": 0, "fail": 0, "known_fail": 0, "local": 0,
+                                   "given": 0, "job_rows": 0, "order_fallbacks": 0}
+        batch_stats: Dict[str, int] = {"rows": 0, "unique": 0}
+
+        # 이미 좌표 컬럼(경도/위도 등)이 있는 파일은 해당 행의 지오코딩을 생략
+        coord_cols = find_coordinate_columns(stream.columns)
+        if coord_cols:
+            self.add_log(f"{prefix}좌표 컬럼 {coord_cols}이 있는 행은 좌표를 그대로 사용합니다. (API 호출 없음)")
+
+        if checkpoint:
+            checkpoint.start(max(stream.total_hint, 1), resume=bool(resumed))
+        if resumed:
+            self.add_log(f"{prefix}체크포인트에서 {len(resumed)}행을 복원하고 나머지만 조회합니다.")
+
+        # 행을 청크 단위로 정제(열 연산)하여, 조회할 고유 주소 목록과 행 매핑을 만든 뒤 지오코딩
+        rejected: List[Tuple[int, str]] = []
+        chunks: deque = deque()   # [전처리 청크, 결과 목록, 다음에 내보낼 행 위치]
+
+        def job_keys():
+            for chunk in prepare_stream(stream, stream.columns, PREPROCESS_CHUNK_ROWS, resumed, known):
+                rejected.extend(chunk.rejected)
+                # 제외된 행은 그 청크의 조회를 시작하기 전에 바로 알림
+                if chunk.rejected:
+                    self.add_log(f"{prefix}제외된 행 {len(chunk.rejected)}개:", "error")
+                    for line in summarize_rejections(chunk.rejected):
+                        self.add_log(f"  · {line}", "error")
+                summary["job_rows"] += sum(1 for k in chunk.row_keys if k >= 0)
+                summary["order_fallbacks"] += chunk.order_fallbacks
+                chunks.append([chunk, [], 0])
+                yield from chunk.keys
+
+        def drain():
+            # 앞 청크부터 결과가 준비된 행까지 행 순서대로 내보냄
+            while chunks:
+                entry = chunks[0]
+                chunk, results, pos = entry
+                while pos < len(chunk.rows):
+                    k = chunk.row_keys[pos]
+                    if k >= len(results):
+                        entry[2] = pos
+                        return
+                    row_i, row, addr, name, order_val, given = chunk.rows[pos]
+                    identity = chunk.identities[pos]
+                    if k >= 0:
+                        result, status = results[k]
+                        if checkpoint:
+                            checkpoint.record(row_i, result, status)
+                    elif row_i in resumed:
+                        # 체크포인트에서 복원한 행
+                        result, status = resumed[row_i]
+                    elif given is not None:
+                        result, status = given, "given"
+                    else:
+                        # 변경분 모드: 세션에 이미 있는 행
+                        item = session[identity].popleft() # type: ignore
+                        result, status = (item["lon"], item["lat"], item["addr"]), "kept"
+                        kept.append((item, order_val))
+                    yield (row_i, row, addr, name, order_val, identity), result, status
+                    pos += 1
+                chunks.popleft()
+
+        def iter_results():
+            for _, result, status in self.geo_engine.geocode_batch(job_keys(), max_workers=max_workers,
+                                                                   stats=batch_stats):
+                # 결과는 고유 주소 목록 순서대로 오므로 아직 채워지지 않은 첫 청크에 붙임
+                for chunk, results, _ in chunks:
+                    if len(results) < len(chunk.keys):
+                        results.append((result, status))
+                        break
+                yield from drain()
+            yield from drain()
+
+        type_val = job.group
+        # 장소 번호는 시트별로 매김 (변경분 모드에서 새 장소 번호는 그 시트의 기존 번호 다음부터)
+        next_idx = max((p.get("success_idx", 0) for p in self.place_data if p.get("sheet") == job.sheet),
+                       default=0) if session is not None else 0
+        row_results = self.row_results[job.sheet]
+        for (row_i, row, addr, name, order_val, identity), (lon, lat, road_addr_from_geo), status in iter_results():
+            row_results[row_i] = (lon, lat, road_addr_from_geo, status)
+            # 진행률 이벤트만 기록 (UI 갱신은 _poll_progress가 모아서 수행)
+            from_cache = None if row_i in resumed else CACHE_HIT_STATUS.get(status)
+            self.progress.advance(hit=from_cache)
+            self.progress.set_api_calls(self.geo_engine.api_calls - calls_before)
+
+            if status == "kept":
+                continue
+            if lon and lat:
+                summary["success"] += 1
+                # Use geocoded road_addr if available, otherwise original address
+                road_addr = road_addr_from_geo if road_addr_from_geo else addr
+
+                item_data = {
+                    "lon": lon, "lat": lat, "name": name, "addr": road_addr,
+                    "type": type_val, "order": order_val, "label_dir": "top",
+                    "visible": True, "success_idx": next_idx + summary["success"], "key": identity,
+                    "sheet": job.sheet
+                }
+                self._queue_place(item_data)
+                self.add_log(f"✓ {name} [{type_val}]")
+                if status == "local":
+                    summary["local"] += 1
+                elif status == "given":
+                    summary["given"] += 1
+            elif status == "negative":
+                # 이전에 찾지 못한 주소: API를 다시 호출하지 않고 별도 집계
+                summary["known_fail"] += 1
+                self.add_log(f"✗ 실패(캐시): {prefix}{addr}", "error")
+            else:
+                summary["fail"] += 1
+                self.add_log(f"✗ 실패: {prefix}{addr}", "error")
+
+        summary["rejected"] = rejected
+        summary["unique"] = batch_stats["unique"]
+        return summary
+
+    def export_enriched_excel(self):
+        """불러온 엑셀에 경도/위도/정제주소/상태 컬럼을 붙여 저장합니다. (다시 불러오면 지오코딩 없이 로드)"""
+        if not self.loaded_path or not self.row_results:
+            messagebox.showwarning("알림", "먼저 엑셀 파일을 등록해 주세요.")
+            return
+        base = os.path.splitext(os.path.basename(self.loaded_path))[0]
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx")],
+            initialfile=f"{base}_좌표포함.xlsx")
+        if not file_path:
+            return
+        try:
+            # 원본은 로드 시 스트리밍으로만 읽었으므로 저장할 때 다시 읽음 (여러 시트면 시트별로 저장)
+            with pd.ExcelWriter(file_path) as writer:
+                for sheet, results in self.row_results.items():
+                    out = read_table(self.loaded_path, sheet)
+                    lon_col, lat_col, refined_col, status_col = RESULT_COLUMNS
+                    coord_cols = find_coordinate_columns(out.columns)
+                    if coord_cols:
+                        # 기존 좌표 컬럼 이름이 다르면(lat/lon 등) 그 컬럼을 갱신
+                        lon_col, lat_col = coord_cols
+                    out[lon_col] = [results.get(int(i), (None,))[0] for i in out.index]
+                    out[lat_col] = [results.get(int(i), (None, None))[1] for i in out.index]
+                    out[refined_col] = [results.get(int(i), (None, None, None))[2] for i in out.index]
+                    out[status_col] = [results.get(int(i), (None, None, None, ""))[3] for i in out.index]
+                    out.to_excel(writer, sheet_name=str(sheet) if sheet is not None else "Sheet1", index=False)
+            self.add_log(f"좌표 포함 엑셀 저장 완료: {file_path}")
+            messagebox.showinfo("저장 완료", "좌표가 포함된 엑셀이 저장되었습니다.\n이 파일을 다시 등록하면 API 호출 없이 바로 표시됩니다.")
+        except Exception as e:
+            messagebox.showerror("저장 오류", f"엑셀 저장 실패: {e}")
 
     def _clear_ui_on_load(self):
         """새 데이터를 불러오기 전에 UI 리스트와 마커 배열을 비웁니다."""
         self.marker_positions = []
         self.place_data = []
-        if self.scrollable_frame and hasattr(self.scrollable_frame, 'winfo_children'):
-            for child in self.scrollable_frame.winfo_children():
-                child.destroy()
+        with self._pending_lock:
+            self._pending_places = []
+        self.dir_editor.hide()
+        if self.place_list:
+            self.place_list.set_items(self.place_data)
+
+    def _queue_place(self, item_data):
+        """
+        워커 스레드에서 찾은 장소를 대기열에 넣습니다.
+        행마다 메인 스레드로 넘기지 않고, 예약된 한 번의 flush에서 모아서 목록에 추가합니다.
+        """
+        with self._pending_lock:
+            self._pending_places.append(item_data)
+            if self._place_flush_scheduled:
+                return
+            self._place_flush_scheduled = True
+        self.root.after(50, self._flush_pending_places)
+
+    def _flush_pending_places(self):
+        with self._pending_lock:
+            batch, self._pending_places = self._pending_places, []
+            self._place_flush_scheduled = False
+        for item_data in batch:
+            self._add_place_to_ui(item_data)
+        if batch and self._live_map:
+            self._schedule_live_map()
 
     def _add_place_to_ui(self, item_data):
         """
-        사이드바 목록에 장소 아이템을 동적으로 추가합니다.
-        스레드 안전을 위해 self.root.after를 통해 호출되어야 합니다.
+        장소를 데이터 모델에 추가합니다. 목록 위젯은 보이는 행만 다시 그립니다.
+        스레드 안전을 위해 메인 스레드에서 호출되어야 합니다.
         """
-        var     = tk.BooleanVar(value=True)
-        dir_var = tk.StringVar(value="⬆ 위")
-        item_data["var"] = var
-        item_data["dir_var"] = dir_var
-        
-        # 메인 데이터 리스트에 추가 (thread-safe UI 업데이트 시점에 수행)
+        item_data.setdefault("visible", True)
+        item_data.setdefault("label_dir", "top")
         self.place_data.append(item_data)
-        
-        success_count = item_data["success_idx"]
-        name = item_data["name"]
-        type_val = item_data["type"]
-        
-        item_container = tb.Frame(self.scrollable_frame)
-        item_container.pack(fill=tk.X, padx=4, pady=2)
+        if self.place_list:
+            self.place_list.refresh()
 
-        top_row = tb.Frame(item_container)
-        top_row.pack(fill=tk.X)
-
-        type_color = self.type_colors.get(type_val) or self.type_colors.get("색상변경", "#1A3A8F")
-        tk.Label(top_row, text="  ", bg=type_color, width=1, relief="flat").pack(side=tk.LEFT, padx=(0, 4), pady=3)
-
-        cb = tb.Checkbutton(top_row, text=f"{success_count}. {name}",
-                            variable=var, command=self.refresh_map,
-                            bootstyle="secondary-round-toggle")
-        cb.pack(side=tk.LEFT, fill=tk.X, expand=True)
+    def _begin_live_map(self, keep_view: bool = False):
+        """
+        로딩 중 지도 갱신을 켭니다. keep_view가 False면 첫 갱신에서 새 데이터에 맞춰 뷰를 잡고,
+        True(변경분 다시 불러오기)면 기존 뷰를 유지하다가 새 점이 화면을 벗어날 때만 다시 맞춥니다.
+        """
+        self._live_map = True
+        self._live_map_fitted = keep_view and self.raw_map_img is not None
 
-        summary_lbl = tb.Label(top_row, text="↑", font=("Malgun Gothic", 10, "bold"), foreground="#1A3A8F")
-        summary_lbl.pack(side=tk.LEFT, padx=5)
-        item_data["summary_lbl"] = summary_lbl
+    def _schedule_live_map(self):
+        if self._live_map_scheduled:
+            return
+        self._live_map_scheduled = True
+        self.root.after(LIVE_MAP_INTERVAL_MS, self._live_map_update)
 
-        toggle_btn = tb.Button(top_row, text="⚙️", width=3, bootstyle="link-secondary",
-                               command=lambda it=item_data: self._toggle_dir_controls(it)) # type: ignore
-        toggle_btn.pack(side=tk.LEFT, padx=2)
+    def _live_map_update(self):
+        """지금까지 찾은 핀을 지도에 그립니다. 화면 밖 점이 생겼을 때만 뷰를 넓힙니다."""
+        self._live_map_scheduled = False
+        if not self._live_map:
+            return
+        visible = [(p["lon"], p["lat"]) for p in self.place_data if p.get("visible", True)]
+        if not visible:
+            return
+        if (self._live_map_fitted and self.raw_map_img is not None and
+                coords_in_view(visible, self.current_center, self.current_zoom, 800, 800, margin=LIVE_MAP_EDGE_PX)):
+            self.render_current_view()
+            return
+        self._live_map_fitted = True
+        self._fit_view_to_places(visible)
 
-        dir_btn_frame = tk.Frame(item_container, bg="#f8f9fa", bd=1, relief="solid")
-        item_data["dir_btn_frame"] = dir_btn_frame
-        
-        dir_btns = {}
-        DIR_GRID = [
-            (0, 0, "↖", "top-left"),    (0, 1, "↑", "top"),    (0, 2, "↗", "top-right"),
-            (1, 0, "←", "left"),                                  (1, 2, "→", "right"),
-            (2, 0, "↙", "bottom-left"), (2, 1, "↓", "bottom"), (2, 2, "↘", "bottom-right"),
-        ]
-        
-        inner_grid = tk.Frame(dir_btn_frame, bg="#f8f9fa")
-        inner_grid.pack(padx=5, pady=2)
-
-        for gr, gc, sym, dirval in DIR_GRID:
-            btn = tk.Button(inner_grid, text=sym, width=2, font=("Malgun Gothic", 9),
-                            relief="flat", bd=0, bg="#f8f9fa",
-                            command=lambda it=item_data, dv=dirval, br=dir_btns: self._set_label_dir(it, dv, br)) # type: ignore
-            btn.grid(row=gr, column=gc, padx=2, pady=2)
-            dir_btns[dirval] = btn
-        
-        item_data["dir_btns"] = dir_btns
-        self._refresh_dir_btns(item_data)
+    def _fit_view_to_places(self, visible: List[Tuple[float, float]]) -> bool:
+        """
+        점들이 중앙에 모두 들어오도록 뷰를 맞춥니다.
+        마지막으로 받은 베이스 지도를 확대·이동해서 새 뷰를 채울 수 있으면 지도를 다시 받지 않습니다. (받았으면 True)
+        """
+        clat, clon, czoom = calculate_zoom_and_center(visible, 800, 800, padding=0.15) # type: ignore
+        self.current_center = (float(clat), float(clon))
+        self.current_zoom   = float(czoom)
+        if self.raw_map_img is not None and base_map_covers_view(
+                self.last_api_center, self.last_api_zoom, self.current_center, self.current_zoom, 800, 800):
+            self.render_current_view()
+            return False
+        self.refresh_map()
+        return True
 
     def _finalize_loading_ui(self):
-        """Triggers the final viewport adjustment and cleanup."""
-        self.progress_var.set(50)
+        """로딩이 끝나면 한 번만 최종 뷰를 맞춥니다. (로딩 중 받은 지도로 충분하면 재요청하지 않음)"""
+        self._flush_pending_places()
+        self._live_map = False
+        self._sort_places_by_sheet()
+        self.progress.start_phase("지도 생성", 1, span=(50, 100), unit="단계")
         if not self.place_data:
+            self.progress.finish_phase()
             messagebox.showwarning("Notice", "No valid addresses found in the file.")
             return
 
-        self.perform_initial_view()
-        self.add_log("--- Finetuning viewport in 1.0s ---")
-        self.root.after(1000, lambda: self.perform_perfect_centered_fit())
-
-    def _set_label_dir(self, item_data, direction, btns_ref):
-        """방향 버튼 클릭 → label_dir 업데이트 → 버튼 하이라이트 → 리렌더"""
-        item_data["label_dir"] = direction
-        self._refresh_dir_btns(item_data)
+        self.perform_perfect_centered_fit()
+
+    def _apply_reload_changes(self, kept: List[Tuple[Dict[str, Any], int]], added: int):
+        """변경분 다시 불러오기 결과를 반영합니다. 유지된 장소는 순서만 갱신하고, 엑셀에서 사라진 장소는 제거합니다."""
+        self._flush_pending_places()
+        self._live_map = False
+        kept_ids = set()
+        for item, order_val in kept:
+            item["order"] = order_val
+            kept_ids.add(id(item))
+        new_ids = {id(p) for p in self.place_data[len(self.place_data) - added:]} if added else set()
+        before = len(self.place_data)
+        # 목록 위젯이 같은 리스트를 참조하므로 제자리에서 교체
+        self.place_data[:] = [p for p in self.place_data if id(p) in kept_ids or id(p) in new_ids]
+        removed = before - len(self.place_data)
+        if self.dir_editor.item is not None and id(self.dir_editor.item) not in kept_ids:
+            self.dir_editor.hide()
+        self._sort_places_by_sheet()
+
+        self.place_list.refresh()
         self.render_current_view()
+        self.add_log(f"변경분 반영: 유지 {len(kept)}개, 추가 {added}개, 삭제 {removed}개")
 
-    def _refresh_dir_btns(self, item_data):
-        """현재 label_dir에 맞는 버튼만 활성(파란 배경) 표시 + 요약 아이콘 갱신"""
-        cur = item_data.get("label_dir", "top")
-        
-        # 상단 요약 아이콘 갱신
-        if "summary_lbl" in item_data:
-            icon = DIR_ICON_MAP.get(cur, "↑") # type: ignore
-            item_data["summary_lbl"].configure(text=icon)
-
-        # 리모콘 버튼 색상 갱신
-        for dirval, btn in item_data.get("dir_btns", {}).items():
-            if dirval == cur:
-                btn.configure(bg="#1A3A8F", fg="white", relief="flat")
-            else:
-                btn.configure(bg="#f8f9fa", fg="#333333", relief="flat")
+    def _sort_places_by_sheet(self):
+        """여러 시트를 동시에 불러오면 목록에 도착 순서대로 섞이므로, 시트 순서 → 시트 내 번호 순으로 정렬합니다."""
+        if len(self.loaded_sheets) < 2:
+            return
+        pos = {sheet: i for i, (sheet, _) in enumerate(self.loaded_sheets)}
+        # 목록 위젯이 같은 리스트를 참조하므로 제자리 정렬
+        self.place_data.sort(key=lambda p: (pos.get(p.get("sheet"), len(pos)), p.get("success_idx", 0)))
+        self.place_list.refresh()
+
+    def _on_label_dir_changed(self, item_data, direction):
+        """방향 리모콘에서 label_dir이 바뀌면 목록 아이콘을 갱신하고 리렌더"""
+        self.place_list.refresh()
+        self.render_current_view()
 
-    def _toggle_dir_controls(self, item_data):
+    def _toggle_dir_controls(self, item_data, anchor):
         """방향 제어 리모콘 보이기/숨기기 토글"""
-        frame = item_data.get("dir_btn_frame")
-        if frame:
-            if frame.winfo_viewable():
-                frame.pack_forget()
-            else:
-                frame.pack(fill=tk.X, padx=10, pady=2)
+        self.dir_editor.toggle(item_data, anchor)
 
     # ─────────────────────────────────────────────────────────────────────────
     # 줌 / 뷰 관리
     # ─────────────────────────────────────────────────────────────────────────
-    def perform_initial_view(self):
-        if not self.place_data:
-            return
-        visible = [(p["lon"], p["lat"]) for p in self.place_data if p["var"].get()]
-        if not visible:
-            return
-        clat, clon, czoom = calculate_zoom_and_center(visible, 800, 800, padding=0.25) # type: ignore
-        self.current_center = (float(clat), float(clon))
-        self.current_zoom   = float(czoom)
-        self.refresh_map()
-        self.add_log(f"1차 로드: 전체 분포 표시 (줌 {float(round(float(czoom), 1))})") # type: ignore
-
     def perform_perfect_centered_fit(self):
         if not self.place_data:
             return
-        visible = [(p["lon"], p["lat"]) for p in self.place_data if p["var"].get()]
+        visible = [(p["lon"], p["lat"]) for p in self.place_data if p.get("visible", True)]
         if not visible:
+            self.progress.finish_phase()
             return
-        self.add_log("--- 2차: 상하좌우 중앙 맞춤 시작 ---")
-        clat_v, clon_v, czoom_v = calculate_zoom_and_center(visible, 800, 800, padding=0.15) # type: ignore
-        self.current_center = (float(clat_v), float(clon_v))
-        self.current_zoom   = float(czoom_v) # type: ignore
-        self.refresh_map()
-        self.progress_var.set(100)
-        self.add_log(f"최종 완료: 최적 줌 {round(czoom_v,1)}") # type: ignore
+        fetched = self._fit_view_to_places(visible)
+        if fetched:
+            # 요청만 보낸 상태이므로 지도가 도착하면 _apply_basemap에서 단계를 끝냄
+            self._map_phase_pending = True
+        else:
+            self._finish_map_phase()
+        self.add_log(f"최종 완료: 최적 줌 {round(self.current_zoom, 1)}" + ("" if fetched else " (로딩 중 받은 지도 재사용)"))
 
     # ─────────────────────────────────────────────────────────────────────────
     # 지도 갱신
     # ─────────────────────────────────────────────────────────────────────────
     def refresh_map(self):
         """
-        선택된 서비스(Vworld 또는 Naver)로부터 베이스 지도를 가져옵니다.
+        선택된 서비스(Vworld 또는 Naver)에 현재 뷰의 베이스 지도를 요청합니다.
+        요청은 백그라운드에서 처리되며, 도착한 지도가 가장 최근 요청의 것일 때만 _apply_basemap에서 화면에 반영됩니다.
         """
         if not self.place_data:
             return
 
-        # 현재 상태 백업 (블렌딩용)
-        if self.raw_map_img is not None:
-            self.old_map_img = self.raw_map_img.copy() # type: ignore
-        self.old_last_center = self.current_center
-        self.old_last_zoom   = self.current_zoom
-        self.blend_alpha  = 0.0 # Start blend from 0
-        self.blend_timer  = None
-
         map_w, map_h = 800, 800
         clat, clon = float(round(self.current_center[0], 6)), float(round(self.current_center[1], 6)) # type: ignore
         base_zoom = int(self.current_zoom)
-        self.last_api_zoom   = base_zoom
-        self.last_api_center = (clat, clon)
 
-        provider = self.map_provider.get()
-        
-        if provider == "naver":
-            # 네이버 정적 지도 최적화 (줌 레벨 보정: vworld 12 -> naver 11 정도가 유사)
-            naver_zoom = base_zoom - 1
-            url = NAVER_STATIC_MAP_URL
-            headers = {
-                "X-NCP-APIGW-API-KEY-ID": self.api_keys.get("naver_client_id", ""),
-                "X-NCP-APIGW-API-KEY": self.api_keys.get("naver_client_secret", "")
-            }
-            params = {
-                "w": map_w, "h": map_h,
-                "center": f"{clon},{clat}",
-                "level": naver_zoom,
-                "scale": 2, # 고해상도 요청
-                "format": "jpg"
-            }
-        else:
-            url = VWORLD_STATIC_MAP_URL
-            headers = {}
-            params = {
-                "service": "image", "request": "getmap",
-                "key": self.api_keys.get("vworld_key", ""),
-                "center": f"{clon},{clat}",
-                "zoom": base_zoom,
-                "size": f"{map_w},{map_h}",
-                "basemap": "GRAPHIC", "format": "png",
-            }
+        # Vworld는 WMTS 타일로 조립, 네이버는 정적 지도 한 장 (둘 다 디스크 캐시에 있으면 요청 없음)
+        self.basemap_loader.request(self.map_provider.get(), self.api_keys, (clat, clon), base_zoom, (map_w, map_h))
+        # 지도가 도착할 때까지는 지금 지도를 확대·이동해서 새 뷰와 핀을 바로 보여 줌
+        self.render_current_view()
 
-        try:
-            self.add_log(f"지도 갱신 중 ({provider})...")
-            # print(f"[Debug] Map Request: {url} params={params}")
-            response = requests.get(url, headers=headers, params=params, verify=False, timeout=10) # type: ignore
-
-            if response.status_code == 200:
-                # 데이터 유효성 확인
-                if len(response.content) < 500: # 너무 작은 데이터는 에러 메시지일 가능성 높음
-                    self.add_log(f"지도 데이터 오류: 내용이 너무 짧음 ({len(response.content)} bytes)")
-                    try: print(f"Response Error Content: {response.text}")
-                    except: pass
-                    return
+    def _finish_map_phase(self):
+        self._map_phase_pending = False
+        self.progress.advance()
+        self.progress.finish_phase()
 
-                img_data = BytesIO(response.content)
-                try:
-                    self.raw_map_img = Image.open(img_data).convert("RGBA")
-                    self.start_crossfade()
-                except Exception as img_err:
-                    self.add_log(f"이미지 파싱 오류: {img_err}")
-            else:
-                self.add_log(f"지도 서버 오류 ({provider}): {response.status_code}")
-                if provider == "naver" and response.status_code == 401:
-                    self.add_log("네이버 API 인증 실패: ID/Secret 및 서비스를 확인하세요.")
-                elif provider == "vworld" and response.status_code == 401:
-                    self.add_log("Vworld API 인증 실패: 키를 확인하세요.")
-        except Exception as e:
-            self.add_log(f"지도 로딩 오류: {e}")
+    def _apply_basemap(self, generation: int, img, api_center: Tuple[float, float], zoom: int):
+        """
+        백그라운드에서 받은 베이스 지도를 반영합니다. 그 사이 새 요청이 있었거나 뷰가 바뀌었으면 버립니다.
+        img가 None이면 가장 최근 요청이 실패한 것이므로 진행 중인 지도 생성 단계만 끝냅니다.
+        """
+        if generation != self.basemap_loader.generation:
+            return
+        if self._map_phase_pending:
+            self._finish_map_phase()
+        if img is None:
+            return
+
+        # 현재 지도 백업 (블렌딩용: 이전 지도는 자신을 요청했던 중심/줌 기준으로 배치됨)
+        if self.raw_map_img is not None:
+            self.old_map_img = self.raw_map_img
+            self.old_last_center = self.last_api_center
+            self.old_last_zoom   = self.last_api_zoom
+        self.last_api_zoom   = zoom
+        self.last_api_center = api_center
+        self.raw_map_img = img
+        self.start_crossfade()
+        # 로딩 중 자동 맞춤은 사용자 이동이 아니므로 예측하지 않음 (오프라인 타일은 이미 로컬 파일)
+        if self.prefetcher and not self._live_map and self.map_provider.get() != "offline":
+            self.prefetcher.settle(self.map_provider.get(), self.api_keys, self.current_center, self.current_zoom)
+
+    def _on_view_changed(self):
+        """드래그/휠로 뷰가 바뀌면 이전 뷰를 위한 지도 요청과 미리 받기를 취소합니다."""
+        self.basemap_loader.cancel()
+        if self.prefetcher:
+            self.prefetcher.cancel()
+        # 최종 맞춤의 지도 요청이 취소되었으므로 기다리던 단계는 여기서 끝냄
+        if self._map_phase_pending:
+            self._finish_map_phase()
 
     def start_crossfade(self):
         """이전 지도 타일과 새 타일 사이의 부드러운 알파 블렌딩 전환을 시작합니다."""
@@ -1060,6 +1456,86 @@ class AddressMapApp:
         except Exception as e:
             messagebox.showerror("저장 오류", f"이미지 생성 중 오류: {e}")
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # 프로젝트 파일 (작업 상태 저장 / 즉시 복원)
+    # ─────────────────────────────────────────────────────────────────────────
+    def save_project_file(self):
+        """장소, 라벨 방향, 표시 여부, 뷰, 색상 설정과 현재 베이스 지도를 프로젝트 파일로 저장합니다."""
+        if not self.place_data:
+            messagebox.showwarning("알림", "저장할 데이터가 없습니다.")
+            return
+        base = os.path.splitext(os.path.basename(self.loaded_path))[0] if self.loaded_path else "지도"
+        file_path = filedialog.asksaveasfilename(defaultextension=PROJECT_EXT, filetypes=PROJECT_DIALOG_TYPES,
+                                                 initialfile=f"{base}{PROJECT_EXT}")
+        if not file_path:
+            return
+        state = {
+            "provider": self.map_provider.get(),
+            "center": list(self.current_center), "zoom": self.current_zoom,
+            "api_center": list(self.last_api_center), "api_zoom": self.last_api_zoom,
+            "type_colors": self.type_colors, "type_color_idx": self.type_color_idx,
+            "pin_size": self.pin_size_key.get(), "font_size": self.font_size_var.get(),
+            "source": self.loaded_path, "sheets": [list(pair) for pair in self.loaded_sheets],
+        }
+        try:
+            save_project(file_path, state, self.place_data, self.raw_map_img)
+            self.add_log(f"프로젝트 저장 완료: {file_path} (장소 {len(self.place_data)}개)")
+        except Exception as e:
+            messagebox.showerror("저장 오류", f"프로젝트 저장 실패: {e}")
+
+    def open_project_file(self):
+        """프로젝트 파일을 열어 저장 당시의 작업 상태를 엑셀/지오코딩/지도 요청 없이 복원합니다."""
+        file_path = filedialog.askopenfilename(filetypes=PROJECT_DIALOG_TYPES)
+        if not file_path:
+            return
+        try:
+            project = ProjectFile(file_path)
+        except Exception as e:
+            messagebox.showerror("오류", f"프로젝트 파일을 열 수 없습니다: {e}")
+            return
+
+        self._clear_ui_on_load()
+        self.place_data = project.places
+        self.place_list.set_items(self.place_data)
+        self.loaded_path, self.row_results = project.get("source", ""), {}
+        self.loaded_sheets = [(sheet, group) for sheet, group in project.get("sheets", [])]
+
+        self.map_provider.set(project.get("provider", DEFAULT_PROVIDER))
+        self.geo_engine.provider = self.map_provider.get()
+        self.update_api_field_visibility()
+        self.type_colors.update(project.get("type_colors", {}))
+        self.type_color_idx.update(project.get("type_color_idx", {}))
+        self._register_groups(group for _, group in self.loaded_sheets)
+        self.font_size_var.set(project.get("font_size", self.font_size_var.get()))
+        pin_size = project.get("pin_size", self.pin_size_key.get())
+        if pin_size in self._pin_size_btns:
+            self.set_pin_size(pin_size)
+        else:
+            self.pin_size_key.set(pin_size)
+
+        self.current_center = tuple(project.get("center", self.current_center))
+        self.current_zoom = float(project.get("zoom", self.current_zoom))
+        self.last_api_center = tuple(project.get("api_center", self.current_center))
+        self.last_api_zoom = int(project.get("api_zoom", int(self.current_zoom)))
+        self.add_log(f"프로젝트 열기: {os.path.basename(file_path)} (장소 {len(self.place_data)}개)")
+        # 목록을 먼저 보여 주고, 지도 이미지는 다음 유휴 시점에 디코딩하여 표시
+        self.root.after_idle(lambda: self._show_project_basemap(project))
+
+    def _show_project_basemap(self, project: ProjectFile):
+        try:
+            basemap = project.basemap()
+        except Exception as e:
+            self.add_log(f"프로젝트 지도 이미지 오류: {e}", "error")
+            basemap = None
+        if basemap is None:
+            # 저장된 지도가 없으면 현재 뷰로 새로 요청
+            self.refresh_map()
+            return
+        self.old_map_img = None
+        self.blend_alpha = 1.0
+        self.raw_map_img = basemap
+        self.render_current_view()
+
     # ─────────────────────────────────────────────────────────────────────────
     # 드래그 / 줌 이벤트
     # ─────────────────────────────────────────────────────────────────────────
@@ -1085,6 +1561,7 @@ class AddressMapApp:
 
         self.current_center = (clat + d_lat, clon + d_lon)
         self.drag_start_pos = (int(event.x), int(event.y))
+        self._on_view_changed()
         self.render_current_view()
 
         if self.zoom_timer:
@@ -1100,6 +1577,7 @@ class AddressMapApp:
         self.current_zoom = max(7.0, min(19.0, self.current_zoom + step))
 
         if old_zoom != self.current_zoom:
+            self._on_view_changed()
             self.render_current_view()
             if self.zoom_timer:
                 self.root.after_cancel(self.zoom_timer)
@@ -1114,14 +1592,15 @@ class AddressMapApp:
     def toggle_all_visibility(self):
         new_state = self.select_all_var.get()
         for item in self.place_data:
-            item["var"].set(new_state)
+            item["visible"] = new_state
+        self.place_list.refresh()
         self.refresh_map()
 
     def reset_view_to_all(self):
         if not self.place_data:
             messagebox.showwarning("알림", "로드된 주소 데이터가 없습니다.")
             return
-        visible = [(p["lon"], p["lat"]) for p in self.place_data if p["var"].get()]
+        visible = [(p["lon"], p["lat"]) for p in self.place_data if p.get("visible", True)]
         if not visible:
             self.add_log("표시할 마커가 없습니다.")
             return
@@ -0,0 +1,174 @@
+"""
+renderer/basemap.py - 제공자별 베이스 지도 이미지를 가져오는 공용 모듈 (GUI 지도 갱신, 프로젝트 PNG 렌더링 공용)
+받은 이미지는 디스크 캐시에 보관하므로 같은 뷰를 다시 보거나 다시 내보낼 때는 네트워크 요청을 하지 않습니다.
+GUI에서는 BasemapLoader가 백그라운드 스레드에서 요청하여 느린 지도 서버가 화면 조작을 막지 않게 합니다.
+"""
+import threading
+from io import BytesIO
+from typing import Callable, Dict, Optional, Tuple
+
+from PIL import Image # type: ignore
+
+from config import NAVER_STATIC_MAP_URL, MAP_CACHE_SNAP_PX, DEFAULT_MAP_SIZE, BASEMAP_LOAD_WORKERS
+from renderer.offline_tiles import open_offline_source
+from renderer.tile_engine import TileEngine, vworld_tile_source
+from utils.geo_utils import snap_center
+from utils.http_client import http_get
+from utils.map_cache import MapImageCache, static_map_key
+
+# 네이버 정적 지도 요청 형식 (캐시 키에도 포함되어 형식이 바뀌면 다른 이미지로 취급)
+NAVER_STYLE = "basic@2x.jpg"
+
+class BasemapFetcher:
+    """
+    vworld는 배경지도 타일을 조립하고, naver는 정적 지도 한 장을 요청합니다.
+    offline은 api_keys["offline_tiles"]의 MBTiles 파일/타일 폴더에서 타일을 읽어 조립합니다. (네트워크 요청 없음)
+    disk_cache는 타일과 정적 지도 이미지 모두에 사용됩니다. (offline 타일은 제외)
+    """
+
+    def __init__(self, api_keys: Dict[str, str], disk_cache: Optional[MapImageCache] = None,
+                 tile_engine: Optional[TileEngine] = None, log_fn=None):
+        self.api_keys = api_keys
+        self.disk_cache = disk_cache
+        self.tile_engine = tile_engine or TileEngine(disk_cache=disk_cache)
+        self.log_fn = log_fn
+        self._offline = None
+        self._offline_path = ""
+
+    def _log(self, message: str, level: str = "info"):
+        if self.log_fn:
+            self.log_fn(message, level)
+        elif level != "debug":
+            print(f"[{level.upper()}] {message}")
+
+    def fetch(self, provider: str, center: Tuple[float, float], zoom: int,
+              size: Tuple[int, int] = DEFAULT_MAP_SIZE) -> Tuple[Optional[Image.Image], Tuple[float, float], int]:
+        """
+        center(위도, 경도)·정수 zoom의 베이스 지도를 가져옵니다.
+        반환값: (이미지 또는 None, 이미지의 실제 중심, 네트워크 요청 수)
+        정적 지도는 캐시 적중률을 높이기 위해 중심을 격자에 맞춰 요청하므로 실제 중심이 조금 다를 수 있습니다.
+        """
+        if provider == "vworld":
+            return self._fetch_tiles(center, zoom, size)
+        if provider == "offline":
+            return self._fetch_offline(center, zoom, size)
+        return self._fetch_naver(center, zoom, size)
+
+    def _fetch_tiles(self, center, zoom, size):
+        source = vworld_tile_source(self.api_keys.get("vworld_key", ""))
+        img, stats = self.tile_engine.render(source, center, zoom, size[0], size[1])
+        requests = stats["fetched"] + stats["failed"]
+        self._log(f"지도 갱신 (vworld 타일 {stats['tiles']}장: 새로 받음 {stats['fetched']}, "
+                  f"메모리 {stats['cached']}, 디스크 {stats['disk']})", "debug")
+        if stats["failed"]:
+            status = source.last_status
+            self._log(f"지도 타일 {stats['failed']}장을 받지 못했습니다 ({status or self.tile_engine.last_error})", "error")
+            if status == 401:
+                self._log("Vworld API 인증 실패: 키를 확인하세요.", "error")
+            if stats["failed"] == stats["tiles"]:
+                return None, center, requests
+        return img, center, requests
+
+    def _fetch_offline(self, center, zoom, size):
+        path = self.api_keys.get("offline_tiles", "")
+        if self._offline is None or self._offline_path != path:
+            self._offline, self._offline_path = open_offline_source(path), path
+        img, stats = self.tile_engine.render(self._offline, center, zoom, size[0], size[1])
+        self._log(f"지도 갱신 (오프라인 타일 {stats['tiles']}장: 파일 {stats['fetched']}, 메모리 {stats['cached']})", "debug")
+        if stats["failed"] == stats["tiles"]:
+            self._log(f"오프라인 지도에 이 영역(줌 {zoom})의 타일이 없습니다.", "error")
+        return img, center, 0
+
+    def _fetch_naver(self, center, zoom, size):
+        center = snap_center(center, zoom, MAP_CACHE_SNAP_PX)
+        key = static_map_key("naver", center, zoom, size, NAVER_STYLE)
+        data = self.disk_cache.get(key) if self.disk_cache else None
+        requests = 0
+        if data is None:
+            clat, clon = center
+            headers = {
+                "X-NCP-APIGW-API-KEY-ID": self.api_keys.get("naver_client_id", ""),
+                "X-NCP-APIGW-API-KEY": self.api_keys.get("naver_client_secret", "")
+            }
+            params = {
+                "w": size[0], "h": size[1],
+                "center": f"{clon},{clat}",
+                # 네이버 정적 지도 최적화 (줌 레벨 보정: vworld 12 -> naver 11 정도가 유사)
+                "level": zoom - 1,
+                "scale": 2, # 고해상도 요청
+                "format": "jpg"
+            }
+            self._log("지도 갱신 중 (naver)...")
+            response = http_get(NAVER_STATIC_MAP_URL, headers=headers, params=params, verify=False, timeout=10)
+            requests = 1
+            if response.status_code != 200:
+                self._log(f"지도 서버 오류 (naver): {response.status_code}", "error")
+                if response.status_code == 401:
+                    self._log("네이버 API 인증 실패: ID/Secret 및 서비스를 확인하세요.", "error")
+                return None, center, requests
+            # 너무 작은 데이터는 에러 메시지일 가능성 높음
+            if len(response.content) < 500:
+                self._log(f"지도 데이터 오류: 내용이 너무 짧음 ({len(response.content)} bytes)", "error")
+                return None, center, requests
+            data = response.content
+        try:
+            img = Image.open(BytesIO(data)).convert("RGBA")
+        except Exception as e:
+            self._log(f"이미지 파싱 오류: {e}", "error")
+            return None, center, requests
+        if requests and self.disk_cache:
+            self.disk_cache.put(key, data)
+        return img, center, requests
+
+class BasemapLoader:
+    """
+    베이스 지도 요청을 백그라운드 스레드에서 처리합니다. 요청마다 세대 번호를 붙이고 가장 최근 요청 하나만 대기시키므로,
+    사용자가 이미 떠난 뷰의 요청은 시작 전에 버려지고, 받는 중이던 응답도 on_result로 넘기지 않습니다.
+    워커가 여러 개라서 느린 응답 하나를 기다리는 동안에도 새 요청은 다른 워커가 바로 시작합니다.
+    on_result(세대, 이미지 또는 None, 실제 중심, 줌)는 워커 스레드에서 호출되므로 UI 반영은 호출하는 쪽에서 메인 스레드로 넘겨야 합니다.
+    최근 요청이 실패해도 이미지 None으로 호출되므로, 호출하는 쪽은 요청이 끝났다는 것을 항상 알 수 있습니다.
+    """
+
+    def __init__(self, fetcher: BasemapFetcher, on_result: Callable[[int, Optional[Image.Image], Tuple[float, float], int], None],
+                 on_requests: Optional[Callable[[int], None]] = None, workers: int = BASEMAP_LOAD_WORKERS):
+        self.fetcher = fetcher
+        self.on_result = on_result
+        self.on_requests = on_requests
+        self.generation = 0
+        self._pending: Optional[Tuple[int, str, Tuple[float, float], int, Tuple[int, int]]] = None
+        self._cond = threading.Condition()
+        for i in range(workers):
+            threading.Thread(target=self._run, name=f"basemap-{i}", daemon=True).start()
+
+    def request(self, provider: str, api_keys: Dict[str, str], center: Tuple[float, float], zoom: int,
+                size: Tuple[int, int] = DEFAULT_MAP_SIZE) -> int:
+        """새 뷰의 지도를 요청하고 세대 번호를 반환합니다. 아직 시작하지 않은 이전 요청은 대체됩니다."""
+        with self._cond:
+            self.generation += 1
+            self.fetcher.api_keys = api_keys
+            self._pending = (self.generation, provider, center, zoom, size)
+            self._cond.notify()
+            return self.generation
+
+    def cancel(self):
+        """뷰가 바뀌었을 때 호출합니다. 대기 중인 요청과 받는 중인 응답을 모두 무효로 만듭니다."""
+        with self._cond:
+            self.generation += 1
+            self._pending = None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                generation, provider, center, zoom, size = self._pending
+                self._pending = None
+            try:
+                img, api_center, requests = self.fetcher.fetch(provider, center, zoom, size)
+            except Exception as e:
+                self.fetcher._log(f"지도 로딩 오류: {e}", "error")
+                img, api_center, requests = None, center, 0
+            if self.on_requests and requests:
+                self.on_requests(requests)
+            if generation == self.generation:
+                self.on_result(generation, img, api_center, zoom)
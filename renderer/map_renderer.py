@@ -4,7 +4,7 @@ renderer/map_renderer.py - 지도 마커 및 라벨 렌더링 엔진
 import math
 from typing import List, Dict, Tuple, Any, Optional
 from PIL import Image, ImageDraw, ImageFont
-from config import TILE_SIZE, PIN_SIZE_MULT, DIR_ICON_MAP
+from config import TILE_SIZE, PIN_SIZE_MULT
 from utils.geo_utils import latlon_to_pixel
 
 def draw_outline_pin(draw, px, py, radius, border_color=(26, 58, 143, 200), border_width=2):
@@ -108,7 +108,7 @@ class MapRenderer:
         marker_positions = []
         visible_items = []
         for item in place_data:
-            if not item.get("var") or not item["var"].get(): continue
+            if not item.get("visible", True): continue
             plon, plat = item["lon"], item["lat"]
             px, py = latlon_to_pixel(plat, plon, zoom, clat, clon, map_w, map_h)
             if not (0 <= px <= map_w and 0 <= py <= map_h): continue
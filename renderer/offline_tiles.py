@@ -0,0 +1,76 @@
+"""
+renderer/offline_tiles.py - 네트워크 없이 로컬 파일에서 베이스 지도 타일을 읽는 오프라인 타일 소스
+MBTiles(SQLite) 파일 또는 {z}/{x}/{y}.png 형태로 미리 렌더링된 타일 폴더를 지원합니다.
+지도 갱신이 로컬 I/O만으로 끝나므로 현장 작업과 같은 타일로 항상 같은 결과가 나와야 하는 테스트에도 사용할 수 있습니다.
+"""
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from config import MBTILES_MMAP_MB
+
+_TILE_EXTS = ("png", "jpg", "jpeg", "webp")
+
+class MBTilesSource:
+    """
+    MBTiles 파일의 래스터 타일을 읽습니다. MBTiles는 TMS 행 번호(아래에서 위)를 쓰므로 XYZ의 y를 뒤집어 조회합니다.
+    타일 엔진의 워커 스레드마다 읽기 전용 연결을 하나씩 두고, 파일은 mmap으로 읽어 반복 조회 시 시스템 호출을 줄입니다.
+    """
+    cacheable = False   # 이미 로컬 파일이므로 디스크 캐시에 복사하지 않음
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.layer = f"mbtiles:{self.path}"
+        self.last_status: Optional[int] = None
+        self._local = threading.local()
+        self.metadata: Dict[str, str] = dict(self._conn().execute("SELECT name, value FROM metadata").fetchall())
+        if self.metadata.get("format", "png") == "pbf":
+            raise ValueError("벡터 타일(pbf) MBTiles는 지원하지 않습니다. 래스터(png/jpg) 타일 파일을 사용하세요.")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            conn.execute(f"PRAGMA mmap_size={MBTILES_MMAP_MB * 1024 * 1024}")
+            self._local.conn = conn
+        return conn
+
+    def fetch(self, z: int, x: int, y: int) -> Optional[bytes]:
+        row = self._conn().execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+            (z, x, (1 << z) - 1 - y)).fetchone()
+        return bytes(row[0]) if row else None
+
+class DirectoryTileSource:
+    """{z}/{x}/{y}.(png|jpg|jpeg|webp) 구조의 XYZ 타일 폴더를 읽습니다. 마지막으로 찾은 확장자부터 확인합니다."""
+    cacheable = False
+
+    def __init__(self, folder: str):
+        self.folder = os.path.abspath(folder)
+        self.layer = f"dir:{self.folder}"
+        self.last_status: Optional[int] = None
+        self._ext: Optional[str] = None
+
+    def fetch(self, z: int, x: int, y: int) -> Optional[bytes]:
+        base = os.path.join(self.folder, str(z), str(x), str(y))
+        exts = _TILE_EXTS if self._ext is None else (self._ext,) + tuple(e for e in _TILE_EXTS if e != self._ext)
+        for ext in exts:
+            try:
+                with open(f"{base}.{ext}", "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue
+            self._ext = ext
+            return data
+        return None
+
+def open_offline_source(path: str):
+    """경로가 폴더면 타일 폴더, 파일이면 MBTiles로 엽니다."""
+    if not path:
+        raise ValueError("오프라인 지도 타일 경로가 지정되지 않았습니다.")
+    if os.path.isdir(path):
+        return DirectoryTileSource(path)
+    if os.path.isfile(path):
+        return MBTilesSource(path)
+    raise FileNotFoundError(f"오프라인 지도 타일을 찾을 수 없습니다: {path}")
@@ -0,0 +1,118 @@
+"""
+renderer/prefetch.py - 뷰가 멈춘 뒤 다음에 볼 가능성이 높은 뷰의 베이스 지도를 미리 받아 두는 유휴 시간 프리페처
+최근 뷰들의 이동 방향과 줌 변화 추세로 다음 뷰를 예측하고, 전용 저속 워커가 디스크 캐시에 채워 둡니다.
+사용자가 다시 움직이면 진행 중이던 예측은 버려집니다.
+"""
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from config import DEFAULT_MAP_SIZE, ZOOM_RANGE, PREFETCH_DELAY_MS, PREFETCH_MAX_VIEWS, PREFETCH_WORKERS, MAP_CACHE_SNAP_PX
+from renderer.basemap import BasemapFetcher
+from renderer.tile_engine import TileEngine
+from utils.geo_utils import lon_to_world_x, lat_to_world_y, world_to_latlon, snap_center
+from utils.map_cache import MapImageCache
+
+View = Tuple[Tuple[float, float], int]   # ((위도, 경도), 정수 줌)
+
+# 이보다 적게(px) 움직인 경우는 이동 방향이 없는 것으로 봄
+_MIN_PAN_PX = 20
+
+class ViewPrefetcher:
+    """
+    settle()로 멈춘 뷰를 알려 주면 PREFETCH_DELAY_MS 뒤 예측한 뷰들을 차례로 받아 disk_cache에 넣습니다.
+    화면 갱신용 타일 엔진과 메모리 캐시·연결 수를 나눠 쓰지 않도록 전용 엔진(동시 요청 PREFETCH_WORKERS개)을 사용하며,
+    받은 지도는 디스크 캐시에만 남습니다. 예측은 세대 번호로 관리하여 settle()/cancel()이 다시 불리면 남은 예측을 버립니다.
+    """
+
+    def __init__(self, disk_cache: MapImageCache, size: Tuple[int, int] = DEFAULT_MAP_SIZE,
+                 max_views: int = PREFETCH_MAX_VIEWS, log_fn=None):
+        self.size = size
+        self.max_views = max_views
+        self.log_fn = log_fn
+        self.fetcher = BasemapFetcher({}, disk_cache, TileEngine(capacity=0, workers=PREFETCH_WORKERS, disk_cache=disk_cache),
+                                      log_fn=self._log)
+        self.requests = 0   # 미리 받기로 보낸 네트워크 요청 수
+        self._history: Deque[Tuple[Tuple[float, float], float]] = deque(maxlen=2)
+        self._generation = 0
+        self._pending: Optional[Tuple[int, str, Dict[str, str], List[View]]] = None
+        self._cond = threading.Condition()
+        threading.Thread(target=self._run, name="prefetch", daemon=True).start()
+
+    def _log(self, message: str, level: str = "info"):
+        # 미리 받기는 사용자가 요청한 갱신이 아니므로 오류도 debug로만 기록
+        if self.log_fn:
+            self.log_fn(f"[미리 받기] {message}", "debug")
+
+    def predict(self, center: Tuple[float, float], zoom: float, provider: str = "vworld") -> List[View]:
+        """
+        직전에 멈춘 뷰와 비교하여 다음 뷰를 가능성 높은 순서로 예측합니다.
+        이동 중이었다면 같은 방향으로 한 번 더 이동한 뷰, 줌을 바꾸는 중이었다면 같은 방향의 다음 정수 줌을 먼저 넣고,
+        추세가 없으면 휠 한두 번이면 닿는 위아래 줌을 넣습니다.
+        naver 정적 지도는 BasemapFetcher와 같은 격자(snap_center)에 맞춘 중심으로 예측하여 캐시 키가 실제 요청과 같아지게 합니다.
+        """
+        base = int(zoom)
+        min_zoom, max_zoom = int(ZOOM_RANGE[0]), int(ZOOM_RANGE[1])
+        views: List[View] = []
+
+        def add(c: Tuple[float, float], z: int):
+            if provider == "naver":
+                c = snap_center(c, z, MAP_CACHE_SNAP_PX)
+            view = ((round(c[0], 6), round(c[1], 6)), z)
+            if min_zoom <= z <= max_zoom and view not in views:
+                views.append(view)
+
+        zoom_trend = 0
+        if self._history:
+            (plat, plon), pzoom = self._history[-1]
+            zoom_trend = (zoom > pzoom) - (zoom < pzoom)
+            x, y = lon_to_world_x(center[1], base), lat_to_world_y(center[0], base)
+            dx = x - lon_to_world_x(plon, base)
+            dy = y - lat_to_world_y(plat, base)
+            dist = (dx * dx + dy * dy) ** 0.5
+            if dist >= _MIN_PAN_PX:
+                # 한 번에 한 화면 이상 건너뛰지는 않음
+                limit = min(1.0, self.size[0] / dist)
+                add(world_to_latlon(x + dx * limit, y + dy * limit, base), base)
+        if zoom_trend:
+            add(center, base + zoom_trend)
+        else:
+            add(center, base + 1)
+            add(center, base - 1)
+        return views[:self.max_views]
+
+    def settle(self, provider: str, api_keys: Dict[str, str], center: Tuple[float, float], zoom: float):
+        """뷰가 멈췄을 때 호출합니다 (메인 스레드). 이전 예측을 취소하고 새 예측을 대기열에 넣습니다."""
+        views = self.predict(center, zoom, provider)
+        self._history.append((center, zoom))
+        with self._cond:
+            self._generation += 1
+            self._pending = (self._generation, provider, dict(api_keys), views) if views else None
+            self._cond.notify()
+
+    def cancel(self):
+        """사용자가 다시 움직이기 시작하면 호출합니다. 아직 받지 않은 예측은 버립니다."""
+        with self._cond:
+            self._generation += 1
+            self._pending = None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                generation, provider, api_keys, views = self._pending
+                self._pending = None
+            # 뷰가 잠시 그대로 있을 때만 시작 (그 사이 다시 움직이면 세대가 바뀜)
+            time.sleep(PREFETCH_DELAY_MS / 1000)
+            self.fetcher.api_keys = api_keys
+            for center, zoom in views:
+                if generation != self._generation:
+                    break
+                try:
+                    _, _, requests = self.fetcher.fetch(provider, center, zoom, self.size)
+                except Exception as e:
+                    self._log(f"오류: {e}")
+                    continue
+                self.requests += requests
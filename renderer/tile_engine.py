@@ -0,0 +1,135 @@
+"""
+renderer/tile_engine.py - XYZ/WMTS 타일을 받아 베이스 지도 한 장으로 조립하는 타일 엔진
+정적 지도 한 장을 통째로 다시 받는 대신, 이미 받은 타일은 메모리 LRU에서 재사용하고 화면에 새로 들어온 타일만 요청합니다.
+"""
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image # type: ignore
+
+from config import TILE_SIZE, TILE_MEMORY_CACHE, TILE_FETCH_WORKERS, VWORLD_WMTS_URL
+from utils.geo_utils import view_tiles
+from utils.http_client import http_get
+from utils.map_cache import MapImageCache, tile_key
+
+TileKey = Tuple[str, int, int, int]   # (레이어, z, x, y)
+
+# 받지 못한 타일 자리의 배경색
+EMPTY_TILE_COLOR = (238, 238, 238, 255)
+
+class UrlTileSource:
+    """
+    HTTP 타일 소스. url_template의 {z}, {x}, {y}를 채워 요청합니다.
+    layer는 메모리 캐시에서 타일을 구분하는 이름입니다. (같은 레이어면 키가 달라도 같은 타일)
+    """
+
+    def __init__(self, layer: str, url_template: str, headers: Optional[Dict[str, str]] = None):
+        self.layer = layer
+        self.url_template = url_template
+        self.headers = headers or {}
+        self.last_status: Optional[int] = None
+
+    def fetch(self, z: int, x: int, y: int) -> Optional[bytes]:
+        response = http_get(self.url_template.format(z=z, x=x, y=y), headers=self.headers, timeout=10, verify=False)
+        self.last_status = response.status_code
+        # 오류 응답은 짧은 XML/텍스트로 오므로 내용이 너무 짧으면 실패로 처리
+        if response.status_code != 200 or len(response.content) < 100:
+            return None
+        return response.content
+
+def vworld_tile_source(api_key: str) -> UrlTileSource:
+    """Vworld WMTS 배경지도(Base) 타일 소스"""
+    return UrlTileSource("vworld-base", VWORLD_WMTS_URL.replace("{key}", api_key))
+
+class TileEngine:
+    """
+    타일 소스에서 뷰에 필요한 타일만 받아 width×height 이미지로 조립합니다.
+    디코딩된 타일은 최대 capacity개까지 LRU로 보관하며, 받지 못한 타일은 캐시에 넣지 않으므로 다음 갱신 때 다시 요청됩니다.
+    disk_cache가 주어지면 메모리에 없는 타일을 네트워크보다 먼저 디스크에서 찾고, 새로 받은 타일은 디스크에도 저장합니다.
+    """
+
+    def __init__(self, capacity: int = TILE_MEMORY_CACHE, workers: int = TILE_FETCH_WORKERS,
+                 disk_cache: Optional[MapImageCache] = None):
+        self.capacity = capacity
+        self.disk_cache = disk_cache
+        self._tiles: "OrderedDict[TileKey, Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tile")
+        self.last_error: Optional[str] = None
+
+    def render(self, source: Any, center: Tuple[float, float], zoom: int,
+               width: int, height: int) -> Tuple[Image.Image, Dict[str, int]]:
+        """
+        center(위도, 경도)·정수 zoom의 뷰를 조립합니다. 정적 지도 API와 같은 위치·크기의 이미지가 나옵니다.
+        반환값: (이미지, {"tiles": 필요한 타일 수, "cached": 메모리 적중, "disk": 디스크 적중,
+                         "fetched": 네트워크로 받은 수, "failed": 실패 수})
+        """
+        (left, top), tiles = view_tiles(center[0], center[1], zoom, width, height)
+        n = 2 ** zoom
+        keys = [(source.layer, zoom, tx % n, ty) for tx, ty in tiles]
+
+        images: Dict[TileKey, Image.Image] = {}
+        missing = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                img = self._tiles.get(key)
+                if img is not None:
+                    self._tiles.move_to_end(key)
+                    images[key] = img
+                else:
+                    missing.append(key)
+
+        # 없는 타일만 병렬로 받음
+        futures = [(key, self._pool.submit(self._load, source, key)) for key in missing]
+        failed = from_disk = 0
+        for key, fut in futures:
+            img, on_disk = fut.result()
+            if img is None:
+                failed += 1
+            else:
+                images[key] = img
+                from_disk += on_disk
+
+        canvas = Image.new("RGBA", (width, height), EMPTY_TILE_COLOR)
+        ox, oy = int(math.floor(left)), int(math.floor(top))
+        for (tx, ty), key in zip(tiles, keys):
+            img = images.get(key)
+            if img is not None:
+                canvas.paste(img, (tx * TILE_SIZE - ox, ty * TILE_SIZE - oy))
+        stats = {"tiles": len(images) + failed, "cached": len(images) + failed - len(missing),
+                 "disk": from_disk, "fetched": len(missing) - failed - from_disk, "failed": failed}
+        return canvas, stats
+
+    def _load(self, source: Any, key: TileKey) -> Tuple[Optional[Image.Image], bool]:
+        """타일 하나를 디스크 캐시 또는 소스에서 읽어 디코딩합니다. 반환값: (이미지, 디스크에서 읽었는지)"""
+        layer, z, x, y = key
+        # 로컬 파일을 읽는 소스(cacheable=False)는 디스크 캐시를 거치지 않음
+        disk = self.disk_cache if getattr(source, "cacheable", True) else None
+        data = disk.get(tile_key(layer, z, x, y)) if disk else None
+        on_disk = data is not None
+        try:
+            if data is None:
+                data = source.fetch(z, x, y)
+                if not data:
+                    return None, False
+            img = Image.open(BytesIO(data)).convert("RGBA")
+        except Exception as e:
+            self.last_error = str(e)
+            return None, False
+        if disk and not on_disk:
+            disk.put(tile_key(layer, z, x, y), data)
+        if img.size != (TILE_SIZE, TILE_SIZE):
+            img = img.resize((TILE_SIZE, TILE_SIZE))
+        with self._lock:
+            self._tiles[key] = img
+            while len(self._tiles) > self.capacity:
+                self._tiles.popitem(last=False)
+        return img, on_disk
+
+    def clear(self):
+        with self._lock:
+            self._tiles.clear()
@@ -0,0 +1,52 @@
+"""
+오프라인 주소 색인(build_index/AddressIndex)과 UTM-K 좌표 변환 테스트
+"""
+from utils.address_index import AddressIndex, build_index
+from utils.geo_utils import utmk_to_wgs84
+
+def entrance_line(sido, sigungu, road, main_no, sub_no="0", x=953898.0, y=1952055.0):
+    cols = [""] * 18
+    cols[3], cols[4], cols[7], cols[8], cols[9], cols[10] = sido, sigungu, road, "0", main_no, sub_no
+    cols[16], cols[17] = str(x), str(y)
+    return "|".join(cols)
+
+def make_index(tmp_path, lines, chunk_rows=2):
+    source = tmp_path / "entrc_test.txt"
+    source.write_text("\n".join(lines) + "\n", encoding="cp949")
+    out = str(tmp_path / "address_index.bin")
+    count = build_index([str(source)], out, log=lambda *a: None, chunk_rows=chunk_rows)
+    return AddressIndex(out), count
+
+def test_utmk_to_wgs84_known_points():
+    lon, lat = utmk_to_wgs84(1000000.0, 2000000.0)
+    assert abs(lon - 127.5) < 1e-9 and abs(lat - 38.0) < 1e-9
+    # 서울시청 부근
+    lon, lat = utmk_to_wgs84(953898.0, 1952055.0)
+    assert abs(lon - 126.978) < 0.001 and abs(lat - 37.5665) < 0.001
+
+def test_lookup_exact_and_main_number_fallback(tmp_path):
+    index, count = make_index(tmp_path, [
+        entrance_line("서울특별시", "중구", "세종대로", "110"),
+        # 같은 건물의 두 번째 출입구는 무시
+        entrance_line("서울특별시", "중구", "세종대로", "110", x=953950.0),
+        entrance_line("서울특별시", "종로구", "율곡로", "10", "2"),
+        entrance_line("부산광역시", "중구", "중앙대로", "1"),
+    ])
+    assert count == 3 and len(index) == 3
+    lon, lat, full = index.lookup("서울 중구 세종대로 110")
+    assert full.startswith("서울특별시 중구 세종대로 110")
+    assert (lon, lat) == tuple(round(v, 7) for v in utmk_to_wgs84(953898.0, 1952055.0))
+    # 부번이 없으면 같은 본번의 건물로 근사 일치
+    assert index.lookup("서울특별시 종로구 율곡로 10")[2].startswith("서울특별시 종로구 율곡로 10-2")
+    assert index.lookup("서울특별시 중구 없는로 1") is None
+    index.close()
+
+def test_region_filter_is_applied_before_the_candidate_limit(tmp_path):
+    # 전국에 같은 '중앙로 1'이 많아도 지정한 시/군/구의 레코드를 찾음
+    lines = [entrance_line("경기도", f"가{i:03d}시", "중앙로", "1") for i in range(100)]
+    lines.append(entrance_line("제주특별자치도", "하하시", "중앙로", "1"))
+    index, _ = make_index(tmp_path, lines, chunk_rows=16)
+    assert index.lookup("제주특별자치도 하하시 중앙로 1")[2].startswith("제주특별자치도 하하시 중앙로 1")
+    # 지역을 특정할 수 없으면 API로 넘김
+    assert index.lookup("중앙로 1") is None
+    index.close()
@@ -0,0 +1,12 @@
+"""
+주소 정규화(normalize_address) 테스트
+"""
+from utils.address_normalizer import normalize_address
+
+def test_gwangju_short_form_maps_to_metropolitan_city():
+    assert normalize_address("광주 서구 내방로 111").startswith("광주광역시 서구 내방로 111")
+
+def test_gyeonggi_gwangju_si_is_not_rewritten():
+    normalized = normalize_address("광주시 오포읍 오포로 1")
+    assert normalized.startswith("광주시 오포읍")
+    assert "광주광역시" not in normalized
@@ -0,0 +1,71 @@
+"""
+백그라운드 베이스 지도 로더(BasemapLoader) 테스트: 지난 세대의 응답 버림, 취소, 실패 알림
+"""
+import queue
+import threading
+
+from PIL import Image
+
+from renderer.basemap import BasemapLoader
+
+class FakeFetcher:
+    """center[1](경도)별로 응답을 지연시킬 수 있는 가짜 fetcher"""
+
+    def __init__(self):
+        self.api_keys = {}
+        self.gates = {}
+        self.fail = set()
+        self.started = queue.Queue()
+
+    def _log(self, message, level="info"):
+        pass
+
+    def fetch(self, provider, center, zoom, size):
+        self.started.put(center[1])
+        gate = self.gates.get(center[1])
+        if gate:
+            gate.wait(5)
+        if center[1] in self.fail:
+            raise RuntimeError("boom")
+        return Image.new("RGBA", size), center, 1
+
+def make_loader(fetcher):
+    results = queue.Queue()
+    return BasemapLoader(fetcher, on_result=lambda *r: results.put(r), workers=2), results
+
+def test_stale_response_is_dropped():
+    fetcher = FakeFetcher()
+    slow = fetcher.gates[127.0] = threading.Event()
+    loader, results = make_loader(fetcher)
+    first = loader.request("vworld", {}, (37.5, 127.0), 12, (16, 16))
+    # 첫 요청이 받는 중일 때 새 요청
+    assert fetcher.started.get(timeout=5) == 127.0
+    second = loader.request("vworld", {}, (37.5, 127.1), 12, (16, 16))
+    assert second == first + 1
+    generation, img, center, zoom = results.get(timeout=5)
+    assert (generation, center, zoom) == (second, (37.5, 127.1), 12) and img.size == (16, 16)
+    # 느린 첫 응답이 나중에 도착해도 on_result로 넘기지 않음
+    slow.set()
+    loader.request("vworld", {}, (37.5, 127.2), 12, (16, 16))
+    assert results.get(timeout=5)[2] == (37.5, 127.2)
+    assert results.empty()
+
+def test_cancel_drops_in_flight_result():
+    fetcher = FakeFetcher()
+    gate = fetcher.gates[127.0] = threading.Event()
+    loader, results = make_loader(fetcher)
+    loader.request("vworld", {}, (37.5, 127.0), 12, (16, 16))
+    assert fetcher.started.get(timeout=5) == 127.0
+    loader.cancel()
+    gate.set()
+    fetcher.gates.clear()
+    latest = loader.request("vworld", {}, (37.5, 127.3), 12, (16, 16))
+    assert results.get(timeout=5)[0] == latest
+    assert results.empty()
+
+def test_failed_current_request_reports_none():
+    fetcher = FakeFetcher()
+    fetcher.fail.add(127.0)
+    loader, results = make_loader(fetcher)
+    generation = loader.request("vworld", {}, (37.5, 127.0), 12, (16, 16))
+    assert results.get(timeout=5) == (generation, None, (37.5, 127.0), 12)
@@ -0,0 +1,49 @@
+"""
+지오코딩 체크포인트(GeocodeCheckpoint) 테스트
+"""
+from utils.checkpoint import GeocodeCheckpoint, file_digest
+
+def make_source(tmp_path, data=b"workbook"):
+    path = tmp_path / "places.xlsx"
+    path.write_bytes(data)
+    return str(path)
+
+def test_record_and_load_round_trip(tmp_path):
+    source = make_source(tmp_path)
+    cp = GeocodeCheckpoint(str(tmp_path / "cp"), source, "vworld", flush_every=2)
+    cp.start(3, resume=False)
+    cp.record(2, (127.1, 37.4, "도로명"), "ok")
+    cp.record(3, (None, None, None), "negative")
+    cp.record(4, (None, None, None), "failed")
+    cp.flush()
+
+    again = GeocodeCheckpoint(str(tmp_path / "cp"), source, "vworld")
+    done = again.load()
+    assert done == {2: ((127.1, 37.4, "도로명"), "ok"), 3: ((None, None, None), "negative")}
+    # 일시적 실패는 기록하지 않으므로 이어서 진행할 때 다시 조회
+    assert 4 not in done
+
+    again.finish()
+    assert GeocodeCheckpoint(str(tmp_path / "cp"), source, "vworld").load() == {}
+
+def test_job_id_uses_shared_digest_per_sheet(tmp_path):
+    source = make_source(tmp_path)
+    digest = file_digest(source)
+    a = GeocodeCheckpoint(str(tmp_path), source, "vworld", sheet="A", digest=digest)
+    b = GeocodeCheckpoint(str(tmp_path), source, "vworld", sheet="B", digest=digest)
+    assert a.job_id != b.job_id
+    # 해시를 넘기지 않아도 같은 작업으로 취급
+    assert a.job_id == GeocodeCheckpoint(str(tmp_path), source, "vworld", sheet="A").job_id
+    # 내용이 바뀌면 다른 작업
+    other = make_source(tmp_path, b"changed")
+    assert GeocodeCheckpoint(str(tmp_path), other, "vworld", sheet="A").job_id != a.job_id
+
+def test_torn_last_line_is_ignored(tmp_path):
+    source = make_source(tmp_path)
+    cp = GeocodeCheckpoint(str(tmp_path), source, "naver")
+    cp.start(2, resume=False)
+    cp.record(2, (127.0, 37.0, None), "cached")
+    cp.flush()
+    with open(cp.path, "a", encoding="utf-8") as f:
+        f.write('{"i": 3, "lon": 12')
+    assert list(cp.load()) == [2]
@@ -0,0 +1,62 @@
+"""
+지오코딩 영구 캐시(GeocodeCache) 테스트: TTL 만료, 실패 항목 TTL, 실패 항목 삭제, LRU 제거
+"""
+import pytest
+
+import utils.geocode_cache as geocode_cache
+from utils.geocode_cache import GeocodeCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000000.0]
+    monkeypatch.setattr(geocode_cache.time, "time", lambda: now[0])
+    return now
+
+def test_positive_entries_expire_after_ttl(clock, tmp_path):
+    cache = GeocodeCache(str(tmp_path / "cache.db"), ttl_days=1)
+    cache.set("vworld:a", (127.0, 37.0, "주소"))
+    clock[0] += 86400 - 1
+    assert cache.get("vworld:a") == (127.0, 37.0, "주소")
+    clock[0] += 2
+    assert cache.get("vworld:a") is None
+    # 만료된 항목은 읽을 때 삭제됨
+    assert len(cache) == 0
+
+def test_negative_entries_use_shorter_ttl(clock):
+    cache = GeocodeCache(":memory:", ttl_days=90, negative_ttl_hours=1)
+    cache.set_failure("vworld:없는 주소")
+    assert cache.get("vworld:없는 주소") == (None, None, None)
+    assert cache.get("vworld:없는 주소", include_failures=False) is None
+    assert "vworld:없는 주소" in cache
+    clock[0] += 3601
+    assert "vworld:없는 주소" not in cache
+    assert cache.get("vworld:없는 주소") is None
+    assert cache.stats()["negative_hits"] == 1
+
+def test_purge_failures_keeps_coordinates(clock):
+    cache = GeocodeCache(":memory:")
+    cache.set("vworld:a", (127.0, 37.0, None))
+    cache.set_failure("vworld:b")
+    cache.set_failure("naver:b")
+    assert cache.failure_count() == 2
+    assert cache.purge_failures() == 2
+    assert cache.failure_count() == 0
+    assert cache.get("vworld:a") == (127.0, 37.0, None)
+
+def test_eviction_drops_least_recently_accessed(clock, tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = GeocodeCache(path, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, (127.0, 37.0, key))
+        clock[0] += 1
+    # a를 읽으면 가장 오래 사용되지 않은 항목은 b
+    assert cache.get("a") is not None
+    cache.evict()
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    cache.close()
+    # 읽기 경로의 사용 시각 갱신도 커밋되어 다시 열어도 남아 있음
+    reopened = GeocodeCache(path, max_entries=1)
+    reopened.evict()
+    assert "a" in reopened
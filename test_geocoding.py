@@ -0,0 +1,111 @@
+"""
+GeocodeEngine 쿼리 플랜 테스트 (http_get을 가짜 응답으로 바꿔 네트워크 없이 실행)
+"""
+import utils.geocoding as geocoding
+from config import NAVER_GEOCODE_URL, VWORLD_SEARCH_URL
+from utils.geocode_cache import GeocodeCache
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.text = str(data)
+
+    def json(self):
+        return self.data
+
+VWORLD_MISS = {"response": {"status": "NOT_FOUND"}}
+NAVER_HIT = {"status": "OK", "addresses": [{"x": "127.1", "y": "37.4", "roadAddress": "경기도 성남시 분당구 판교역로 1", "jibunAddress": ""}]}
+
+def make_engine(monkeypatch, handler):
+    calls = []
+
+    def fake_get(url, params=None, headers=None, **kwargs):
+        calls.append((url, dict(params or {})))
+        return handler(url, params or {})
+
+    monkeypatch.setattr(geocoding, "http_get", fake_get)
+    engine = geocoding.GeocodeEngine(vworld_key="v", naver_client_id="id", naver_client_secret="secret",
+                                     log_fn=lambda *a: None, cache=GeocodeCache(":memory:"))
+    monkeypatch.setattr(engine.rate_limiter, "acquire", lambda provider: None)
+    return engine, calls
+
+def test_cross_provider_runs_before_vworld_variants_use_up_budget(monkeypatch):
+    def handler(url, params):
+        return FakeResponse(NAVER_HIT if url == NAVER_GEOCODE_URL else VWORLD_MISS)
+
+    engine, calls = make_engine(monkeypatch, handler)
+    result, status = engine.geocode_with_status("경기도 성남시 분당구 판교역로 1 알파타워")
+    assert status == "ok"
+    assert result == (127.1, 37.4, "경기도 성남시 분당구 판교역로 1")
+    assert any(url == NAVER_GEOCODE_URL for url, _ in calls)
+    assert len(calls) <= engine.request_budget
+
+def test_timeouts_are_not_memoized_or_negative_cached(monkeypatch):
+    state = {"down": True}
+    vworld_hit = {"response": {"status": "OK", "result": {"point": {"x": "126.97", "y": "37.56"}},
+                               "refined": {"text": "서울특별시 중구 세종대로 110"}}}
+
+    def handler(url, params):
+        if state["down"]:
+            raise TimeoutError("read timed out")
+        return FakeResponse(vworld_hit)
+
+    engine, calls = make_engine(monkeypatch, handler)
+    engine.naver_client_id = engine.naver_client_secret = ""
+    address = "서울특별시 중구 세종대로 110"
+
+    assert engine.geocode_with_status(address)[1] == "failed"
+    assert engine.cache.get(GeocodeCache.make_key("vworld", address)) is None
+
+    # 서버가 복구되면 이전의 실패를 재사용하지 않고 다시 조회
+    state["down"] = False
+    result, status = engine.geocode_with_status(address)
+    assert status == "ok"
+    assert result[:2] == (126.97, 37.56)
+
+def test_negative_cache_only_after_every_provider_says_no_result(monkeypatch):
+    def handler(url, params):
+        return FakeResponse({"status": "OK", "addresses": []} if url == NAVER_GEOCODE_URL else VWORLD_MISS)
+
+    engine, _ = make_engine(monkeypatch, handler)
+    address = "서울특별시 중구 없는길 999"
+    assert engine.geocode_with_status(address)[1] == "failed"
+    assert engine.cache.get(GeocodeCache.make_key("vworld", address)) == (None, None, None)
+
+def test_vworld_suffix_search_still_runs_as_fallback_for_naver(monkeypatch):
+    vworld_hit = {"response": {"status": "OK", "result": {"items": [
+        {"point": {"x": "127.11", "y": "37.39"}, "roadAddress": "경기도 성남시 분당구 판교역로 1"}]}}}
+
+    def handler(url, params):
+        if url == NAVER_GEOCODE_URL:
+            return FakeResponse({"status": "OK", "addresses": []})
+        if url == VWORLD_SEARCH_URL and params.get("query") == "알파타워":
+            return FakeResponse(vworld_hit)
+        return FakeResponse(VWORLD_MISS)
+
+    engine, calls = make_engine(monkeypatch, handler)
+    result, status = engine.geocode_with_status("경기도 성남시 분당구 판교역로 1 알파타워", provider="naver")
+    assert status == "ok"
+    assert result == (127.11, 37.39, "경기도 성남시 분당구 판교역로 1")
+    # 전체 주소 질의(네이버 → Vworld)가 변형보다 먼저 실행됨
+    assert calls[0][0] == NAVER_GEOCODE_URL
+    assert calls[-1][0] == VWORLD_SEARCH_URL and calls[-1][1]["query"] == "알파타워"
+
+def test_query_memo_is_scoped_to_a_batch(monkeypatch):
+    state = {"found": False}
+    vworld_hit = {"response": {"status": "OK", "result": {"point": {"x": "126.97", "y": "37.56"}},
+                               "refined": {"text": "서울특별시 중구 세종대로 110"}}}
+
+    def handler(url, params):
+        return FakeResponse(vworld_hit if state["found"] else VWORLD_MISS)
+
+    engine, _ = make_engine(monkeypatch, handler)
+    engine.naver_client_id = engine.naver_client_secret = ""
+    address = "서울특별시 중구 세종대로 110"
+    assert [status for _, _, status in engine.geocode_batch([address], max_workers=1)] == ["failed"]
+
+    # 배치가 끝난 뒤의 단건 호출은 이전 배치의 '결과 없음'을 재사용하지 않음 (예: API 키 변경 후 재시도)
+    state["found"] = True
+    result, status = engine.geocode_with_status(address, retry_failed=True)
+    assert status == "ok"
+    assert result[:2] == (126.97, 37.56)
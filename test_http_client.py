@@ -0,0 +1,63 @@
+"""
+공용 HTTP 전송 계층(http_get) 재시도/백오프 테스트 (세션을 가짜로 바꿔 네트워크 없이 실행)
+"""
+import pytest
+import requests
+
+import utils.http_client as http_client
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+class FakeSession:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(http_client.time, "sleep", slept.append)
+    return slept
+
+def use_session(monkeypatch, outcomes):
+    session = FakeSession(outcomes)
+    monkeypatch.setattr(http_client, "get_session", lambda url: session)
+    return session
+
+def test_retries_429_and_takes_a_throttle_token_per_attempt(monkeypatch, sleeps):
+    session = use_session(monkeypatch, [FakeResponse(429, {"Retry-After": "2"}), FakeResponse(503), FakeResponse(200)])
+    tokens = []
+    response = http_client.http_get("https://example.com", retries=3, throttle=lambda: tokens.append(1))
+    assert response.status_code == 200
+    assert session.calls == 3
+    assert len(tokens) == 3
+    # Retry-After를 백오프보다 우선
+    assert sleeps[0] == 2.0
+
+def test_read_timeout_is_retried(monkeypatch, sleeps):
+    session = use_session(monkeypatch, [requests.ReadTimeout(), requests.ConnectionError(), FakeResponse(200)])
+    assert http_client.http_get("https://example.com", retries=2).status_code == 200
+    assert session.calls == 3
+    assert len(sleeps) == 2
+
+def test_gives_up_after_retries(monkeypatch, sleeps):
+    use_session(monkeypatch, [requests.ReadTimeout()] * 3)
+    with pytest.raises(requests.ReadTimeout):
+        http_client.http_get("https://example.com", retries=2)
+    use_session(monkeypatch, [FakeResponse(500)] * 2)
+    assert http_client.http_get("https://example.com", retries=1).status_code == 500
+
+def test_backoff_is_capped(monkeypatch):
+    monkeypatch.setattr(http_client, "HTTP_BACKOFF_MAX", 1.5)
+    assert all(0 <= http_client._backoff_delay(10) <= 1.5 for _ in range(20))
+    assert http_client._backoff_delay(0, "999") == 1.5
@@ -0,0 +1,41 @@
+"""
+로그 버퍼(LogSink) 테스트: 용량 초과 시 생략 줄 수, 레벨 필터, 파일 기록
+"""
+from utils.log_sink import LogSink
+
+def messages(lines):
+    return [line.split("] ", 2)[-1] if not line.startswith("...") else line for line, _ in lines]
+
+def test_overflow_drops_oldest_and_reports_count():
+    sink = LogSink(capacity=3)
+    for i in range(5):
+        sink.emit(f"m{i}")
+    lines = sink.drain()
+    assert lines[0] == ("... 로그 2줄 생략 ...", "info")
+    assert messages(lines[1:]) == ["m2", "m3", "m4"]
+    # 생략 수는 한 번만 알림
+    sink.emit("m5")
+    assert messages(sink.drain()) == ["m5"]
+    assert sink.drain() == []
+
+def test_level_filter_for_screen_buffer():
+    sink = LogSink(level="info")
+    sink.emit("hidden", "debug")
+    sink.emit("shown", "info")
+    sink.emit("bad", "error")
+    lines = sink.drain()
+    assert messages(lines) == ["shown", "bad"]
+    assert [level for _, level in lines] == ["info", "error"]
+    sink.set_level("debug")
+    sink.emit("now shown", "debug")
+    assert messages(sink.drain()) == ["now shown"]
+
+def test_file_gets_debug_lines_filtered_from_screen(tmp_path):
+    path = tmp_path / "app.log"
+    sink = LogSink(level="error", file_path=str(path), file_level="debug")
+    sink.emit("detail", "debug")
+    sink.emit("failure", "error")
+    sink.close()
+    text = path.read_text(encoding="utf-8")
+    assert "[DEBUG] detail" in text and "[ERROR] failure" in text
+    assert messages(sink.drain()) == ["failure"]
@@ -0,0 +1,38 @@
+"""
+지도 이미지 디스크 캐시(MapImageCache) 테스트: 용량 제한과 LRU 순서, 재실행 후 순서 유지
+"""
+import os
+
+from utils.map_cache import MapImageCache, static_map_key
+
+def test_byte_cap_evicts_least_recently_used(tmp_path):
+    cache = MapImageCache(str(tmp_path), max_bytes=250)
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    assert cache.get("a") == b"a" * 100
+    cache.put("c", b"c" * 100)
+    # a를 다시 읽었으므로 b가 제거됨
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["bytes"] == 200
+    assert len([n for n in os.listdir(tmp_path) if n.endswith(".img")]) == 2
+
+def test_replacing_a_key_updates_size(tmp_path):
+    cache = MapImageCache(str(tmp_path), max_bytes=1000)
+    cache.put("a", b"x" * 300)
+    cache.put("a", b"y" * 10)
+    assert cache.stats()["bytes"] == 10 and cache.get("a") == b"y" * 10
+
+def test_reopen_keeps_lru_order_and_applies_new_cap(tmp_path):
+    cache = MapImageCache(str(tmp_path), max_bytes=1000)
+    for key in ("old", "new"):
+        cache.put(key, b"z" * 100)
+    os.utime(os.path.join(str(tmp_path), MapImageCache._name("old")), (1, 1))
+    reopened = MapImageCache(str(tmp_path), max_bytes=150)
+    assert reopened.get("old") is None and reopened.get("new") == b"z" * 100
+
+def test_static_map_key_depends_on_view():
+    key = static_map_key("naver", (37.5, 127.0), 12, (800, 800), "basic")
+    assert key == static_map_key("naver", (37.5, 127.0), 12.0, (800, 800), "basic")
+    assert key != static_map_key("naver", (37.5, 127.0), 13, (800, 800), "basic")
@@ -0,0 +1,46 @@
+"""
+오프라인 타일 소스 테스트: MBTiles의 TMS 행 번호 뒤집기, 타일 폴더, 경로 판별
+"""
+import sqlite3
+
+import pytest
+
+from renderer.offline_tiles import DirectoryTileSource, MBTilesSource, open_offline_source
+
+def make_mbtiles(path, tiles, fmt="png"):
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+    conn.execute("CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)")
+    conn.execute("INSERT INTO metadata VALUES ('format', ?)", (fmt,))
+    conn.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?)", tiles)
+    conn.commit()
+    conn.close()
+    return str(path)
+
+def test_mbtiles_flips_xyz_row_to_tms(tmp_path):
+    # z=3에서 XYZ y=1은 TMS 행 2**3 - 1 - 1 = 6
+    path = make_mbtiles(tmp_path / "map.mbtiles", [(3, 5, 6, b"tile-5-1"), (3, 5, 1, b"tile-5-6")])
+    source = MBTilesSource(path)
+    assert source.fetch(3, 5, 1) == b"tile-5-1"
+    assert source.fetch(3, 5, 6) == b"tile-5-6"
+    assert source.fetch(3, 4, 1) is None
+    assert source.metadata["format"] == "png" and not source.cacheable
+
+def test_vector_mbtiles_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        MBTilesSource(make_mbtiles(tmp_path / "vector.mbtiles", [], fmt="pbf"))
+
+def test_directory_source_and_path_detection(tmp_path):
+    (tmp_path / "7" / "109").mkdir(parents=True)
+    (tmp_path / "7" / "109" / "49.jpg").write_bytes(b"jpg-tile")
+    source = open_offline_source(str(tmp_path))
+    assert isinstance(source, DirectoryTileSource)
+    assert source.fetch(7, 109, 49) == b"jpg-tile"
+    assert source.fetch(7, 109, 50) is None
+
+    mbtiles = make_mbtiles(tmp_path / "map.mbtiles", [])
+    assert isinstance(open_offline_source(mbtiles), MBTilesSource)
+    with pytest.raises(FileNotFoundError):
+        open_offline_source(str(tmp_path / "missing.mbtiles"))
+    with pytest.raises(ValueError):
+        open_offline_source("")
@@ -0,0 +1,27 @@
+"""
+유휴 시간 프리페처(ViewPrefetcher) 예측 테스트
+"""
+from config import MAP_CACHE_SNAP_PX
+from renderer.prefetch import ViewPrefetcher
+from utils.geo_utils import snap_center
+from utils.map_cache import MapImageCache
+
+def test_naver_predictions_use_the_static_map_grid(tmp_path):
+    prefetcher = ViewPrefetcher(MapImageCache(str(tmp_path), 1024 * 1024))
+    center = (37.566531, 126.978012)
+    views = prefetcher.predict(center, 12.4, "naver")
+    assert [z for _, z in views] == [13, 11]
+    # 실제 요청(BasemapFetcher._fetch_naver)과 같은 격자 중심이므로 디스크 캐시 키가 일치
+    for c, z in views:
+        assert c == snap_center(center, z, MAP_CACHE_SNAP_PX)
+        assert snap_center(c, z, MAP_CACHE_SNAP_PX) == c
+
+def test_pan_and_zoom_trend(tmp_path):
+    prefetcher = ViewPrefetcher(MapImageCache(str(tmp_path), 1024 * 1024))
+    assert prefetcher.predict((37.5, 127.0), 12.0) == [((37.5, 127.0), 13), ((37.5, 127.0), 11)]
+    prefetcher._history.append(((37.5, 127.0), 12.0))
+    # 동쪽으로 이동 중이면 같은 방향으로 한 번 더 이동한 뷰를 먼저 예측 (Vworld 타일은 중심을 맞추지 않음)
+    (pan_center, pan_zoom), *_ = prefetcher.predict((37.5, 127.01), 12.0)
+    assert pan_zoom == 12 and abs(pan_center[1] - 127.02) < 1e-4 and abs(pan_center[0] - 37.5) < 1e-4
+    # 줌을 키우는 중이면 다음 정수 줌만 예측
+    assert prefetcher.predict((37.5, 127.0), 12.6) == [((37.5, 127.0), 13)]
@@ -0,0 +1,39 @@
+"""
+지오코딩 전 전처리(prepare_chunk) 테스트
+"""
+from utils.preprocess import prepare_chunk
+
+def test_non_finite_order_falls_back_to_row_number():
+    columns = ["장소명", "주소", "순서"]
+    records = [
+        (2, {"장소명": "a", "주소": "서울특별시 중구 세종대로 110", "순서": "inf"}),
+        (3, {"장소명": "b", "주소": "부산광역시 해운대구 우동 1", "순서": float("-inf")}),
+        (4, {"장소명": "c", "주소": "대구광역시 중구 동인동 1", "순서": 7}),
+    ]
+    chunk = prepare_chunk(records, columns)
+    orders = [row[4] for row in chunk.rows]
+    assert orders == [2, 3, 7]
+    assert chunk.order_fallbacks == 2
+
+def test_keys_identities_known_rows_and_rejections():
+    columns = ["장소명", "주소"]
+    records = [
+        (2, {"장소명": "a", "주소": "서울특별시 중구 세종대로 110"}),
+        (3, {"장소명": "b", "주소": None}),
+        (4, {"장소명": "a", "주소": "서울특별시 중구 세종대로 110"}),
+        (5, {"장소명": "c", "주소": "서울특별시 중구 세종대로 110"}),
+        (6, {"장소명": "d", "주소": "부산광역시 해운대구 우동 1"}),
+    ]
+    first = prepare_chunk(records, columns)
+    assert first.rejected == [(3, "주소 없음")]
+    assert [row[0] for row in first.rows] == [2, 4, 5, 6]
+    assert first.row_keys == [0, 0, 0, 1] and len(first.keys) == 2
+    # 같은 주소·장소명은 같은 식별자, 장소명이 다르면 다른 식별자
+    ids = first.identities
+    assert ids[0] == ids[1] and ids[0] != ids[2]
+
+    # 세션에 'a' 한 개가 있으면 첫 'a' 행만 조회에서 제외
+    known = {ids[0]: 1}
+    again = prepare_chunk(records, columns, known=known)
+    assert again.row_keys == [-1, 0, 0, 1]
+    assert known[ids[0]] == 0
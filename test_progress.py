@@ -0,0 +1,53 @@
+"""
+진행률 추적(ProgressTracker) 테스트: 속도·남은 시간, 단계 구간, 완료 후 API 호출 무시
+"""
+import pytest
+
+import utils.progress as progress
+from utils.progress import ProgressTracker, format_progress
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [50.0]
+    monkeypatch.setattr(progress.time, "monotonic", lambda: now[0])
+    return now
+
+def test_eta_follows_recent_rate(clock):
+    tracker = ProgressTracker(window_s=5.0)
+    tracker.start_phase("주소 변환", 100, span=(0, 50))
+    clock[0] += 2
+    tracker.advance(20)
+    snap = tracker.snapshot()
+    assert snap["rate"] == pytest.approx(10.0)
+    assert snap["eta"] == pytest.approx(8.0)
+    assert snap["percent"] == pytest.approx(10.0)
+
+    # 속도가 떨어지면 창(window_s)이 지난 표본은 버려지고 남은 시간이 늘어남
+    for _ in range(4):
+        clock[0] += 2
+        tracker.advance(2)
+        snap = tracker.snapshot()
+    assert snap["rate"] == pytest.approx(1.0)
+    assert snap["eta"] == pytest.approx(72.0)
+    assert "남은 시간 1분 12초" in format_progress(snap)
+
+def test_finish_phase_fills_span_and_ignores_late_api_calls(clock):
+    tracker = ProgressTracker()
+    assert tracker.snapshot() is None
+    tracker.start_phase("지도 생성", 1, span=(50, 100), unit="단계")
+    tracker.add_api_calls(2)
+    assert tracker.snapshot()["percent"] == pytest.approx(50.0)
+    tracker.finish_phase()
+    tracker.add_api_calls(5)
+    snap = tracker.snapshot()
+    assert snap["finished"] and snap["percent"] == pytest.approx(100.0)
+    assert snap["api_calls"] == 2 and snap["eta"] is None
+    assert format_progress(snap).startswith("지도 생성 완료: 1단계, API 2회")
+
+def test_hit_rate_counts_only_cache_lookups(clock):
+    tracker = ProgressTracker()
+    tracker.start_phase("주소 변환", 4)
+    tracker.advance(hit=True)
+    tracker.advance(hit=False)
+    tracker.advance()
+    assert tracker.snapshot()["hit_rate"] == pytest.approx(0.5)
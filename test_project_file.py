@@ -0,0 +1,44 @@
+"""
+프로젝트 파일(.emap) 저장/열기 왕복 테스트
+"""
+import json
+import zipfile
+
+import pytest
+from PIL import Image
+
+from utils.project_file import PROJECT_VERSION, ProjectFile, save_project
+
+STATE = {"center": [37.5665, 126.978], "zoom": 12.5, "api_center": [37.5665, 126.978], "api_zoom": 12,
+         "provider": "vworld", "type_colors": {"A": "#ff0000"}, "pin_size": "보통", "font_size": 12}
+
+def test_round_trip_with_basemap(tmp_path):
+    path = str(tmp_path / "작업.emap")
+    places = [
+        {"lon": 126.978, "lat": 37.5665, "name": "시청", "addr": "서울특별시 중구 세종대로 110", "type": "B",
+         "order": 1, "label_dir": "right", "visible": False, "success_idx": 1, "key": "k1", "sheet": "시트1"},
+        # 빠진 필드는 기본값으로 저장
+        {"lon": 129.07, "lat": 35.18, "name": "부산", "order": 2},
+    ]
+    basemap = Image.new("RGBA", (8, 4), (10, 20, 30, 255))
+    save_project(path, STATE, places, basemap)
+
+    project = ProjectFile(path)
+    assert project.get("zoom") == 12.5 and project.get("type_colors") == {"A": "#ff0000"}
+    assert project.places[0] == places[0]
+    assert project.places[1]["type"] == "A" and project.places[1]["label_dir"] == "top"
+    assert project.places[1]["visible"] is True and project.places[1]["addr"] is None
+    img = project.basemap()
+    assert img.size == (8, 4) and img.getpixel((0, 0)) == (10, 20, 30, 255)
+    assert not (tmp_path / "작업.emap.tmp").exists()
+
+def test_without_basemap_and_newer_version_is_rejected(tmp_path):
+    path = str(tmp_path / "p.emap")
+    save_project(path, STATE, [])
+    project = ProjectFile(path)
+    assert project.places == [] and project.basemap() is None
+
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("project.json", json.dumps({"version": PROJECT_VERSION + 1}))
+    with pytest.raises(ValueError):
+        ProjectFile(path)
@@ -0,0 +1,60 @@
+"""
+프로바이더별 QPS 제한(TokenBucket, ProviderRateLimiter) 테스트 (가짜 시계로 실제 대기 없이 실행)
+"""
+import pytest
+
+import utils.rate_limiter as rate_limiter
+from utils.rate_limiter import ProviderRateLimiter, TokenBucket
+
+@pytest.fixture
+def clock(monkeypatch):
+    # 시각과 rate는 2의 거듭제곱 단위로 맞춰 부동소수점 오차 없이 대기 시간을 계산
+    now = [100.0]
+    slept = []
+
+    def sleep(sec):
+        slept.append(sec)
+        now[0] += sec
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleep)
+    return now, slept
+
+def test_burst_then_steady_rate(clock):
+    now, slept = clock
+    bucket = TokenBucket(rate=4, burst=3)
+    start = now[0]
+    for _ in range(3):
+        bucket.acquire()
+    assert slept == []
+    for _ in range(4):
+        bucket.acquire()
+    # 버스트 이후에는 초당 4개 (4개에 1초)
+    assert now[0] - start == pytest.approx(1.0)
+
+def test_tokens_refill_up_to_capacity(clock):
+    now, slept = clock
+    bucket = TokenBucket(rate=2, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    now[0] += 60
+    bucket.acquire()
+    bucket.acquire()
+    assert slept == []
+    bucket.acquire()
+    assert sum(slept) == pytest.approx(0.5)
+
+def test_providers_have_independent_buckets(clock):
+    now, slept = clock
+    limiter = ProviderRateLimiter({"vworld": 1, "naver": 1})
+    limiter.acquire("vworld")
+    limiter.acquire("naver")
+    assert slept == []
+    limiter.acquire("vworld")
+    assert sum(slept) == pytest.approx(1.0)
+    # 설정이 없는 프로바이더와 0 이하의 rate는 제한 없음
+    slept.clear()
+    for _ in range(10):
+        limiter.acquire("offline")
+        TokenBucket(rate=0).acquire()
+    assert slept == []
@@ -0,0 +1,67 @@
+"""
+타일 엔진(TileEngine) 테스트: 메모리 LRU 재사용·제거, 실패 타일 재요청, 디스크 캐시 (네트워크 없이 가짜 소스 사용)
+"""
+from io import BytesIO
+
+from PIL import Image
+
+from config import TILE_SIZE
+from renderer.tile_engine import TileEngine
+from utils.map_cache import MapImageCache
+
+def png_bytes(color=(0, 128, 0, 255)) -> bytes:
+    buf = BytesIO()
+    Image.new("RGBA", (TILE_SIZE, TILE_SIZE), color).save(buf, format="PNG")
+    return buf.getvalue()
+
+class FakeSource:
+    layer = "fake"
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.requests = []
+        self.last_status = 200
+
+    def fetch(self, z, x, y):
+        self.requests.append((z, x, y))
+        return None if (z, x, y) in self.fail else png_bytes()
+
+def test_second_render_of_same_view_uses_memory():
+    engine, source = TileEngine(capacity=64, workers=2), FakeSource()
+    img, stats = engine.render(source, (37.5665, 126.978), 12, 512, 512)
+    assert img.size == (512, 512)
+    assert stats["fetched"] == stats["tiles"] == len(source.requests) > 0
+    _, stats = engine.render(source, (37.5665, 126.978), 12, 512, 512)
+    assert stats["cached"] == stats["tiles"] and stats["fetched"] == 0
+    assert len(source.requests) == stats["tiles"]
+
+def test_lru_evicts_least_recently_used_tile():
+    engine, source = TileEngine(capacity=2, workers=1), FakeSource()
+    a, b, c = ("fake", 5, 1, 1), ("fake", 5, 2, 1), ("fake", 5, 3, 1)
+    engine._load(source, a)
+    engine._load(source, b)
+    # 렌더링에서 a를 다시 쓰면 가장 오래 쓰지 않은 타일은 b
+    with engine._lock:
+        engine._tiles.move_to_end(a)
+    engine._load(source, c)
+    assert list(engine._tiles) == [a, c]
+
+def test_disk_cache_serves_tiles_and_failed_tiles_are_retried(tmp_path):
+    disk = MapImageCache(str(tmp_path), 10 * 1024 * 1024)
+    engine = TileEngine(capacity=64, workers=2, disk_cache=disk)
+    source = FakeSource()
+    _, stats = engine.render(source, (37.5665, 126.978), 12, 256, 256)
+    source.fail = set(source.requests)
+    failing = source.requests[0]
+    # 메모리를 비우면 받아 둔 타일은 디스크에서 읽고, 소스에는 요청하지 않음
+    engine.clear()
+    source.requests.clear()
+    _, again = engine.render(source, (37.5665, 126.978), 12, 256, 256)
+    assert again["disk"] == stats["tiles"] and source.requests == []
+
+    fresh, bad = TileEngine(capacity=64, workers=1), FakeSource(fail=[failing])
+    _, stats = fresh.render(bad, (37.5665, 126.978), 12, 256, 256)
+    assert stats["failed"] == 1
+    _, stats = fresh.render(bad, (37.5665, 126.978), 12, 256, 256)
+    # 실패한 타일만 다시 요청
+    assert stats["failed"] == 1 and stats["fetched"] == 0 and bad.requests.count(failing) == 2
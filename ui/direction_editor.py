@@ -0,0 +1,86 @@
+"""
+ui/direction_editor.py - 선택한 장소의 라벨 방향을 바꾸는 공용 플로팅 리모콘
+장소마다 3×3 버튼 격자를 만들지 않고, 창 하나를 만들어 두고 ⚙️를 누른 장소에 연결해 재사용합니다.
+"""
+import tkinter as tk
+from typing import Any, Callable, Dict, Optional
+
+DIR_GRID = [
+    (0, 0, "↖", "top-left"),    (0, 1, "↑", "top"),    (0, 2, "↗", "top-right"),
+    (1, 0, "←", "left"),                                  (1, 2, "→", "right"),
+    (2, 0, "↙", "bottom-left"), (2, 1, "↓", "bottom"), (2, 2, "↘", "bottom-right"),
+]
+
+class DirectionEditor:
+    """
+    on_change(item, direction): 방향 버튼 클릭 시 호출 (item["label_dir"]은 이미 갱신됨)
+    창은 처음 열 때 한 번만 생성됩니다.
+    """
+
+    def __init__(self, master: tk.Misc, on_change: Callable[[Dict[str, Any], str], None]):
+        self.master = master
+        self.on_change = on_change
+        self.item: Optional[Dict[str, Any]] = None
+        self._window: Optional[tk.Toplevel] = None
+        self._btns: Dict[str, tk.Button] = {}
+
+    def _build(self) -> tk.Toplevel:
+        window = tk.Toplevel(self.master)
+        window.withdraw()
+        window.overrideredirect(True)
+        window.transient(self.master)
+        frame = tk.Frame(window, bg="#f8f9fa", bd=1, relief="solid")
+        frame.pack()
+        inner_grid = tk.Frame(frame, bg="#f8f9fa")
+        inner_grid.pack(padx=5, pady=2)
+        for gr, gc, sym, dirval in DIR_GRID:
+            btn = tk.Button(inner_grid, text=sym, width=2, font=("Malgun Gothic", 9),
+                            relief="flat", bd=0, bg="#f8f9fa",
+                            command=lambda dv=dirval: self._select(dv)) # type: ignore
+            btn.grid(row=gr, column=gc, padx=2, pady=2)
+            self._btns[dirval] = btn
+        # 가운데 칸은 닫기 버튼
+        tk.Button(inner_grid, text="✕", width=2, font=("Malgun Gothic", 9), relief="flat", bd=0,
+                  bg="#f8f9fa", fg="#888888", command=self.hide).grid(row=1, column=1, padx=2, pady=2)
+        window.bind("<Escape>", lambda e: self.hide())
+        return window
+
+    def is_open_for(self, item: Dict[str, Any]) -> bool:
+        return self.item is item and self._window is not None and bool(self._window.winfo_viewable())
+
+    def toggle(self, item: Dict[str, Any], anchor: tk.Widget):
+        """같은 장소면 닫고, 다른 장소면 그 장소에 연결하여 anchor 아래에 엽니다."""
+        if self.is_open_for(item):
+            self.hide()
+        else:
+            self.show(item, anchor)
+
+    def show(self, item: Dict[str, Any], anchor: tk.Widget):
+        if self._window is None:
+            self._window = self._build()
+        self.item = item
+        self._window.geometry(f"+{anchor.winfo_rootx() - 60}+{anchor.winfo_rooty() + anchor.winfo_height()}")
+        self._window.deiconify()
+        self._window.lift()
+        self.refresh()
+
+    def hide(self):
+        self.item = None
+        if self._window is not None:
+            self._window.withdraw()
+
+    def refresh(self):
+        """현재 label_dir에 맞는 버튼만 활성(파란 배경) 표시"""
+        cur = self.item.get("label_dir", "top") if self.item else None
+        for dirval, btn in self._btns.items():
+            if dirval == cur:
+                btn.configure(bg="#1A3A8F", fg="white", relief="flat")
+            else:
+                btn.configure(bg="#f8f9fa", fg="#333333", relief="flat")
+
+    def _select(self, direction: str):
+        if self.item is None:
+            return
+        self.item["label_dir"] = direction
+        self.refresh()
+        self.on_change(self.item, direction)
@@ -0,0 +1,171 @@
+"""
+ui/place_list.py - 수만 개의 장소도 가볍게 표시하는 가상화 사이드바 목록
+화면에 보이는 행 수만큼의 위젯만 만들어 두고, 스크롤할 때 같은 위젯에 다른 장소 데이터를 다시 채웁니다.
+"""
+import tkinter as tk
+from typing import Any, Callable, Dict, List, Optional
+
+import ttkbootstrap as tb # type: ignore
+
+from config import DIR_ICON_MAP
+
+ROW_HEIGHT = 30
+
+class _PlaceRow:
+    """재사용되는 한 줄의 위젯 묶음 (색상 표시, 표시 토글, 방향 아이콘, 설정 버튼)"""
+
+    def __init__(self, owner: "VirtualPlaceList"):
+        self.owner = owner
+        self.item: Optional[Dict[str, Any]] = None
+        self.var = tk.BooleanVar(value=True)
+
+        self.frame = tb.Frame(owner.viewport)
+        self.color_lbl = tk.Label(self.frame, text="  ", width=1, relief="flat")
+        self.color_lbl.pack(side=tk.LEFT, padx=(0, 4), pady=3)
+        self.check = tb.Checkbutton(self.frame, variable=self.var, command=self._on_toggle,
+                                    bootstyle="secondary-round-toggle")
+        self.check.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.summary_lbl = tb.Label(self.frame, text="↑", font=("Malgun Gothic", 10, "bold"), foreground="#1A3A8F")
+        self.summary_lbl.pack(side=tk.LEFT, padx=5)
+        self.edit_btn = tb.Button(self.frame, text="⚙️", width=3, bootstyle="link-secondary", command=self._on_edit)
+        self.edit_btn.pack(side=tk.LEFT, padx=2)
+
+        for w in (self.frame, self.color_lbl, self.check, self.summary_lbl, self.edit_btn):
+            owner._bind_wheel(w)
+
+    def bind_item(self, item: Dict[str, Any], y: int):
+        """이 줄에 장소 데이터를 채우고 y 위치에 배치합니다."""
+        self.item = item
+        self.var.set(bool(item.get("visible", True)))
+        self.color_lbl.configure(bg=self.owner.color_fn(item.get("type", "A")))
+        self.check.configure(text=f"{item.get('success_idx', '')}. {item.get('name', '')}")
+        self.summary_lbl.configure(text=DIR_ICON_MAP.get(item.get("label_dir", "top"), "↑"))
+        self.frame.place(x=4, y=y, relwidth=1.0, width=-8, height=ROW_HEIGHT)
+
+    def hide(self):
+        self.item = None
+        self.frame.place_forget()
+
+    def _on_toggle(self):
+        if self.item is not None:
+            self.item["visible"] = self.var.get()
+            self.owner.on_toggle(self.item)
+
+    def _on_edit(self):
+        if self.item is not None:
+            self.owner.on_edit(self.item, self.edit_btn)
+
+class VirtualPlaceList(tb.Frame):
+    """
+    장소 데이터 목록(dict 리스트)을 그대로 모델로 사용하는 가상화 목록 위젯입니다.
+    행 위젯은 화면 높이만큼만 생성되어 재사용되므로 목록 길이와 무관하게 로딩 시간과 메모리가 일정합니다.
+    on_toggle(item): 표시 여부 변경 시 호출 (item["visible"]은 이미 갱신됨)
+    on_edit(item, anchor): ⚙️ 버튼 클릭 시 호출
+    color_fn(type): 타입별 색상 코드를 반환
+    """
+
+    def __init__(self, master, items: List[Dict[str, Any]],
+                 on_toggle: Callable[[Dict[str, Any]], None],
+                 on_edit: Callable[[Dict[str, Any], tk.Widget], None],
+                 color_fn: Callable[[str], str], **kwargs):
+        super().__init__(master, **kwargs)
+        self.items = items
+        self.on_toggle = on_toggle
+        self.on_edit = on_edit
+        self.color_fn = color_fn
+        self.top = 0.0          # 목록 맨 위에서부터 스크롤된 픽셀 수
+        self._rows: List[_PlaceRow] = []
+        self._redraw_pending = False
+
+        self.scrollbar = tb.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar, bootstyle="round")
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.viewport = tb.Frame(self)
+        self.viewport.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+        self.viewport.bind("<Configure>", lambda e: self.refresh())
+        self._bind_wheel(self.viewport)
+
+    # ── 모델 ──────────────────────────────────────────────────────────────
+    def set_items(self, items: List[Dict[str, Any]]):
+        """목록 모델을 교체하고 맨 위로 스크롤합니다."""
+        self.items = items
+        self.top = 0.0
+        self.refresh()
+
+    def refresh(self):
+        """현재 스크롤 위치의 행들을 다시 채웁니다. (여러 번 호출되어도 한 번만 그림)"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw)
+
+    def scroll_to(self, item: Dict[str, Any]):
+        """해당 장소가 보이도록 스크롤합니다."""
+        try:
+            idx = self.items.index(item)
+        except ValueError:
+            return
+        height = self.viewport.winfo_height()
+        y = idx * ROW_HEIGHT
+        if y < self.top:
+            self.top = y
+        elif y + ROW_HEIGHT > self.top + height:
+            self.top = y + ROW_HEIGHT - height
+        self.refresh()
+
+    # ── 그리기 ────────────────────────────────────────────────────────────
+    def _content_height(self) -> int:
+        return len(self.items) * ROW_HEIGHT
+
+    def _redraw(self):
+        self._redraw_pending = False
+        height = max(self.viewport.winfo_height(), 1)
+        total = self._content_height()
+        self.top = max(0.0, min(self.top, max(total - height, 0)))
+
+        # 화면을 채우는 데 필요한 만큼만 행 위젯을 만들고, 이후에는 재사용
+        needed = height // ROW_HEIGHT + 2
+        while len(self._rows) < needed:
+            self._rows.append(_PlaceRow(self))
+
+        first = int(self.top // ROW_HEIGHT)
+        offset = int(self.top - first * ROW_HEIGHT)
+        for slot, row in enumerate(self._rows):
+            idx = first + slot
+            if slot < needed and idx < len(self.items):
+                row.bind_item(self.items[idx], slot * ROW_HEIGHT - offset)
+            else:
+                row.hide()
+
+        if total <= height:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + height) / total)
+
+    # ── 스크롤 ────────────────────────────────────────────────────────────
+    def _scroll_by(self, pixels: float):
+        self.top += pixels
+        self.refresh()
+
+    def _on_scrollbar(self, action, *args):
+        height = max(self.viewport.winfo_height(), 1)
+        if action == "moveto":
+            self.top = float(args[0]) * self._content_height()
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            self._scroll_by(amount * (height if unit == "pages" else ROW_HEIGHT))
+            return
+        self.refresh()
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            delta = -1
+        elif getattr(event, "num", None) == 5:
+            delta = 1
+        else:
+            # Windows는 120 단위, macOS는 1 단위 delta
+            delta = -1 if event.delta > 0 else 1
+        self._scroll_by(delta * ROW_HEIGHT * 3)
+
+    def _bind_wheel(self, widget: tk.Widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
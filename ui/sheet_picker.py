@@ -0,0 +1,58 @@
+"""
+ui/sheet_picker.py - 여러 시트가 있는 통합 문서에서 불러올 시트와 시트별 그룹(타입)을 고르는 대화상자
+그룹 이름은 핀 색상 구분에 쓰이며, 같은 그룹 이름을 적은 시트는 한 색상으로 묶입니다.
+"""
+import tkinter as tk
+from typing import List, Optional, Tuple
+
+import ttkbootstrap as tb # type: ignore
+
+def ask_sheets(master: tk.Misc, sheets: List[str]) -> Optional[List[Tuple[str, str]]]:
+    """
+    시트 선택 창을 모달로 띄우고 [(시트 이름, 그룹 이름), ...]을 시트 순서대로 반환합니다.
+    취소하거나 아무 시트도 고르지 않으면 None
+    """
+    win = tk.Toplevel(master)
+    win.title("불러올 시트 선택")
+    win.resizable(False, True)
+    win.transient(master)
+    win.grab_set()
+
+    tb.Label(win, text=f"시트 {len(sheets)}개가 있습니다. 함께 불러올 시트와 그룹(핀 색상)을 지정하세요.",
+             font=("Malgun Gothic", 9)).pack(anchor="w", padx=12, pady=(12, 6))
+
+    body = tb.Frame(win)
+    body.pack(fill=tk.BOTH, expand=True, padx=12)
+    tb.Label(body, text="시트", font=("Malgun Gothic", 9, "bold")).grid(row=0, column=0, sticky="w")
+    tb.Label(body, text="그룹", font=("Malgun Gothic", 9, "bold")).grid(row=0, column=1, sticky="w", padx=(12, 0))
+
+    rows: List[Tuple[str, tk.BooleanVar, tk.StringVar]] = []
+    for r, name in enumerate(sheets, start=1):
+        use_var = tk.BooleanVar(value=True)
+        group_var = tk.StringVar(value=name)
+        tb.Checkbutton(body, text=name, variable=use_var).grid(row=r, column=0, sticky="w", pady=2)
+        tb.Combobox(body, textvariable=group_var, values=sheets, width=16).grid(row=r, column=1, padx=(12, 0), pady=2)
+        rows.append((name, use_var, group_var))
+
+    result: List[Optional[List[Tuple[str, str]]]] = [None]
+
+    def set_all(value: bool):
+        for _, use_var, _ in rows:
+            use_var.set(value)
+
+    def ok():
+        chosen = [(name, group_var.get().strip() or name) for name, use_var, group_var in rows if use_var.get()]
+        result[0] = chosen or None
+        win.destroy()
+
+    btns = tb.Frame(win)
+    btns.pack(fill=tk.X, padx=12, pady=12)
+    tb.Button(btns, text="전체 선택", bootstyle="link", command=lambda: set_all(True)).pack(side=tk.LEFT)
+    tb.Button(btns, text="전체 해제", bootstyle="link", command=lambda: set_all(False)).pack(side=tk.LEFT)
+    tb.Button(btns, text="취소", bootstyle="secondary", command=win.destroy).pack(side=tk.RIGHT)
+    tb.Button(btns, text="불러오기", bootstyle="primary", command=ok).pack(side=tk.RIGHT, padx=(0, 6))
+    win.bind("<Return>", lambda e: ok())
+    win.bind("<Escape>", lambda e: win.destroy())
+
+    master.wait_window(win)
+    return result[0]
@@ -0,0 +1,254 @@
+"""
+utils/address_index.py - 도로명주소 DB 기반 오프라인 주소 색인 (네트워크 없이 지오코딩)
+
+색인 파일 구조 (메모리 매핑하여 이진 탐색):
+    MAGIC | 레코드 수(uint32) | 레코드 오프셋 배열(uint32 × N) | 정렬된 레코드들
+    레코드 = "도로명 건물번호\\t경도\\t위도\\t전체 주소\\n" (UTF-8, 키 바이트 순 정렬)
+
+사용법:
+    python -m utils.address_index build <위치정보요약DB 폴더 또는 entrc_*.txt ...> [-o address_index.bin]
+    python -m utils.address_index lookup address_index.bin "서울 중구 세종대로 110"
+"""
+import argparse
+import glob
+import heapq
+import mmap
+import os
+import re
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from utils.address_normalizer import normalize_address
+from utils.geo_utils import utmk_to_wgs84
+
+MAGIC = b"EMAPIDX1"
+_HEADER = struct.Struct("<I")
+
+# 위치정보요약DB(entrc_*.txt) 컬럼 위치 ('|' 구분)
+COL_SIDO, COL_SIGUNGU, COL_ROAD, COL_UNDERGROUND, COL_MAIN_NO, COL_SUB_NO, COL_X, COL_Y = 3, 4, 7, 8, 9, 10, 16, 17
+
+_NUMBER_RE = re.compile(r"^\d+(-\d+)?$")
+
+def _road_key(tokens: List[str]) -> Optional[Tuple[int, str]]:
+    """토큰 목록에서 '도로명 건물번호' 쌍을 찾아 (도로명 위치, 키)를 반환합니다."""
+    for i in range(len(tokens) - 1):
+        road = tokens[i]
+        if (road.endswith("로") or road.endswith("길")) and _NUMBER_RE.match(tokens[i + 1]):
+            return i, f"{road} {tokens[i + 1]}"
+    return None
+
+def iter_entrance_records(path: str, encoding: str = "cp949") -> Iterator[Tuple[str, float, float, str]]:
+    """위치정보요약DB 텍스트 파일에서 (키, 경도, 위도, 전체 주소)를 읽습니다."""
+    with open(path, "r", encoding=encoding, errors="replace") as f:
+        for line in f:
+            cols = line.rstrip("\r\n").split("|")
+            if len(cols) <= COL_Y:
+                continue
+            try:
+                x, y = float(cols[COL_X]), float(cols[COL_Y])
+            except ValueError:
+                continue
+            main_no, sub_no = cols[COL_MAIN_NO].strip(), cols[COL_SUB_NO].strip()
+            number = main_no if sub_no in ("", "0") else f"{main_no}-{sub_no}"
+            road = cols[COL_ROAD].strip()
+            if not road or not main_no:
+                continue
+            underground = "지하 " if cols[COL_UNDERGROUND].strip() == "1" else ""
+            full = normalize_address(f"{cols[COL_SIDO]} {cols[COL_SIGUNGU]} {road} {underground}{number}")
+            lon, lat = utmk_to_wgs84(x, y)
+            yield f"{road} {number}", lon, lat, full
+
+def _write_run(lines: List[bytes], folder: str, runs: List[str]):
+    # 같은 (키, 주소)는 입력 순서를 유지하도록 안정 정렬
+    lines.sort(key=_run_sort_key)
+    path = os.path.join(folder, f"run{len(runs)}")
+    with open(path, "wb") as f:
+        f.writelines(lines)
+    runs.append(path)
+
+def _run_sort_key(line: bytes) -> bytes:
+    # 정렬용 줄은 "키\t주소\t경도\t위도" (탭이 키·주소의 어떤 글자보다 작으므로 키 순서와 일치)
+    return line.rsplit(b"\t", 2)[0]
+
+def build_index(sources: Iterable[str], out_path: str, encoding: str = "cp949", log=print,
+                chunk_rows: int = 500000) -> int:
+    """
+    원본 텍스트 파일들로부터 정렬된 색인 파일을 만들고 레코드 수를 반환합니다.
+    전국 데이터도 메모리에 모두 올리지 않도록 chunk_rows행씩 정렬해 임시 파일로 쓴 뒤 병합합니다.
+    """
+    tmp_path = out_path + ".tmp"
+    folder = tempfile.mkdtemp(prefix="address_index_", dir=os.path.dirname(os.path.abspath(out_path)))
+    try:
+        runs: List[str] = []
+        lines: List[bytes] = []
+        for path in sources:
+            log(f"읽는 중: {path}")
+            for key, lon, lat, full in iter_entrance_records(path, encoding):
+                lines.append(f"{key}\t{full}\t{lon:.7f}\t{lat:.7f}\n".encode("utf-8"))
+                if len(lines) >= chunk_rows:
+                    _write_run(lines, folder, runs)
+                    lines = []
+        if lines or not runs:
+            _write_run(lines, folder, runs)
+        lines = []
+
+        # 병합하면서 레코드를 임시 파일에 쓰고 오프셋만 메모리에 둠 (레코드당 4바이트, uint32)
+        offsets, pos, last = array("I"), 0, None
+        body_path = os.path.join(folder, "records")
+        files = [open(p, "rb") for p in runs]
+        try:
+            with open(body_path, "wb") as body:
+                for line in heapq.merge(*files, key=_run_sort_key):
+                    ident = _run_sort_key(line)
+                    # 건물당 출입구가 여러 개면 첫 번째 출입구만 사용
+                    if ident == last:
+                        continue
+                    last = ident
+                    key, full, lon, lat = line.rstrip(b"\n").split(b"\t")
+                    record = b"\t".join((key, lon, lat, full)) + b"\n"
+                    offsets.append(pos)
+                    pos += len(record)
+                    body.write(record)
+        finally:
+            for f in files:
+                f.close()
+
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER.pack(len(offsets)))
+            offsets.tofile(f)
+            with open(body_path, "rb") as body:
+                shutil.copyfileobj(body, f, 1 << 20)
+        os.replace(tmp_path, out_path)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    log(f"색인 생성 완료: {len(offsets)}건 → {out_path}")
+    return len(offsets)
+
+class AddressIndex:
+    """메모리 매핑된 색인 파일에서 도로명 + 건물번호로 좌표를 찾는 로컬 지오코더"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"주소 색인 파일 형식이 아닙니다: {path}")
+        (self.count,) = _HEADER.unpack_from(self._mm, len(MAGIC))
+        self._offsets_at = len(MAGIC) + _HEADER.size
+        self._records_at = self._offsets_at + 4 * self.count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _record_start(self, i: int) -> int:
+        return self._records_at + struct.unpack_from("<I", self._mm, self._offsets_at + 4 * i)[0]
+
+    def _key_at(self, i: int) -> bytes:
+        start = self._record_start(i)
+        return self._mm[start:self._mm.find(b"\t", start)]
+
+    def _record_at(self, i: int) -> Tuple[str, float, float, str]:
+        start = self._record_start(i)
+        end = self._mm.find(b"\n", start)
+        key, lon, lat, full = self._mm[start:end].decode("utf-8").split("\t")
+        return key, float(lon), float(lat), full
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _candidates(self, key: str, prefix: bool = False, region: Sequence[str] = (),
+                    limit: int = 64) -> List[Tuple[str, float, float, str]]:
+        """
+        키와 같은(prefix=True이면 키로 시작하는) 레코드 중 region 토큰을 모두 포함하는 것들을 반환합니다.
+        지역 조건은 훑는 동안 적용하므로 전국에 같은 도로명이 많아도 limit에 걸려 맞는 지역이 잘리지 않습니다.
+        """
+        raw = key.encode("utf-8")
+        out = []
+        i = self._lower_bound(raw)
+        while i < self.count and len(out) < limit:
+            k = self._key_at(i)
+            if k != raw and not (prefix and k.startswith(raw)):
+                break
+            record = self._record_at(i)
+            if all(t in record[3].split(" ") for t in region):
+                out.append(record)
+            i += 1
+        return out
+
+    def lookup(self, address: str) -> Optional[Tuple[float, float, str]]:
+        """
+        주소를 색인에서 찾아 (경도, 위도, 전체 주소)를 반환합니다.
+        도로명+건물번호가 정확히 일치하는 레코드를 찾고, 없으면 본번만으로 근사 일치를 시도합니다.
+        도로명 앞의 시/도·시군구 토큰으로 후보를 거르며, 지역을 특정할 수 없으면 None을 반환합니다.
+        """
+        tokens = normalize_address(address).split(" ")
+        found = _road_key(tokens)
+        if not found:
+            return None
+        pos, key = found
+        region = tokens[:pos]
+
+        road, number = key.split(" ")
+        main_no = number.split("-")[0]
+        attempts = [(key, False), (f"{road} {main_no}", False), (f"{road} {main_no}-", True)]
+        for probe, prefix in attempts:
+            matches = self._candidates(probe, prefix, region)
+            if not matches:
+                continue
+            # 여러 지역의 같은 도로명이 남아 있으면 모호하므로 API로 넘김
+            regions = {c[3].split(f" {road} ")[0] for c in matches}
+            if len(regions) > 1:
+                return None
+            _, lon, lat, full = matches[0]
+            return lon, lat, full
+        return None
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+def _collect_sources(paths: List[str]) -> List[str]:
+    sources = []
+    for p in paths:
+        if os.path.isdir(p):
+            sources.extend(sorted(glob.glob(os.path.join(p, "*.txt"))))
+        else:
+            sources.append(p)
+    return sources
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="도로명주소 DB로 오프라인 주소 색인을 만들거나 조회합니다.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="위치정보요약DB 텍스트 파일로 색인 생성")
+    p_build.add_argument("sources", nargs="+", help="entrc_*.txt 파일 또는 그 파일들이 있는 폴더")
+    p_build.add_argument("-o", "--output", default="address_index.bin")
+    p_build.add_argument("--encoding", default="cp949")
+
+    p_lookup = sub.add_parser("lookup", help="색인에서 주소 조회")
+    p_lookup.add_argument("index")
+    p_lookup.add_argument("address")
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        build_index(_collect_sources(args.sources), args.output, args.encoding)
+    else:
+        index = AddressIndex(args.index)
+        print(index.lookup(args.address))
+
+if __name__ == "__main__":
+    main()
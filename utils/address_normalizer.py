@@ -0,0 +1,83 @@
+"""
+utils/address_normalizer.py - 캐시 키 및 중복 제거용 주소 정규화 모듈
+"""
+import re
+
+# 이전 실행 결과가 엑셀에 붙여 넣어진 경우 남는 문구
+ARTIFACTS = ["(위치를 찾을 수 없음)", "(실패)", "[실패]", "위치를 찾을 수 없음"]
+
+# 첫 번째 토큰(시/도)의 약칭 → 정식 명칭
+PROVINCE_ALIASES = {
+    "서울": "서울특별시", "서울시": "서울특별시",
+    "부산": "부산광역시", "부산시": "부산광역시",
+    "대구": "대구광역시", "대구시": "대구광역시",
+    "인천": "인천광역시", "인천시": "인천광역시",
+    # "광주시"는 경기도 광주시일 수 있으므로 약칭 "광주"만 광역시로 봄
+    "광주": "광주광역시",
+    "대전": "대전광역시", "대전시": "대전광역시",
+    "울산": "울산광역시", "울산시": "울산광역시",
+    "세종": "세종특별자치시", "세종시": "세종특별자치시",
+    "경기": "경기도",
+    "강원": "강원특별자치도", "강원도": "강원특별자치도",
+    "충북": "충청북도", "충남": "충청남도",
+    "전북": "전북특별자치도", "전라북도": "전북특별자치도",
+    "전남": "전라남도",
+    "경북": "경상북도", "경남": "경상남도",
+    "제주": "제주특별자치도", "제주도": "제주특별자치도",
+}
+
+# 시/도 없이 시작하는 제주 행정시는 상위 도를 붙여 줌
+PROVINCE_PREFIX_FOR_CITY = {
+    "제주시": "제주특별자치도",
+    "서귀포시": "제주특별자치도",
+}
+
+_PAREN_RE = re.compile(r"\([^()]*\)|\[[^\[\]]*\]")
+_SPACE_RE = re.compile(r"[\s　,]+")
+_DASH_RE = re.compile(r"(\d)\s*[-‐‑–—의]\s*(\d)")
+_BUNJI_RE = re.compile(r"(\d)\s*번지")
+_SAN_RE = re.compile(r"(^|\s)산\s+(\d)")
+_DETAIL_TOKEN_RE = re.compile(r"^(지하)?[Bb]?\d+층$|^\d+호$")
+
+def standardize_province(address: str) -> str:
+    """첫 토큰의 광역시/도 약칭을 정식(특별자치도 포함) 명칭으로 바꿉니다."""
+    tokens = address.split(" ")
+    if not tokens or not tokens[0]:
+        return address
+    head = tokens[0]
+    if head in PROVINCE_ALIASES:
+        tokens[0] = PROVINCE_ALIASES[head]
+    elif head in PROVINCE_PREFIX_FOR_CITY:
+        tokens.insert(0, PROVINCE_PREFIX_FOR_CITY[head])
+    return " ".join(tokens)
+
+def normalize_address(address: str) -> str:
+    """
+    주소를 정규 형태로 바꿉니다. 같은 장소를 가리키는 표기는 같은 문자열이 됩니다.
+    (공백/쉼표, 괄호 속 참고 항목, 시/도 약칭, '번지'·하이픈 등 건물번호 표기, 층/호 상세 주소)
+    """
+    address = str(address)
+    for art in ARTIFACTS:
+        address = address.replace(art, " ")
+
+    # 괄호 속 참고 항목 제거 (예: "세종대로 110 (태평로1가)")
+    prev = None
+    while prev != address:
+        prev = address
+        address = _PAREN_RE.sub(" ", address)
+
+    address = _SPACE_RE.sub(" ", address).strip()
+    if not address:
+        return ""
+
+    # 건물번호 표기 통일: "110 - 1", "110의1" → "110-1", "12번지" → "12", "산 12" → "산12"
+    address = _DASH_RE.sub(r"\1-\2", address)
+    address = _BUNJI_RE.sub(r"\1", address)
+    address = _SAN_RE.sub(r"\1산\2", address)
+
+    # 끝에 붙은 층/호 상세 주소 제거
+    tokens = address.split(" ")
+    while len(tokens) > 1 and _DETAIL_TOKEN_RE.match(tokens[-1]):
+        tokens.pop()
+
+    return standardize_province(" ".join(tokens))
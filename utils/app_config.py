@@ -0,0 +1,102 @@
+"""
+utils/app_config.py - GUI와 CLI가 공유하는 실행 경로, API 키 로더, 지오코딩 엔진 생성 모듈
+(tkinter에 의존하지 않으므로 서버 배치 작업에서도 사용 가능)
+"""
+import json
+import os
+import sys
+from typing import Dict, Optional
+from config import (
+    GEOCODE_CACHE_FILE, GEOCODE_CACHE_TTL_DAYS, GEOCODE_CACHE_MAX_ENTRIES, GEOCODE_NEGATIVE_TTL_HOURS,
+    ADDRESS_INDEX_FILE, MAP_CACHE_DIR, MAP_CACHE_MAX_MB
+)
+from utils.geocode_cache import GeocodeCache
+from utils.address_index import AddressIndex
+from utils.geocoding import GeocodeEngine
+from utils.map_cache import MapImageCache
+
+def get_app_dir() -> str:
+    """실행 파일 또는 스크립트가 위치한 디렉토리를 반환합니다."""
+    if getattr(sys, 'frozen', False):
+        # PyInstaller로 빌드된 경우 실행 파일(.exe)의 위치
+        return os.path.dirname(sys.executable)
+    # 스크립트로 실행되는 경우 (이 파일은 utils/ 아래에 있으므로 한 단계 위)
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_api_keys(app_dir: Optional[str] = None) -> Dict[str, str]:
+    """
+    보안 강화를 위해 환경 변수(.env 파일 포함)와 config.json을 병합하여 읽어옵니다.
+    우선순위: 시스템 환경 변수 > .env 파일 > config.json
+    """
+    keys = {
+        "vworld_key": os.getenv("VWORLD_API_KEY", ""),
+        "naver_client_id": os.getenv("NAVER_CLIENT_ID", ""),
+        "naver_client_secret": os.getenv("NAVER_CLIENT_SECRET", ""),
+        # 오프라인 지도 타일 경로 (MBTiles 파일 또는 타일 폴더, 키는 아니지만 같은 설정 파일에 저장)
+        "offline_tiles": os.getenv("OFFLINE_TILES", "")
+    }
+
+    # .env 파일 파싱 (환경 변수가 비어있는 항목만 채움)
+    app_dir = app_dir or get_app_dir()
+    env_path = os.path.join(app_dir, ".env")
+    if os.path.exists(env_path):
+        try:
+            with open(env_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if "=" in line and not line.startswith("#"):
+                        k, v = line.split("=", 1)
+                        k, v = k.strip(), v.strip()
+                        if k == "VWORLD_API_KEY" and not keys["vworld_key"]: keys["vworld_key"] = v
+                        elif k == "NAVER_CLIENT_ID" and not keys["naver_client_id"]: keys["naver_client_id"] = v
+                        elif k == "NAVER_CLIENT_SECRET" and not keys["naver_client_secret"]: keys["naver_client_secret"] = v
+                        elif k == "OFFLINE_TILES" and not keys["offline_tiles"]: keys["offline_tiles"] = v
+        except: pass
+
+    # config.json 로드 (여전히 비어있는 항목만 채움)
+    cfg = os.path.join(app_dir, "config.json")
+    if os.path.exists(cfg):
+        try:
+            with open(cfg, "r") as f:
+                data = json.load(f)
+                if not keys["vworld_key"]:
+                    keys["vworld_key"] = data.get("vworld_key") or data.get("api_key") or ""
+                if not keys["naver_client_id"]:
+                    keys["naver_client_id"] = data.get("naver_client_id", "")
+                if not keys["naver_client_secret"]:
+                    keys["naver_client_secret"] = data.get("naver_client_secret", "")
+                if not keys["offline_tiles"]:
+                    keys["offline_tiles"] = data.get("offline_tiles", "")
+        except: pass
+
+    return keys
+
+def create_geocode_engine(api_keys: Dict[str, str], log_fn=None, app_dir: Optional[str] = None) -> GeocodeEngine:
+    """영구 캐시와 (있다면) 오프라인 주소 색인이 연결된 지오코딩 엔진을 만듭니다."""
+    app_dir = app_dir or get_app_dir()
+    # 지오코딩 결과는 config.json 옆의 SQLite 파일에 영구 저장되어 재실행 시에도 재사용됨
+    geo_cache = GeocodeCache(os.path.join(app_dir, GEOCODE_CACHE_FILE),
+                             ttl_days=GEOCODE_CACHE_TTL_DAYS, max_entries=GEOCODE_CACHE_MAX_ENTRIES,
+                             negative_ttl_hours=GEOCODE_NEGATIVE_TTL_HOURS)
+
+    local_index = None
+    index_path = os.path.join(app_dir, ADDRESS_INDEX_FILE)
+    if os.path.exists(index_path):
+        try:
+            local_index = AddressIndex(index_path)
+            if log_fn: log_fn(f"오프라인 주소 색인 로드: {len(local_index)}건", "info")
+        except Exception as e:
+            if log_fn: log_fn(f"오프라인 주소 색인 로드 실패: {e}", "error")
+
+    return GeocodeEngine(vworld_key=api_keys.get("vworld_key", ""),
+                         naver_client_id=api_keys.get("naver_client_id", ""),
+                         naver_client_secret=api_keys.get("naver_client_secret", ""),
+                         log_fn=log_fn, cache=geo_cache, local_index=local_index)
+
+def create_map_cache(app_dir: Optional[str] = None) -> Optional[MapImageCache]:
+    """베이스 지도 디스크 캐시를 엽니다. MAP_CACHE_MAX_MB가 0 이하이거나 폴더를 만들 수 없으면 None"""
+    if MAP_CACHE_MAX_MB <= 0:
+        return None
+    try:
+        return MapImageCache(os.path.join(app_dir or get_app_dir(), MAP_CACHE_DIR), MAP_CACHE_MAX_MB * 1024 * 1024)
+    except OSError:
+        return None
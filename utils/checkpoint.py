@@ -0,0 +1,97 @@
+"""
+utils/checkpoint.py - 중단된 지오코딩 작업을 이어서 진행하기 위한 체크포인트 저장소
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# 네트워크 오류 등으로 이번에만 실패했을 수 있는 상태 (기록하지 않아 이어서 진행할 때 다시 조회)
+RETRY_STATUSES = ("failed",)
+
+def file_digest(source_path: str) -> str:
+    """파일 내용의 해시. 시트가 여러 개여도 파일은 한 번만 읽도록 호출하는 쪽에서 계산해 넘깁니다."""
+    h = hashlib.sha1()
+    with open(source_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+class GeocodeCheckpoint:
+    """
+    입력 파일 내용(해시)과 프로바이더(그리고 시트)별로 완료된 행의 결과를 JSON Lines 파일에 기록합니다.
+    기록은 일정 행 수마다 fsync까지 수행하여 앱이 비정상 종료되어도 마지막 체크포인트까지는 보존됩니다.
+    """
+
+    def __init__(self, folder: str, source_path: str, provider: str, flush_every: int = 100,
+                 sheet: Optional[str] = None, digest: Optional[str] = None):
+        self.source_path = source_path
+        self.flush_every = flush_every
+        # 시트를 지정하면 같은 파일이라도 시트마다 별도 체크포인트 (행 번호가 시트별이므로)
+        self.job_id = self._job_id(digest or file_digest(source_path),
+                                   provider if sheet is None else f"{provider}:{sheet}")
+        os.makedirs(folder, exist_ok=True)
+        self.path = os.path.join(folder, f"{self.job_id}.jsonl")
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _job_id(digest: str, provider: str) -> str:
+        """파일 내용이 같으면 경로가 바뀌어도 같은 작업으로 취급합니다."""
+        return hashlib.sha1(f"{provider}:{digest}".encode("utf-8")).hexdigest()[:20]
+
+    def load(self) -> Dict[int, Tuple[Tuple[Optional[float], Optional[float], Optional[str]], str]]:
+        """이전에 완료된 행들의 {행 번호: (결과, 상태)}를 반환합니다. 손상된 마지막 줄은 무시합니다."""
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if "i" in rec and rec.get("status") not in RETRY_STATUSES:
+                    done[int(rec["i"])] = ((rec.get("lon"), rec.get("lat"), rec.get("addr")), rec.get("status", ""))
+        return done
+
+    def start(self, total_rows: int, resume: bool):
+        """새 작업이면 기존 체크포인트를 지우고 헤더를 기록합니다."""
+        if resume and os.path.exists(self.path):
+            return
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"source": os.path.abspath(self.source_path), "rows": total_rows,
+                                "created": time.time()}, ensure_ascii=False) + "\n")
+
+    def record(self, row_idx: int, result: Tuple[Optional[float], Optional[float], Optional[str]], status: str):
+        """확정된 결과만 기록합니다. 일시적 실패(RETRY_STATUSES)는 이어서 진행할 때 다시 조회합니다."""
+        if status in RETRY_STATUSES:
+            return
+        lon, lat, addr = result
+        line = json.dumps({"i": row_idx, "lon": lon, "lat": lat, "addr": addr, "status": status}, ensure_ascii=False)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(self._buffer) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._buffer = []
+
+    def finish(self):
+        """작업이 끝나면 체크포인트 파일을 삭제합니다."""
+        with self._lock:
+            self._buffer = []
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -2,26 +2,61 @@
 utils/geo_utils.py - 좌표계 변환 및 지도 계산 유틸리티
 """
 import math
-from typing import Tuple, List
+from typing import Tuple, List, Optional, Iterable, Any
 from config import TILE_SIZE
 
+def lon_to_world_x(lon: float, zoom: float) -> float:
+    """경도를 해당 줌의 Web Mercator 전역 픽셀 x 좌표로 변환합니다. (타일 (0,0)의 왼쪽 위가 원점)"""
+    return (lon + 180.0) / 360.0 * (TILE_SIZE * (2 ** zoom))
+
+def lat_to_world_y(lat: float, zoom: float) -> float:
+    """위도를 해당 줌의 Web Mercator 전역 픽셀 y 좌표로 변환합니다."""
+    lr = math.radians(lat)
+    return (1.0 - math.log(math.tan(lr) + 1.0 / math.cos(lr)) / math.pi) / 2.0 * (TILE_SIZE * (2 ** zoom))
+
+def world_to_latlon(x: float, y: float, zoom: float) -> Tuple[float, float]:
+    """전역 픽셀 좌표를 (위도, 경도)로 되돌립니다. (lon_to_world_x / lat_to_world_y의 역변환)"""
+    size = TILE_SIZE * (2 ** zoom)
+    lon = x / size * 360.0 - 180.0
+    lat = math.degrees(math.atan(math.sinh(math.pi * (1.0 - 2.0 * y / size))))
+    return lat, lon
+
+def snap_center(center: Tuple[float, float], zoom: int, step_px: int) -> Tuple[float, float]:
+    """
+    중심 (위도, 경도)를 해당 줌에서 step_px 픽셀 격자에 맞춥니다.
+    거의 같은 뷰가 같은 중심으로 모이므로 정적 지도 캐시 키로 쓸 수 있습니다.
+    """
+    if step_px <= 1:
+        return center
+    x = round(lon_to_world_x(center[1], zoom) / step_px) * step_px
+    y = round(lat_to_world_y(center[0], zoom) / step_px) * step_px
+    lat, lon = world_to_latlon(x, y, zoom)
+    return round(lat, 6), round(lon, 6)
+
 def latlon_to_pixel(lat: float, lon: float, zoom: float, center_lat: float, center_lon: float, map_width: int, map_height: int) -> Tuple[int, int]:
     """
     WGS84 위경도를 Web Mercator 투영법을 통해 픽셀 좌표로 변환합니다.
     """
-    def lon_to_x(ln, z):
-        return (ln + 180.0) / 360.0 * (TILE_SIZE * (2 ** z))
-
-    def lat_to_y(lt, z):
-        lr = math.radians(lt)
-        return (1.0 - math.log(math.tan(lr) + 1.0 / math.cos(lr)) / math.pi) / 2.0 * (TILE_SIZE * (2 ** z))
-
-    cx = lon_to_x(center_lon, zoom)
-    cy = lat_to_y(center_lat, zoom)
-    px = lon_to_x(lon, zoom)
-    py = lat_to_y(lat, zoom)
+    cx = lon_to_world_x(center_lon, zoom)
+    cy = lat_to_world_y(center_lat, zoom)
+    px = lon_to_world_x(lon, zoom)
+    py = lat_to_world_y(lat, zoom)
     return int(map_width / 2 + (px - cx)), int(map_height / 2 + (py - cy))
 
+def view_tiles(center_lat: float, center_lon: float, zoom: int, map_width: int, map_height: int
+               ) -> Tuple[Tuple[float, float], List[Tuple[int, int]]]:
+    """
+    중심·정수 줌의 뷰를 덮는 XYZ 타일 목록을 구합니다.
+    반환값: (뷰 왼쪽 위의 전역 픽셀 좌표, [(tx, ty), ...]) - 지도 범위를 벗어나는 행은 제외, 열은 경도 방향으로 순환
+    """
+    left = lon_to_world_x(center_lon, zoom) - map_width / 2
+    top = lat_to_world_y(center_lat, zoom) - map_height / 2
+    n = 2 ** zoom
+    tx0, tx1 = int(math.floor(left / TILE_SIZE)), int(math.floor((left + map_width - 1) / TILE_SIZE))
+    ty0, ty1 = int(math.floor(top / TILE_SIZE)), int(math.floor((top + map_height - 1) / TILE_SIZE))
+    tiles = [(tx, ty) for ty in range(max(ty0, 0), min(ty1, n - 1) + 1) for tx in range(tx0, tx1 + 1)]
+    return (left, top), tiles
+
 def calculate_zoom_and_center(coords: List[Tuple[float, float]], map_width: int, map_height: int, padding: float = 0.05) -> Tuple[float, float, float]:
     """
     데이터 포인트들이 모두 포함되도록 최적의 중심점과 줌 레벨을 계산합니다.
@@ -67,6 +102,103 @@ def calculate_zoom_and_center(coords: List[Tuple[float, float]], map_width: int,
 
     return center_lat, center_lon, 7.0
 
+def coords_in_view(coords: List[Tuple[float, float]], center: Tuple[float, float], zoom: float,
+                   map_width: int, map_height: int, margin: int = 0) -> bool:
+    """모든 (lon, lat) 점이 현재 뷰의 가장자리 margin 픽셀 안쪽에 들어오는지 확인합니다."""
+    clat, clon = center
+    for lon, lat in coords:
+        px, py = latlon_to_pixel(lat, lon, zoom, clat, clon, map_width, map_height)
+        if px < margin or px > map_width - margin or py < margin or py > map_height - margin:
+            return False
+    return True
+
+def base_map_covers_view(api_center: Tuple[float, float], api_zoom: int, center: Tuple[float, float],
+                         zoom: float, map_width: int, map_height: int) -> bool:
+    """
+    api_center/api_zoom으로 받아 둔 베이스 지도를 확대·이동해서 center/zoom 뷰를 빈 곳 없이 채울 수 있는지 확인합니다.
+    (MapRenderer와 같은 방식으로 계산 - True면 지도를 다시 받지 않고 재사용 가능)
+    """
+    if int(zoom) != int(api_zoom):
+        return False
+    scale = 2.0 ** (zoom - api_zoom)
+    pixel_per_degree = (2 ** zoom * TILE_SIZE) / 360.0
+    off_x = (center[1] - api_center[1]) * pixel_per_degree * math.cos(math.radians(center[0]))
+    off_y = (center[0] - api_center[0]) * pixel_per_degree
+    return (abs(off_x) <= map_width * (scale - 1) / 2 + 1 and
+            abs(off_y) <= map_height * (scale - 1) / 2 + 1)
+
+def utmk_to_wgs84(x: float, y: float) -> Tuple[float, float]:
+    """
+    UTM-K(EPSG:5179, GRS80) 평면 좌표를 WGS84 경위도(lon, lat)로 변환합니다.
+    도로명주소 DB의 위치정보(X/Y 좌표)를 지도 좌표로 바꿀 때 사용합니다. (횡메르카토르 역변환)
+    """
+    a = 6378137.0
+    f = 1 / 298.257222101
+    k0 = 0.9996
+    lat0, lon0 = math.radians(38.0), math.radians(127.5)
+    x0, y0 = 1000000.0, 2000000.0
+
+    e2 = f * (2 - f)
+    ep2 = e2 / (1 - e2)
+
+    def meridian_arc(phi):
+        return a * ((1 - e2/4 - 3*e2**2/64 - 5*e2**3/256) * phi
+                    - (3*e2/8 + 3*e2**2/32 + 45*e2**3/1024) * math.sin(2*phi)
+                    + (15*e2**2/256 + 45*e2**3/1024) * math.sin(4*phi)
+                    - (35*e2**3/3072) * math.sin(6*phi))
+
+    m = meridian_arc(lat0) + (y - y0) / k0
+    mu = m / (a * (1 - e2/4 - 3*e2**2/64 - 5*e2**3/256))
+    e1 = (1 - math.sqrt(1 - e2)) / (1 + math.sqrt(1 - e2))
+    phi1 = (mu + (3*e1/2 - 27*e1**3/32) * math.sin(2*mu)
+            + (21*e1**2/16 - 55*e1**4/32) * math.sin(4*mu)
+            + (151*e1**3/96) * math.sin(6*mu)
+            + (1097*e1**4/512) * math.sin(8*mu))
+
+    sin1, cos1, tan1 = math.sin(phi1), math.cos(phi1), math.tan(phi1)
+    c1 = ep2 * cos1**2
+    t1 = tan1**2
+    n1 = a / math.sqrt(1 - e2 * sin1**2)
+    r1 = a * (1 - e2) / (1 - e2 * sin1**2) ** 1.5
+    d = (x - x0) / (n1 * k0)
+
+    lat = phi1 - (n1 * tan1 / r1) * (d**2/2 - (5 + 3*t1 + 10*c1 - 4*c1**2 - 9*ep2) * d**4/24
+                                     + (61 + 90*t1 + 298*c1 + 45*t1**2 - 252*ep2 - 3*c1**2) * d**6/720)
+    lon = lon0 + (d - (1 + 2*t1 + c1) * d**3/6
+                  + (5 - 2*c1 + 28*t1 - 3*c1**2 + 8*ep2 + 24*t1**2) * d**5/120) / cos1
+    return math.degrees(lon), math.degrees(lat)
+
+# 좌표 컬럼으로 인식하는 이름 (소문자 비교)
+LON_COLUMN_NAMES = ("경도", "lon", "lng", "long", "longitude")
+LAT_COLUMN_NAMES = ("위도", "lat", "latitude")
+
+# 대한민국 영역 (잘못 입력된 좌표 걸러내기용)
+KOREA_BOUNDS = (124.0, 32.5, 132.5, 39.5)  # (min_lon, min_lat, max_lon, max_lat)
+
+def find_coordinate_columns(columns: Iterable[str]) -> Optional[Tuple[str, str]]:
+    """컬럼 목록에서 (경도 컬럼, 위도 컬럼)을 찾습니다. 둘 다 있어야 반환합니다."""
+    by_lower = {str(c).strip().lower(): c for c in columns}
+    lon_col = next((by_lower[n] for n in LON_COLUMN_NAMES if n in by_lower), None)
+    lat_col = next((by_lower[n] for n in LAT_COLUMN_NAMES if n in by_lower), None)
+    if lon_col is None or lat_col is None:
+        return None
+    return lon_col, lat_col
+
+def parse_coordinate(lon_raw: Any, lat_raw: Any) -> Optional[Tuple[float, float]]:
+    """셀 값을 (경도, 위도)로 변환합니다. 비어 있거나 국내 범위를 벗어나면 None (경위도가 뒤바뀐 경우는 교정)."""
+    try:
+        lon, lat = float(lon_raw), float(lat_raw)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(lon) or math.isnan(lat):
+        return None
+    min_lon, min_lat, max_lon, max_lat = KOREA_BOUNDS
+    if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+        lon, lat = lat, lon
+        if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+            return None
+    return lon, lat
+
 def hex_to_rgba(hex_color: str, alpha: int = 140) -> Tuple[int, int, int, int]:
     """16진수 색상 코드를 RGBA 튜플로 변환합니다."""
     hex_color = hex_color.lstrip('#')
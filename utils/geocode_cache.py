@@ -0,0 +1,158 @@
+"""
+utils/geocode_cache.py - 세션 간 공유되는 지오코딩 결과 영구 캐시 (SQLite)
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Tuple, Optional, Dict
+
+class GeocodeCache:
+    """
+    프로바이더 + 주소를 키로 좌표를 저장하는 SQLite 캐시 (TTL, 용량 제한, 적중 통계 포함).
+    찾지 못한 주소는 좌표가 비어 있는 '실패 항목'으로 저장되며 더 짧은 TTL이 적용됩니다.
+    """
+
+    def __init__(self, db_path: str, ttl_days: float = 90, max_entries: int = 200000,
+                 negative_ttl_hours: float = 72):
+        self.db_path = db_path
+        self.ttl_sec = ttl_days * 86400
+        self.negative_ttl_sec = negative_ttl_hours * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # 지오코딩 워커 스레드에서도 접근하므로 잠금으로 직렬화
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            " key TEXT PRIMARY KEY, lon REAL, lat REAL, addr TEXT,"
+            " created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_geocode_accessed ON geocode(accessed)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, address: str) -> str:
+        return f"{provider}:{address}"
+
+    def _ttl_for(self, lon) -> float:
+        return self.ttl_sec if lon is not None else self.negative_ttl_sec
+
+    def get(self, key: str, include_failures: bool = True) -> Optional[Tuple[Optional[float], Optional[float], Optional[str]]]:
+        """
+        캐시된 좌표를 반환합니다. 없거나 만료되었으면 None.
+        실패 항목은 (None, None, None)으로 반환되며, include_failures=False이면 미스로 취급합니다.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT lon, lat, addr, created FROM geocode WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            lon, lat, addr, created = row
+            if now - created > self._ttl_for(lon):
+                self._conn.execute("DELETE FROM geocode WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            if lon is None:
+                if not include_failures:
+                    self.misses += 1
+                    return None
+                self.negative_hits += 1
+                return None, None, None
+            # LRU 순서 갱신도 바로 커밋 (열린 쓰기 트랜잭션이 다른 연결의 쓰기를 막지 않도록)
+            self._conn.execute("UPDATE geocode SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return lon, lat, addr
+
+    def set(self, key: str, value: Tuple[Optional[float], Optional[float], Optional[str]]):
+        lon, lat, addr = value
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode (key, lon, lat, addr, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, lon, lat, addr, now, now)
+            )
+            self._conn.commit()
+            # 매 쓰기마다 COUNT(*)를 하지 않도록 일정 간격으로만 용량 검사
+            self._writes_since_evict += 1
+            if self._writes_since_evict >= 500:
+                self._writes_since_evict = 0
+                self._evict_locked()
+
+    def set_failure(self, key: str):
+        """찾을 수 없는 주소를 실패 항목으로 기록합니다."""
+        self.set(key, (None, None, None))
+
+    def purge_failures(self) -> int:
+        """모든 실패 항목을 삭제하고 삭제된 개수를 반환합니다. (다음 로드 때 전체 폴백 재시도)"""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM geocode WHERE lon IS NULL")
+            self._conn.commit()
+            return cur.rowcount
+
+    def failure_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM geocode WHERE lon IS NULL").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT lon, created FROM geocode WHERE key = ?", (key,)).fetchone()
+        return row is not None and time.time() - row[1] <= self._ttl_for(row[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+
+    def _evict_locked(self):
+        """만료 항목을 지우고, 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+        now = time.time()
+        self._conn.execute("DELETE FROM geocode WHERE created < ?", (now - self.ttl_sec,))
+        self._conn.execute("DELETE FROM geocode WHERE lon IS NULL AND created < ?", (now - self.negative_ttl_sec,))
+        count = self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM geocode WHERE key IN (SELECT key FROM geocode ORDER BY accessed LIMIT ?)",
+                (overflow,)
+            )
+        self._conn.commit()
+
+    def evict(self):
+        with self._lock:
+            self._evict_locked()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM geocode")
+            self._conn.commit()
+            self.hits = self.misses = self.negative_hits = 0
+
+    def stats(self) -> Dict[str, float]:
+        """적중/미스 횟수와 적중률, 저장 항목 수를 반환합니다. (실패 캐시 적중은 별도 집계)"""
+        total = self.hits + self.misses + self.negative_hits
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "entries": len(self),
+            "failures": self.failure_count(),
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,126 +1,310 @@
 """
 utils/geocoding.py - 브이월드 API 연동 주소 변환 모듈 (복구 및 강화 버전)
 """
-import requests
-from typing import Tuple, Optional, Dict
-from config import VWORLD_GEOCODE_URL, VWORLD_SEARCH_URL, NAVER_GEOCODE_URL
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+import threading
+from typing import Tuple, Optional, Iterable, Iterator, Dict
+from config import (
+    VWORLD_GEOCODE_URL, VWORLD_SEARCH_URL, NAVER_GEOCODE_URL,
+    PROVIDER_QPS, GEOCODE_WORKERS, GEOCODE_REQUEST_BUDGET
+)
+from utils.geocode_cache import GeocodeCache
+from utils.rate_limiter import ProviderRateLimiter
+from utils.http_client import http_get
+from utils.address_normalizer import normalize_address, standardize_province
+from utils.address_index import AddressIndex
+
+GeoResult = Tuple[Optional[float], Optional[float], Optional[str]]
+# 쿼리 플랜의 한 단계: (프로바이더, 종류[ROAD/PARCEL/search/geocode], 질의 문자열)
+QueryStep = Tuple[str, str, str]
 
 class GeocodeEngine:
     """주소 변환 및 검색 최적화 엔진 클래스 (Vworld & Naver 지원)"""
     
-    def __init__(self, vworld_key: str = "", naver_client_id: str = "", naver_client_secret: str = "", log_fn=None):
+    def __init__(self, vworld_key: str = "", naver_client_id: str = "", naver_client_secret: str = "", log_fn=None,
+                 cache: Optional[GeocodeCache] = None, local_index: Optional[AddressIndex] = None):
         self.vworld_key = vworld_key
         self.naver_client_id = naver_client_id
         self.naver_client_secret = naver_client_secret
         self.provider = "vworld"
-        self.cache: Dict[str, Tuple[float, float, str]] = {}
+        # 캐시 파일이 지정되지 않으면 세션 한정 메모리 캐시 사용
+        self.cache = cache if cache is not None else GeocodeCache(":memory:")
         self.log_fn = log_fn
+        # 도로명주소 DB로 만든 오프라인 색인 (있으면 API보다 먼저 조회)
+        self.local_index = local_index
+        # 모든 워커 스레드가 공유하는 프로바이더별 QPS 제한
+        self.rate_limiter = ProviderRateLimiter(PROVIDER_QPS)
+        # 쿼리 플랜: 주소당 HTTP 요청 예산, 배치 내 하위 질의 메모, 주소별 호출 수 기록
+        self.request_budget = GEOCODE_REQUEST_BUDGET
+        self.request_counts: Dict[str, int] = {}
+        self.api_calls = 0
+        self._query_memo: Dict[QueryStep, GeoResult] = {}
+        self._stats_lock = threading.Lock()
+        # 워커 스레드별 상태 (일시적 네트워크 오류 발생 여부)
+        self._tls = threading.local()
+        self.batch_stats: Dict[str, int] = {"rows": 0, "unique": 0}
+        # 동시에 실행 중인 geocode_batch 수 (여러 시트를 병렬 처리할 때 메모를 서로 지우지 않도록)
+        self._active_batches = 0
 
     def _log(self, message: str, level: str = "info"):
         if self.log_fn:
             self.log_fn(message, level)
-        print(f"[{level.upper()}] {message}")
+        elif level != "debug":
+            print(f"[{level.upper()}] {message}")
 
-    def geocode(self, address: str, provider: str = None) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+    def geocode(self, address: str, provider: str = None, retry_failed: bool = False) -> GeoResult:
         """
         주소를 좌표로 변환합니다. 캐시를 먼저 확인하고 없으면 선택된 API를 호출합니다.
+        여러 워커 스레드에서 동시에 호출될 수 있으므로 self.provider를 변경하지 않습니다.
+        """
+        return self.geocode_with_status(address, provider, retry_failed)[0]
+
+    def geocode_with_status(self, address: str, provider: str = None,
+                            retry_failed: bool = False) -> Tuple[GeoResult, str]:
         """
-        if provider:
-            self.provider = provider
-            
+        geocode와 같지만 결과의 출처를 함께 반환합니다.
+        상태: "cached"(캐시 적중), "local"(오프라인 색인), "ok"(API 성공),
+              "negative"(실패 캐시 적중), "failed"(이번에 실패), "empty"(빈 주소)
+        retry_failed=True이면 실패 캐시를 무시하고 전체 폴백을 다시 시도합니다.
+        """
+        provider = provider or self.provider
+
         address = str(address).strip()
         if not address or address.lower() == "nan":
-            return None, None, None
-
-        cache_key = f"{self.provider}:{address}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-
-        # 불필요한 문구 제거
-        for art in ["(위치를 찾을 수 없음)", "(실패)", "[실패]", "위치를 찾을 수 없음"]:
-            address = address.replace(art, "").strip()
-
-        # 1. 광역시/도 이름 정규화 (특별자치도 등 대응)
-        refined_addr = self._standardize_province_name(address)
-        
-        # 2. 스마트 오케스트레이터 호출
-        lon, lat, road_addr = self._smart_search_orchestrator(refined_addr)
-        
-        # 3. 실패 시 세종시 특수 처리
-        if not lon and "세종" in refined_addr:
-            fb = refined_addr.replace("세종특별자치시", "세종").replace("세종시", "세종")
-            if fb != refined_addr:
-                lon, lat, road_addr = self._smart_search_orchestrator(fb)
-
-        # 4. 여전히 실패 시 토큰 단위 검색 시도
-        if not lon:
+            return (None, None, None), "empty"
+
+        # 1. 정규화된 주소를 캐시 키와 질의 모두에 사용 (표기만 다른 주소는 같은 항목)
+        refined_addr = normalize_address(address)
+        if not refined_addr:
+            return (None, None, None), "empty"
+        address = refined_addr
+
+        cache_key = GeocodeCache.make_key(provider, refined_addr)
+        cached = self.cache.get(cache_key, include_failures=not retry_failed)
+        if cached is None and provider == "offline":
+            # 오프라인 모드는 온라인에서 찾아 둔 결과도 사용 (실패 기록은 제외)
+            for online in ("vworld", "naver"):
+                cached = self.cache.get(GeocodeCache.make_key(online, refined_addr), include_failures=False)
+                if cached is not None:
+                    break
+        if cached is not None:
+            return cached, ("cached" if cached[0] is not None else "negative")
+
+        # 2. 오프라인 색인에서 정확/근사 일치 조회 (네트워크 없음)
+        if self.local_index is not None:
+            local = self.local_index.lookup(refined_addr)
+            if local:
+                return local, "local"
+
+        # 3. 폴백 단계 전체를 쿼리 플랜으로 만들어 요청 예산 안에서 순서대로 실행
+        self._tls.transient_error = False
+        self._tls.answered = set()
+        plan = self._build_query_plan(refined_addr, provider)
+        (lon, lat, road_addr), calls, via = self._execute_plan(plan, address)
+        with self._stats_lock:
+            self.request_counts[address] = calls
+
+        if lon:
+            if via != provider:
+                self._log(f"[Fallback Success] {address} found via {via}")
+            self.cache.set(cache_key, (lon, lat, road_addr))
+            return (lon, lat, road_addr), "ok"
+
+        # 4. 네트워크 오류 없이, 인증 정보가 있는 모든 프로바이더가 '결과 없음'이라고 답한 경우에만 실패 캐시에 기록
+        providers = [p for p in ("vworld", "naver") if self._has_credentials(p)]
+        if (provider != "offline" and providers and not self._tls.transient_error and
+                all(p in self._tls.answered for p in providers)):
+            self.cache.set_failure(cache_key)
+        return (None, None, None), "failed"
+
+    def _build_query_plan(self, refined_addr: str, provider: str) -> Iterator[QueryStep]:
+        """
+        지오코딩 폴백 순서를 (프로바이더, 종류, 질의) 단계로 나열합니다.
+        같은 단계는 한 번만 나오며, 인증 정보가 없는 프로바이더의 단계는 제외됩니다.
+        하위 질의 변형이 요청 예산을 모두 쓰지 않도록, 두 프로바이더의 전체 주소 질의를 먼저 실행한 뒤 변형을 시도합니다.
+        """
+        # 오프라인 모드는 네트워크를 쓰지 않음 (캐시와 오프라인 색인에서 못 찾으면 실패)
+        if provider == "offline":
+            return
+        seen = set()
+
+        def unique(steps):
+            for step in steps:
+                if step not in seen:
+                    seen.add(step)
+                    yield step
+
+        # 1. 전체 주소 (선택한 엔진 → [Advanced] Cross-Provider Fallback: 다른 엔진)
+        other_provider = "vworld" if provider == "naver" else "naver"
+        providers = [p for p in (provider, other_provider) if self._has_credentials(p)]
+        for p in providers:
+            yield from unique(self._provider_steps(refined_addr, p))
+
+        # 2. 전체 주소의 뒤쪽 토큰 검색 (폴백 프로바이더가 Vworld여도 실행)
+        for p in providers:
+            yield from unique(self._provider_variants(refined_addr, p))
+
+        if self._has_credentials(provider):
+
+            # 3. 세종시 특수 처리
+            if "세종" in refined_addr:
+                fb = refined_addr.replace("세종특별자치시", "세종").replace("세종시", "세종")
+                if fb != refined_addr:
+                    yield from unique(self._provider_steps(fb, provider))
+                    yield from unique(self._provider_variants(fb, provider))
+
+            # 4. 앞쪽 토큰을 하나씩 떼어 낸 주소
             parts = refined_addr.split(" ")
             if len(parts) > 2:
                 for i in range(1, len(parts) - 1):
-                    lon, lat, road_addr = self._smart_search_orchestrator(" ".join(parts[i:]))
-                    if lon: break
+                    sub = " ".join(parts[i:])
+                    yield from unique(self._provider_steps(sub, provider))
+                    yield from unique(self._provider_variants(sub, provider))
 
-        if lon:
-            self.cache[cache_key] = (lon, lat, road_addr)
-            return lon, lat, road_addr
-
-        # 5. [Advanced] Cross-Provider Fallback
-        # 선택한 엔진이 실패했을 경우, 다른 엔진의 검색(POI) 기능을 최후의 수단으로 사용
-        other_provider = "vworld" if self.provider == "naver" else "naver"
-        self._log(f"[Fallback] alternate provider: {other_provider}")
-        
-        # 임시로 프로바이더 변경 후 오케스트레이터 호출
-        original_provider = self.provider
-        self.provider = other_provider
-        lon, lat, road_addr = self._smart_search_orchestrator(refined_addr)
-        self.provider = original_provider
-        
-        if lon:
-            self._log(f"[Fallback Success] {address} found via {other_provider}")
-            self.cache[cache_key] = (lon, lat, road_addr)
-            
-        return lon, lat, road_addr
-
-    def _smart_search_orchestrator(self, address: str) -> Tuple[Optional[float], Optional[float], Optional[str]]:
-        """선택된 프로바이더에 따라 지오코딩과 검색 API를 조율합니다."""
-        if self.provider == "naver":
-            return self._naver_orchestrator(address)
-        else:
-            return self._vworld_orchestrator(address)
+    def _provider_steps(self, address: str, provider: str) -> Iterator[QueryStep]:
+        """프로바이더별 주소 하나에 대한 기본 질의 단계를 생성합니다."""
+        if provider == "naver":
+            # 네이버는 현재 지오코딩 중심 (지역 검색 API는 향후 확장 지점)
+            yield ("naver", "geocode", address)
+            return
 
-    def _naver_orchestrator(self, address: str) -> Tuple[Optional[float], Optional[float], Optional[str]]:
-        """네이버 전용 검색 오케스트레이터 (현재는 지오코딩 중심)"""
-        # 1. 일반 지오코딩 시도
-        lon, lat, addr = self._naver_geocode_raw(address)
-        if lon: return lon, lat, addr
+        addr_keywords = ['시 ', '구 ', '로 ', '길 ', '동 ', '읍 ', '면 ']
+        if any(kw in address for kw in addr_keywords):
+            yield ("vworld", "ROAD", address)
+            yield ("vworld", "PARCEL", address)
 
-        # 2. (향후 확장) 네이버 지역 검색 API 연동 지점
-        # 현재는 네이버 지오코딩 실패 시 바로 리턴하여 상위 단계의 Cross-Fallback 유도
-        return None, None, None
+        yield ("vworld", "search", address)
 
-    def _vworld_orchestrator(self, address: str) -> Tuple[Optional[float], Optional[float], Optional[str]]:
-        """Vworld 전용 검색 오케스트레이터"""
-        addr_keywords = ['시 ', '구 ', '로 ', '길 ', '동 ', '읍 ', '면 ']
-        is_address_like = any(kw in address for kw in addr_keywords)
+    def _provider_variants(self, address: str, provider: str) -> Iterator[QueryStep]:
+        """기본 질의가 실패했을 때 시도할 하위 질의 (Vworld: 뒤쪽 토큰만 남긴 검색)"""
+        if provider != "vworld" or " " not in address:
+            return
+        parts = address.split(" ")
+        for i in range(len(parts)-1, 0, -1):
+            sub_query = " ".join(parts[i:])
+            if len(sub_query) > 1:
+                yield ("vworld", "search", sub_query)
 
-        if is_address_like:
-            lon, lat, addr = self._vworld_geocode_raw(address, type="ROAD")
-            if lon: return lon, lat, addr
-            lon, lat, addr = self._vworld_geocode_raw(address, type="PARCEL")
-            if lon: return lon, lat, addr
+    def _execute_plan(self, plan: Iterable[QueryStep], address: str) -> Tuple[GeoResult, int, Optional[str]]:
+        """
+        쿼리 플랜을 첫 성공까지 실행합니다.
+        배치 실행 중에는 이미 실행한 단계를 메모에서 재사용하고, 실제 HTTP 호출 수가 예산을 넘으면 중단합니다.
+        (메모는 배치 단위이므로 배치 밖의 geocode 호출은 이전 실행이나 바뀐 API 키의 결과를 재사용하지 않음)
+        일시적 오류(시간 초과, 5xx, 429 등)로 실패한 단계는 메모에 남기지 않으며,
+        확실한 응답을 준 프로바이더는 self._tls.answered에 기록합니다.
+        반환값: (결과, 호출 수, 성공한 프로바이더)
+        """
+        calls = 0
+        use_memo = self._active_batches > 0
+        fallback_logged = False
+        first_provider = None
+        for step in plan:
+            step_provider = step[0]
+            if first_provider is None:
+                first_provider = step_provider
+            elif step_provider != first_provider and not fallback_logged:
+                self._log(f"[Fallback] alternate provider: {step_provider}")
+                fallback_logged = True
 
-        lon, lat, addr = self._vworld_search_raw(address)
-        if lon: return lon, lat, addr
+            with self._stats_lock:
+                memo_hit = use_memo and step in self._query_memo
+                result = self._query_memo.get(step)
+            if not memo_hit:
+                if calls >= self.request_budget:
+                    self._log(f"[Budget] {address}: 요청 예산 {self.request_budget}회 초과로 중단", "error")
+                    break
+                had_error, self._tls.transient_error = self._tls.transient_error, False
+                result = self._run_step(step)
+                transient = self._tls.transient_error
+                self._tls.transient_error = had_error or transient
+                calls += 1
+                with self._stats_lock:
+                    self.api_calls += 1
+                    if use_memo and not transient:
+                        if len(self._query_memo) >= 50000:
+                            self._query_memo.clear()
+                        self._query_memo[step] = result
+                if transient:
+                    continue
+            self._tls.answered.add(step_provider)
+            if result[0]:
+                return result, calls, step_provider
+        return (None, None, None), calls, None
 
-        if " " in address:
-            parts = address.split(" ")
-            for i in range(len(parts)-1, 0, -1):
-                sub_query = " ".join(parts[i:])
-                if len(sub_query) > 1:
-                    lon, lat, addr = self._vworld_search_raw(sub_query)
-                    if lon: return lon, lat, addr
+    def _run_step(self, step: QueryStep) -> GeoResult:
+        """플랜의 한 단계를 실제 API 호출로 실행합니다."""
+        provider, kind, query = step
+        if provider == "naver":
+            return self._naver_geocode_raw(query)
+        if kind == "search":
+            return self._vworld_search_raw(query)
+        return self._vworld_geocode_raw(query, type=kind)
 
-        return None, None, None
+    def _has_credentials(self, provider: str) -> bool:
+        if provider == "naver":
+            return bool(self.naver_client_id and self.naver_client_secret)
+        return bool(self.vworld_key)
+
+    def reset_query_memo(self):
+        """배치 단위 하위 질의 메모와 주소별 호출 수 기록을 초기화합니다."""
+        with self._stats_lock:
+            self._query_memo.clear()
+            self.request_counts.clear()
+
+    def geocode_batch(self, addresses: Iterable[str], provider: str = None,
+                      max_workers: int = GEOCODE_WORKERS,
+                      retry_failed: bool = False,
+                      stats: Optional[Dict[str, int]] = None) -> Iterator[Tuple[int, GeoResult, str]]:
+        """
+        여러 주소를 워커 풀에서 병렬로 변환하고 (입력 인덱스, 결과, 상태)를 입력 순서대로 내보냅니다.
+        정규화 결과가 같은 주소는 한 번만 조회하여 모든 행에 같은 결과를 돌려줍니다.
+        동시에 대기 중인 작업 수를 제한하므로 입력 이터러블은 필요한 만큼만 읽힙니다.
+        여러 스레드에서 동시에 호출해도 캐시·QPS 제한·하위 질의 메모를 공유합니다.
+        stats: 이 배치의 집계를 받을 dict (동시에 여러 배치를 돌릴 때 batch_stats 대신 사용)
+        """
+        provider = provider or self.provider
+        with self._stats_lock:
+            first = self._active_batches == 0
+            self._active_batches += 1
+        if first:
+            self.reset_query_memo()
+        try:
+            yield from self._run_batch(addresses, provider, max_workers, retry_failed, stats)
+        finally:
+            with self._stats_lock:
+                self._active_batches -= 1
+
+    def _run_batch(self, addresses: Iterable[str], provider: str, max_workers: int, retry_failed: bool,
+                   stats: Optional[Dict[str, int]]) -> Iterator[Tuple[int, GeoResult, str]]:
+        if stats is None:
+            stats = self.batch_stats = {"rows": 0, "unique": 0}
+        else:
+            stats.update(rows=0, unique=0)
+        window = max_workers * 4
+        by_address: Dict[str, Future] = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="geocode") as pool:
+            pending: deque = deque()
+            for idx, address in enumerate(addresses):
+                key = normalize_address(address)
+                fut = by_address.get(key)
+                if fut is None:
+                    fut = pool.submit(self.geocode_with_status, key, provider, retry_failed)
+                    by_address[key] = fut
+                    stats["unique"] += 1
+                stats["rows"] += 1
+                pending.append((idx, fut))
+                # 결과는 제출 순서대로 꺼내므로 엑셀 행 순서가 유지됨
+                while len(pending) >= window or (pending and pending[0][1].done()):
+                    done_idx, fut = pending.popleft()
+                    yield (done_idx, *fut.result())
+            while pending:
+                done_idx, fut = pending.popleft()
+                yield (done_idx, *fut.result())
+
+    def _mark_transient_error(self):
+        """현재 주소 처리 중 일시적 오류가 있었음을 표시합니다. (실패 캐시 기록 방지)"""
+        self._tls.transient_error = True
 
     def _vworld_geocode_raw(self, addr: str, type: str = "ROAD") -> Tuple[Optional[float], Optional[float], Optional[str]]:
         """Vworld 주소 지오코딩 API 직접 호출"""
@@ -130,8 +314,9 @@ class GeocodeEngine:
             "type": type, "key": self.vworld_key
         }
         try:
-            print(f"[Vworld Geocode Request] {addr} (type={type})")
-            res_raw = requests.get(VWORLD_GEOCODE_URL, params=params, timeout=5, verify=False)
+            self._log(f"[Vworld Geocode Request] {addr} (type={type})", "debug")
+            res_raw = http_get(VWORLD_GEOCODE_URL, params=params, timeout=5, verify=False,
+                               throttle=lambda: self.rate_limiter.acquire("vworld"))
             res = res_raw.json()
             if res.get("response", {}).get("status") == "OK":
                 pt = res["response"]["result"]["point"]
@@ -139,8 +324,12 @@ class GeocodeEngine:
                 return float(pt["x"]), float(pt["y"]), refined
             else:
                 # 에러 로그 (개발 및 디버그용)
-                self._log(f"[Vworld Error] {addr}: {res.get('response', {}).get('status')}", "error")
+                status = res.get('response', {}).get('status')
+                if status != "NOT_FOUND":
+                    self._mark_transient_error()
+                self._log(f"[Vworld Error] {addr}: {status}", "error")
         except Exception as e:
+            self._mark_transient_error()
             self._log(f"[Vworld Exception] {e}", "error")
         return None, None, None
 
@@ -152,8 +341,9 @@ class GeocodeEngine:
             "format": "json", "key": self.vworld_key, "size": 10
         }
         try:
-            print(f"[Vworld Search Request] {query}")
-            res_raw = requests.get(VWORLD_SEARCH_URL, params=params, timeout=5, verify=False)
+            self._log(f"[Vworld Search Request] {query}", "debug")
+            res_raw = http_get(VWORLD_SEARCH_URL, params=params, timeout=5, verify=False,
+                               throttle=lambda: self.rate_limiter.acquire("vworld"))
             res = res_raw.json()
             if res.get("response", {}).get("status") == "OK":
                 items = res["response"]["result"]["items"]
@@ -168,8 +358,12 @@ class GeocodeEngine:
                     self._log(f"[Vworld Search Success] {query}")
                     return float(pt["x"]), float(pt["y"]), addr
             else:
-                self._log(f"[Vworld Search Error] {query}: {res.get('response', {}).get('status')}", "error")
+                status = res.get('response', {}).get('status')
+                if status != "NOT_FOUND":
+                    self._mark_transient_error()
+                self._log(f"[Vworld Search Error] {query}: {status}", "error")
         except Exception as e:
+            self._mark_transient_error()
             self._log(f"[Vworld Search Exception] {e}", "error")
         return None, None, None
 
@@ -182,31 +376,23 @@ class GeocodeEngine:
         }
         params = {"query": addr}
         try:
-            print(f"[Naver Geocode Request] {addr}")
-            res_raw = requests.get(NAVER_GEOCODE_URL, headers=headers, params=params, timeout=5, verify=False)
+            self._log(f"[Naver Geocode Request] {addr}", "debug")
+            res_raw = http_get(NAVER_GEOCODE_URL, headers=headers, params=params, timeout=5, verify=False,
+                               throttle=lambda: self.rate_limiter.acquire("naver"))
             res = res_raw.json()
             if res.get("addresses"):
                 item = res["addresses"][0]
                 return float(item["x"]), float(item["y"]), item["roadAddress"] or item["jibunAddress"]
             else:
+                # status가 OK인데 주소 목록이 비어 있으면 단순 '결과 없음', 그 외는 인증/서버 오류
+                if res.get("status") != "OK":
+                    self._mark_transient_error()
                 self._log(f"[Naver Error] {addr}: {res.get('errorMessage', res.get('message', res_raw.text))}", "error")
         except Exception as e:
+            self._mark_transient_error()
             self._log(f"[Naver Exception] {e}", "error")
         return None, None, None
 
     def _standardize_province_name(self, address: str) -> str:
         """광역시/도 이름을 정식 명칭이나 특별자치도 명칭으로 보정합니다."""
-        replacements = {
-            "서울시 ": "서울특별시 ",
-            "서울 ": "서울특별시 ",
-            "강원도": "강원특별자치도",
-            "전라북도": "전북특별자치도",
-            "세종시": "세종특별자치시",
-            "세종 ": "세종특별자치시 ",
-            "제주시": "제주특별자치도 제주시",
-            "서귀포시": "제주특별자치도 서귀포시",
-        }
-        for old, new in replacements.items():
-            if old in address and new not in address:
-                address = address.replace(old, new)
-        return address
+        return standardize_province(address)
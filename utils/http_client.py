@@ -0,0 +1,68 @@
+"""
+utils/http_client.py - 호스트별 연결 풀(keep-alive) 세션과 재시도/백오프를 제공하는 공용 HTTP 전송 계층
+"""
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from config import HTTP_POOL_SIZE, HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# 연결 실패와 읽기 시간 초과는 같은 종류의 일시적 오류로 보고 재시도 (ConnectTimeout은 ConnectionError에 포함)
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.ReadTimeout)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+def get_session(url: str) -> requests.Session:
+    """URL의 호스트별로 하나씩 공유되는 세션을 반환합니다. (TCP/TLS 연결 재사용)"""
+    parts = urlsplit(url)
+    host_key = f"{parts.scheme}://{parts.netloc}"
+    session = _sessions.get(host_key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host_key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, pool_block=True)
+                session.mount(host_key, adapter)
+                _sessions[host_key] = session
+    return session
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """지수 백오프 + 풀 지터 대기 시간. 서버가 Retry-After를 주면 그 값을 우선합니다."""
+    if retry_after:
+        try:
+            return min(float(retry_after), HTTP_BACKOFF_MAX)
+        except ValueError:
+            pass
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+
+def http_get(url: str, params=None, headers=None, timeout: float = 5,
+             verify: bool = False, retries: int = HTTP_MAX_RETRIES,
+             throttle: Optional[Callable[[], None]] = None) -> requests.Response:
+    """
+    공유 세션으로 GET 요청을 보냅니다.
+    429/5xx 응답이나 연결 오류·읽기 시간 초과는 지터가 적용된 지수 백오프로 재시도하고, 마지막 응답(또는 예외)을 그대로 돌려줍니다.
+    throttle은 재시도를 포함한 매 요청 직전에 호출됩니다. (예: 프로바이더별 QPS 제한의 토큰 획득)
+    """
+    session = get_session(url)
+    attempt = 0
+    while True:
+        if throttle:
+            throttle()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=timeout, verify=verify)
+        except RETRY_EXCEPTIONS:
+            if attempt >= retries:
+                raise
+            time.sleep(_backoff_delay(attempt))
+            attempt += 1
+            continue
+        if response.status_code not in RETRY_STATUS or attempt >= retries:
+            return response
+        time.sleep(_backoff_delay(attempt, response.headers.get("Retry-After")))
+        attempt += 1
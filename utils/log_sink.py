@@ -0,0 +1,73 @@
+"""
+utils/log_sink.py - 여러 스레드의 로그를 모아 두었다가 한꺼번에 내보내는 로그 버퍼
+(화면 갱신 주기마다 drain()으로 한 번에 가져가므로 로그가 많아도 메인 스레드 부담이 거의 없음)
+"""
+import logging
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Deque, List, Optional, Tuple
+
+LEVELS = {"debug": 10, "info": 20, "error": 40}
+_PREFIX = {"debug": "[DEBUG]", "info": "[INFO]", "error": "[ERROR]"}
+
+class LogSink:
+    """
+    크기가 제한된 링 버퍼에 로그 줄을 쌓습니다.
+    level 미만의 로그는 화면 버퍼에 넣지 않으며, file_path가 주어지면 file_level 이상을 회전 파일에도 기록합니다.
+    버퍼가 가득 차면 오래된 줄부터 버리고, 다음 drain() 때 생략된 줄 수를 알려 줍니다.
+    """
+
+    def __init__(self, capacity: int = 2000, level: str = "info", file_path: Optional[str] = None,
+                 file_level: str = "debug", max_bytes: int = 2 * 1024 * 1024, backups: int = 3):
+        self.capacity = capacity
+        self.level = level
+        self._lines: Deque[Tuple[str, str]] = deque(maxlen=capacity)
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+        self._file_logger: Optional[logging.Logger] = None
+        self._file_level = LEVELS.get(file_level, 10)
+        if file_path:
+            handler = RotatingFileHandler(file_path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger = logging.getLogger(f"{__name__}.{id(self)}")
+            logger.setLevel(logging.DEBUG)
+            logger.propagate = False
+            logger.addHandler(handler)
+            self._file_logger = logger
+
+    def set_level(self, level: str):
+        self.level = level
+
+    def emit(self, message: str, level: str = "info"):
+        """어느 스레드에서나 호출할 수 있습니다."""
+        severity = LEVELS.get(level, 20)
+        prefix = _PREFIX.get(level, "[INFO]")
+        if self._file_logger and severity >= self._file_level:
+            self._file_logger.log(severity, f"{prefix} {message}")
+        if severity < LEVELS.get(self.level, 20):
+            return
+        line = f"[{time.strftime('%H:%M:%S')}] {prefix} {message}"
+        with self._lock:
+            if len(self._lines) == self.capacity:
+                self._dropped += 1
+            self._lines.append((line, level))
+
+    def drain(self) -> List[Tuple[str, str]]:
+        """쌓인 (줄, 레벨) 목록을 꺼내고 버퍼를 비웁니다."""
+        with self._lock:
+            lines = list(self._lines)
+            self._lines.clear()
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            lines.insert(0, (f"... 로그 {dropped}줄 생략 ...", "info"))
+        return lines
+
+    def close(self):
+        if self._file_logger:
+            for handler in list(self._file_logger.handlers):
+                handler.close()
+                self._file_logger.removeHandler(handler)
+            self._file_logger = None
@@ -0,0 +1,103 @@
+"""
+utils/map_cache.py - 받은 베이스 지도 이미지(정적 지도, 타일)를 파일로 보관하는 디스크 캐시
+같은 뷰를 다시 보거나 같은 지도를 다시 내보낼 때 네트워크 요청 없이 파일에서 읽습니다.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+_EXT = ".img"
+
+def static_map_key(provider: str, center: Tuple[float, float], zoom: int, size: Tuple[int, int], style: str) -> str:
+    """정적 지도 이미지의 캐시 키. center는 미리 격자에 맞춘(snap_center) 값이어야 같은 뷰끼리 키가 같아집니다."""
+    return f"static/{provider}/{style}/{int(zoom)}/{size[0]}x{size[1]}/{center[0]:.6f},{center[1]:.6f}"
+
+def tile_key(layer: str, z: int, x: int, y: int) -> str:
+    return f"tile/{layer}/{z}/{x}/{y}"
+
+class MapImageCache:
+    """
+    키마다 이미지 바이트를 파일 하나로 저장합니다. 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 파일부터 지웁니다.
+    사용 순서는 파일 수정 시각으로 기록하므로 재실행해도 LRU 순서가 유지됩니다. 여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, folder: str, max_bytes: int):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # 파일 이름 → 크기 (오래 쓰지 않은 것부터)
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+
+        os.makedirs(folder, exist_ok=True)
+        entries = []
+        for entry in os.scandir(folder):
+            if entry.is_file() and entry.name.endswith(_EXT):
+                st = entry.stat()
+                entries.append((st.st_mtime, entry.name, st.st_size))
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self._total += size
+        with self._lock:
+            self._evict_locked()
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:32] + _EXT
+
+    def get(self, key: str) -> Optional[bytes]:
+        name = self._name(key)
+        with self._lock:
+            if name not in self._index:
+                self.misses += 1
+                return None
+            self._index.move_to_end(name)
+        path = os.path.join(self.folder, name)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._total -= self._index.pop(name, 0)
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        name = self._name(key)
+        path = os.path.join(self.folder, name)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._total += len(data) - self._index.pop(name, 0)
+            self._index[name] = len(data)
+            self._evict_locked()
+
+    def _evict_locked(self):
+        while self._total > self.max_bytes and self._index:
+            name, size = self._index.popitem(last=False)
+            self._total -= size
+            try:
+                os.remove(os.path.join(self.folder, name))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._index), "bytes": self._total, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,175 @@
+"""
+utils/preprocess.py - 지오코딩 전 입력 행 정제/검증 단계 (청크 단위 열 연산)
+주소/장소명/순서/좌표 컬럼을 한 번에 정리하고, 조회할 고유 주소 목록과 행 매핑, 제외 행 보고서를 만듭니다.
+"""
+from typing import Any, Container, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+from config import RESULT_COLUMNS
+from utils.address_normalizer import normalize_address
+from utils.geo_utils import KOREA_BOUNDS, find_coordinate_columns
+
+GeoResult = Tuple[float, float, str]
+
+# 제외 사유
+REJECT_NO_ADDRESS = "주소 없음"
+REJECT_NORMALIZED_EMPTY = "주소 형식 오류"
+
+def row_identities(normalized_address: pd.Series, name: pd.Series) -> pd.Series:
+    """변경분 비교용 행 식별자: 정규화 주소 + 장소명 해시 (같은 주소의 다른 장소를 구분, 열 단위로 계산)"""
+    name_hash = pd.util.hash_pandas_object(name.astype(str), index=False).astype(str)
+    return normalized_address.astype(str) + "#" + name_hash
+
+def clean_text(series: pd.Series) -> pd.Series:
+    """문자열로 바꾸고 앞뒤 공백을 제거합니다. 빈 값과 'nan' 문자열은 결측으로 취급합니다."""
+    s = series.astype("string").str.strip()
+    return s.mask(s.isna() | (s == "") | (s.str.lower() == "nan"))
+
+def parse_coordinate_columns(lon_raw: pd.Series, lat_raw: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    utils.geo_utils.parse_coordinate의 열 단위 버전입니다.
+    국내 범위를 벗어나면 경위도를 바꿔 보고, 그래도 벗어나면 NaN을 반환합니다.
+    """
+    lon = pd.to_numeric(lon_raw, errors="coerce").astype(float)
+    lat = pd.to_numeric(lat_raw, errors="coerce").astype(float)
+    min_lon, min_lat, max_lon, max_lat = KOREA_BOUNDS
+
+    def inside(x: pd.Series, y: pd.Series) -> pd.Series:
+        return x.between(min_lon, max_lon) & y.between(min_lat, max_lat)
+
+    ok, swapped = inside(lon, lat), inside(lat, lon)
+    swap = ~ok & swapped
+    out_lon = lon.where(ok, lat.where(swap))
+    out_lat = lat.where(ok, lon.where(swap))
+    return out_lon, out_lat
+
+class PreparedChunk:
+    """
+    한 청크의 전처리 결과입니다.
+    rows: (행 번호, 원본 행, 주소, 장소명, 순서, 좌표 결과 또는 None) 목록 (입력 순서)
+          조회 키가 -1이고 좌표 결과도 없는 행은 skip_rows 또는 known에 해당하는 행입니다.
+    keys: 이 청크에서 조회가 필요한 고유 정규화 주소 (처음 등장한 순서)
+    row_keys: rows와 같은 길이, keys의 위치 (조회하지 않는 행은 -1)
+    identities: rows와 같은 길이, 행 식별자 (row_identities)
+    rejected: (행 번호, 사유) 목록
+    """
+
+    def __init__(self):
+        self.rows: List[Tuple[int, Dict[str, Any], str, str, int, Optional[GeoResult]]] = []
+        self.keys: List[str] = []
+        self.row_keys: List[int] = []
+        self.identities: List[str] = []
+        self.rejected: List[Tuple[int, str]] = []
+        self.order_fallbacks = 0
+
+def prepare_chunk(records: List[Tuple[int, Dict[str, Any]]], columns: List[str],
+                  skip_rows: Container[int] = (), known: Optional[Dict[str, int]] = None) -> PreparedChunk:
+    """
+    (행 번호, 행) 목록을 정제합니다.
+    - 주소/장소명: 공백 제거, 빈 값 제외, 주소가 없고 좌표만 있으면 장소명을 주소로 사용
+    - 순서: 숫자로 변환하고 비어 있거나 숫자가 아니면 행 번호 사용
+    - 좌표 컬럼이 있으면 유효한 좌표를 가진 행은 (경도, 위도, 정제주소) 결과를 미리 채우고 조회하지 않음
+    skip_rows에 있는 행(체크포인트 복원 등)은 행 목록에는 남기되 조회 키를 만들지 않습니다.
+    known은 {행 식별자: 남은 개수}로, 이미 세션에 있는 행은 개수를 하나씩 소진하며 조회에서 제외합니다.
+    """
+    chunk = PreparedChunk()
+    if not records:
+        return chunk
+
+    index = [i for i, _ in records]
+    raw = dict(records)
+    df = pd.DataFrame.from_records([r for _, r in records], index=index, columns=columns)
+    empty = pd.Series(pd.NA, index=df.index, dtype="string")
+
+    addr = clean_text(df["주소"]) if "주소" in df.columns else empty
+    name = clean_text(df["장소명"]) if "장소명" in df.columns else empty
+
+    coord_cols = find_coordinate_columns(columns)
+    if coord_cols:
+        lon, lat = parse_coordinate_columns(df[coord_cols[0]], df[coord_cols[1]])
+    else:
+        lon = lat = pd.Series(np.nan, index=df.index)
+    has_coord = lon.notna() & lat.notna()
+
+    # 주소가 없어도 좌표가 있으면 장소명으로 표시
+    addr = addr.fillna(name.where(has_coord))
+    name = name.fillna(addr)
+    refined_col = RESULT_COLUMNS[2]
+    refined = (clean_text(df[refined_col]) if refined_col in df.columns else empty).fillna(addr)
+
+    row_no = pd.Series(index, index=df.index, dtype=float)
+    if "순서" in df.columns:
+        order_num = pd.to_numeric(df["순서"], errors="coerce")
+        # inf/-inf는 정수로 바꿀 수 없으므로 숫자가 아닌 값과 같이 행 번호로 대체
+        order_num = order_num.where(np.isfinite(order_num))
+        chunk.order_fallbacks = int((order_num.isna() & clean_text(df["순서"]).notna()).sum())
+        order = order_num.fillna(row_no).astype(int)
+    else:
+        order = row_no.astype(int)
+
+    valid = addr.notna()
+    skipped = pd.Series(df.index.isin(list(skip_rows)) if skip_rows else False, index=df.index)
+
+    # 정규화는 고유 주소마다 한 번만 수행
+    norm = {a: normalize_address(a) for a in pd.unique(addr[valid])}
+    norm_addr = addr[valid].map(norm).astype(str).reindex(df.index)
+    identity = row_identities(norm_addr[valid], name[valid]).reindex(df.index)
+
+    # 세션에 이미 있는 행: 식별자별 남은 개수만큼 앞에서부터 조회하지 않고 기존 장소를 그대로 사용
+    is_known = pd.Series(False, index=df.index)
+    if known:
+        candidates = identity[valid & ~skipped]
+        occurrence = candidates.groupby(candidates, sort=False).cumcount()
+        hit = occurrence < candidates.map(known).fillna(0)
+        is_known[hit.index[hit]] = True
+        for ident, used in candidates[hit].value_counts().items():
+            known[ident] -= int(used)
+
+    lookup = valid & ~has_coord & ~skipped & ~is_known
+    empty_key = lookup & (norm_addr == "")
+    lookup &= ~empty_key
+    reasons = pd.Series(None, index=df.index, dtype=object)
+    reasons[~valid] = REJECT_NO_ADDRESS
+    reasons[empty_key] = REJECT_NORMALIZED_EMPTY
+    chunk.rejected = [(int(i), r) for i, r in reasons.dropna().items()]
+
+    # 조회 키는 처음 등장한 순서로 번호를 매김
+    codes, uniques = pd.factorize(norm_addr[lookup], sort=False)
+    chunk.keys = list(uniques)
+    row_keys = pd.Series(-1, index=df.index)
+    row_keys[lookup] = codes
+    preset = valid & ~is_known & ~lookup & ~empty_key & lon.notna()
+
+    kept = valid & ~empty_key
+    for i, a, n, o, k, p, x, y, r in zip(df.index[kept], addr[kept], name[kept], order[kept], row_keys[kept],
+                                         preset[kept], lon[kept], lat[kept], refined[kept]):
+        chunk.rows.append((int(i), raw[i], str(a), str(n), int(o), (float(x), float(y), str(r)) if p else None))
+    chunk.row_keys = row_keys[kept].astype(int).tolist()
+    chunk.identities = identity[kept].tolist()
+    return chunk
+
+def prepare_stream(rows: Iterable[Tuple[int, Dict[str, Any]]], columns: List[str], chunk_rows: int,
+                   skip_rows: Container[int] = (), known: Optional[Dict[str, int]] = None) -> Iterator[PreparedChunk]:
+    """행 스트림을 chunk_rows 단위로 묶어 전처리한 청크를 차례로 내보냅니다."""
+    batch: List[Tuple[int, Dict[str, Any]]] = []
+    for record in rows:
+        batch.append(record)
+        if len(batch) >= chunk_rows:
+            yield prepare_chunk(batch, columns, skip_rows, known)
+            batch = []
+    if batch:
+        yield prepare_chunk(batch, columns, skip_rows, known)
+
+def summarize_rejections(rejected: List[Tuple[int, str]], limit: int = 10) -> List[str]:
+    """제외 행 보고서를 사유별 건수와 예시 엑셀 행 번호(헤더 포함 기준)로 요약합니다."""
+    by_reason: Dict[str, List[int]] = {}
+    for i, reason in rejected:
+        by_reason.setdefault(reason, []).append(i + 2)
+    lines = []
+    for reason, excel_rows in by_reason.items():
+        sample = ", ".join(map(str, excel_rows[:limit]))
+        more = f" 외 {len(excel_rows) - limit}행" if len(excel_rows) > limit else ""
+        lines.append(f"{reason} {len(excel_rows)}행 (엑셀 행: {sample}{more})")
+    return lines
@@ -0,0 +1,107 @@
+"""
+utils/progress.py - 워커 스레드의 진행 이벤트를 모아 처리 속도·캐시 적중률·API 호출 속도·남은 시간을 계산
+(워커는 카운터만 올리고, UI는 일정 주기로 snapshot()을 읽어 한 번에 갱신)
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+class ProgressTracker:
+    """
+    단계(phase)별 진행률을 추적합니다. 각 단계는 전체 진행 막대의 span 구간(예: 0~50%)을 차지합니다.
+    속도는 최근 window_s초 동안의 표본으로 계산하므로 처리 속도가 바뀌면 남은 시간도 곧바로 따라갑니다.
+    """
+
+    def __init__(self, window_s: float = 5.0):
+        self.window_s = window_s
+        self._lock = threading.Lock()
+        self._phase: Optional[str] = None
+        self._finished = True
+        self._unit = "행"
+        self._span: Tuple[float, float] = (0.0, 100.0)
+        self._total = 0
+        self._done = 0
+        self._hits = 0
+        self._lookups = 0
+        self._api_calls = 0
+        self._started = 0.0
+        self._samples: Deque[Tuple[float, int, int]] = deque()
+
+    def start_phase(self, name: str, total: int, span: Tuple[float, float] = (0.0, 100.0), unit: str = "행"):
+        with self._lock:
+            self._phase, self._finished = name, False
+            self._total, self._span, self._unit = max(int(total), 0), span, unit
+            self._done = self._hits = self._lookups = self._api_calls = 0
+            self._started = time.monotonic()
+            self._samples = deque([(self._started, 0, 0)])
+
+    def advance(self, n: int = 1, hit: Optional[bool] = None):
+        """n개 처리 완료. hit은 캐시 적중 여부 (캐시를 거치지 않은 항목은 None)"""
+        with self._lock:
+            self._done += n
+            if hit is not None:
+                self._lookups += n
+                self._hits += n if hit else 0
+
+    def set_api_calls(self, count: int):
+        """이 단계에서 지금까지 발생한 API 호출 수 (누적값)"""
+        with self._lock:
+            self._api_calls = count
+
+    def add_api_calls(self, n: int = 1):
+        with self._lock:
+            if not self._finished:
+                self._api_calls += n
+
+    def set_total(self, total: int):
+        with self._lock:
+            self._total = max(int(total), 0)
+
+    def finish_phase(self):
+        with self._lock:
+            self._done = max(self._done, self._total)
+            self._finished = True
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """현재 단계의 진행 상태를 반환합니다. 시작된 단계가 없으면 None"""
+        with self._lock:
+            if self._phase is None:
+                return None
+            now = time.monotonic()
+            if not self._finished:
+                self._samples.append((now, self._done, self._api_calls))
+                while len(self._samples) > 2 and now - self._samples[1][0] >= self.window_s:
+                    self._samples.popleft()
+            t0, done0, api0 = self._samples[0]
+            elapsed = max(now - t0, 1e-6)
+            rate = (self._done - done0) / elapsed
+            api_rate = (self._api_calls - api0) / elapsed
+            total = max(self._total, self._done)
+            remaining = total - self._done
+            fraction = self._done / total if total else (1.0 if self._finished else 0.0)
+            lo, hi = self._span
+            return {
+                "phase": self._phase, "unit": self._unit, "finished": self._finished,
+                "done": self._done, "total": total, "percent": lo + (hi - lo) * min(fraction, 1.0),
+                "rate": rate, "api_calls": self._api_calls, "api_rate": api_rate,
+                "hit_rate": self._hits / self._lookups if self._lookups else None,
+                "eta": remaining / rate if rate > 0 and remaining > 0 and not self._finished else None,
+                "elapsed": now - self._started,
+            }
+
+def format_progress(snap: Optional[Dict[str, Any]]) -> str:
+    """상태 표시줄용 한 줄 요약"""
+    if not snap:
+        return ""
+    if snap["finished"]:
+        return f"{snap['phase']} 완료: {snap['done']}{snap['unit']}, API {snap['api_calls']}회, {snap['elapsed']:.1f}초"
+    parts = [f"{snap['phase']} {snap['done']}/{snap['total']}{snap['unit']}",
+             f"{snap['rate']:.1f}{snap['unit']}/초"]
+    if snap["hit_rate"] is not None:
+        parts.append(f"캐시 적중 {snap['hit_rate']:.0%}")
+    parts.append(f"API {snap['api_rate']:.1f}회/초")
+    if snap["eta"] is not None:
+        eta = int(snap["eta"])
+        parts.append(f"남은 시간 {eta // 60}분 {eta % 60:02d}초" if eta >= 60 else f"남은 시간 {eta}초")
+    return " · ".join(parts)
@@ -0,0 +1,126 @@
+"""
+utils/project_file.py - 작업 상태를 저장/복원하는 프로젝트 파일 (.emap)
+
+파일 구조 (ZIP):
+    project.json  장소 목록(컬럼 배열 형식), 뷰 중심/줌, 타입 색상, 핀/글자 크기 등
+    basemap.png   마지막으로 받은 베이스 지도 이미지 (있을 때만, 열 때는 필요할 때 디코딩)
+
+사용법 (GUI 없이 PNG로 렌더링, 베이스 지도가 없는 프로젝트는 지도를 받거나 디스크 캐시에서 읽음):
+    python -m utils.project_file render 프로젝트.emap 결과.png
+"""
+import argparse
+import json
+import os
+import zipfile
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+
+from PIL import Image # type: ignore
+
+PROJECT_EXT = ".emap"
+PROJECT_VERSION = 1
+FILE_DIALOG_TYPES = [("지도 프로젝트", f"*{PROJECT_EXT}")]
+
+# 장소 하나를 [값, 값, ...] 배열로 저장할 때의 필드 순서
+PLACE_FIELDS = ["lon", "lat", "name", "addr", "type", "order", "label_dir", "visible", "success_idx", "key", "sheet"]
+_PLACE_DEFAULTS: Dict[str, Any] = {"type": "A", "label_dir": "top", "visible": True}
+
+def save_project(path: str, state: Dict[str, Any], places: List[Dict[str, Any]],
+                 basemap: Optional[Image.Image] = None):
+    """
+    작업 상태를 프로젝트 파일로 저장합니다. 임시 파일에 쓴 뒤 교체하므로 저장 중 오류가 나도 기존 파일은 보존됩니다.
+    state: 뷰/스타일 설정 (JSON으로 직렬화 가능한 값)
+    """
+    doc = dict(state)
+    doc["version"] = PROJECT_VERSION
+    doc["place_fields"] = PLACE_FIELDS
+    doc["places"] = [[p.get(f, _PLACE_DEFAULTS.get(f)) for f in PLACE_FIELDS] for p in places]
+    doc["has_basemap"] = basemap is not None
+
+    tmp_path = path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w") as zf:
+        zf.writestr("project.json", json.dumps(doc, ensure_ascii=False, separators=(",", ":")),
+                    compress_type=zipfile.ZIP_DEFLATED)
+        if basemap is not None:
+            buf = BytesIO()
+            # PNG는 이미 압축되어 있으므로 ZIP에는 그대로 저장 (저장/열기 속도 우선)
+            basemap.save(buf, format="PNG", compress_level=1)
+            zf.writestr("basemap.png", buf.getvalue(), compress_type=zipfile.ZIP_STORED)
+    os.replace(tmp_path, path)
+
+class ProjectFile:
+    """
+    프로젝트 파일을 엽니다. project.json만 즉시 읽고, 베이스 지도 이미지는 basemap()을 처음 호출할 때 디코딩합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with zipfile.ZipFile(path) as zf:
+            doc = json.loads(zf.read("project.json").decode("utf-8"))
+        if doc.get("version", 0) > PROJECT_VERSION:
+            raise ValueError(f"더 새로운 버전의 프로젝트 파일입니다 (v{doc.get('version')}).")
+        self.state: Dict[str, Any] = doc
+        fields = doc.get("place_fields", PLACE_FIELDS)
+        self.places: List[Dict[str, Any]] = [dict(zip(fields, row)) for row in doc.get("places", [])]
+        self._basemap: Optional[Image.Image] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.state.get(key, default)
+
+    def basemap(self) -> Optional[Image.Image]:
+        if self._basemap is None and self.state.get("has_basemap"):
+            with zipfile.ZipFile(self.path) as zf:
+                self._basemap = Image.open(BytesIO(zf.read("basemap.png"))).convert("RGBA")
+        return self._basemap
+
+def render_project(path: str, out_path: str) -> str:
+    """프로젝트 파일을 GUI 없이 저장 당시의 뷰 그대로 PNG로 렌더링합니다."""
+    from renderer.map_renderer import MapRenderer
+
+    project = ProjectFile(path)
+    basemap = project.basemap()
+    api_center, api_zoom = tuple(project.get("api_center")), project.get("api_zoom")
+    if basemap is None:
+        # 베이스 지도 없이 저장된 프로젝트는 지도를 받아서 렌더링 (디스크 캐시에 있으면 요청 없음)
+        from config import DEFAULT_PROVIDER
+        from renderer.basemap import BasemapFetcher
+        from utils.app_config import load_api_keys, create_map_cache
+
+        fetcher = BasemapFetcher(load_api_keys(), create_map_cache())
+        api_zoom = int(project.get("zoom"))
+        basemap, api_center, _ = fetcher.fetch(project.get("provider", DEFAULT_PROVIDER), tuple(project.get("center")), api_zoom)
+        if basemap is None:
+            raise ValueError("프로젝트에 베이스 지도 이미지가 없고, 지도를 받지 못했습니다.")
+    img, _ = MapRenderer.render_current_view(
+        raw_map_img=basemap,
+        current_zoom=project.get("zoom"),
+        current_center=tuple(project.get("center")),
+        last_api_center=api_center,
+        last_api_zoom=api_zoom,
+        place_data=project.places,
+        pin_size_key=project.get("pin_size", "보통"),
+        font_size=project.get("font_size", 12),
+        type_colors=project.get("type_colors", {}),
+    )
+    img.convert("RGB").save(out_path)
+    return out_path
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="지도 프로젝트 파일(.emap)을 렌더링하거나 내용을 확인합니다.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_render = sub.add_parser("render", help="저장된 뷰를 PNG로 렌더링")
+    p_render.add_argument("project")
+    p_render.add_argument("output")
+    p_info = sub.add_parser("info", help="프로젝트 요약 출력")
+    p_info.add_argument("project")
+    args = parser.parse_args(argv)
+
+    if args.command == "render":
+        print(render_project(args.project, args.output))
+    else:
+        project = ProjectFile(args.project)
+        print(f"장소 {len(project.places)}개, 중심 {project.get('center')}, 줌 {project.get('zoom')}, "
+              f"지도 이미지 {'있음' if project.get('has_basemap') else '없음'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+utils/rate_limiter.py - 프로바이더별 초당 요청 수(QPS) 제한용 토큰 버킷
+"""
+import threading
+import time
+from typing import Dict
+
+class TokenBucket:
+    """초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓이는 스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.capacity = max(1, int(burst))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰을 하나 얻을 때까지 대기합니다."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class ProviderRateLimiter:
+    """프로바이더 이름별로 토큰 버킷을 관리합니다. (설정이 없는 프로바이더는 제한 없음)"""
+
+    def __init__(self, qps: Dict[str, float]):
+        self.buckets = {name: TokenBucket(rate, burst=max(1, int(rate))) for name, rate in qps.items()}
+
+    def acquire(self, provider: str):
+        bucket = self.buckets.get(provider)
+        if bucket:
+            bucket.acquire()
@@ -0,0 +1,162 @@
+"""
+utils/sheet_reader.py - 엑셀/CSV/Parquet 입력을 한 행씩 읽어 들이는 스트리밍 리더
+(전체 시트를 DataFrame으로 올리지 않으므로 대용량 파일도 메모리 사용량이 일정하고 첫 행부터 바로 처리 가능)
+"""
+import csv
+import os
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pandas as pd # type: ignore
+
+SUPPORTED_EXTENSIONS = (".xlsx", ".xlsm", ".xls", ".csv", ".parquet")
+FILE_DIALOG_TYPES = [("표 데이터 파일", "*.xlsx *.xlsm *.xls *.csv *.parquet"),
+                     ("Excel files", "*.xlsx *.xls"), ("CSV files", "*.csv"), ("Parquet files", "*.parquet")]
+
+PARQUET_BATCH_ROWS = 5000
+
+def _detect_csv_encoding(path: str) -> str:
+    """UTF-8(BOM 포함)로 읽히지 않으면 엑셀에서 저장한 CSV로 보고 cp949를 사용합니다."""
+    with open(path, "rb") as f:
+        head = f.read(1 << 16)
+    try:
+        # 잘린 멀티바이트 문자는 무시하고 판단
+        head.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        if e.start < len(head) - 3:
+            return "cp949"
+    return "utf-8-sig"
+
+def _count_lines(path: str) -> int:
+    count = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+    return count
+
+def _clean_header(values) -> List[str]:
+    return [str(v).strip() if v is not None else "" for v in values]
+
+class SheetStream:
+    """
+    표 형식 파일의 헤더와 데이터 행을 순서대로 내보내는 이터레이터입니다.
+    행은 (데이터 행 번호, {컬럼명: 값}) 형태이며, 행 번호는 헤더 다음 행을 0으로 하는 원본 위치입니다.
+    빈 행은 건너뛰지만 번호는 유지하므로 체크포인트와 결과 행 번호가 원본과 어긋나지 않습니다.
+    """
+
+    def __init__(self, path: str, sheet: Any = None):
+        self.path = path
+        self.sheet = sheet
+        self.ext = os.path.splitext(path)[1].lower()
+        if self.ext not in SUPPORTED_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {self.ext}")
+        self.columns: List[str] = []
+        # 진행률 표시용 대략적인 데이터 행 수 (정확하지 않을 수 있음)
+        self.total_hint: int = 0
+        self._close = lambda: None
+        self._rows = self._open()
+
+    def _open(self) -> Iterator[Tuple[Any, ...]]:
+        if self.ext in (".xlsx", ".xlsm"):
+            return self._open_xlsx()
+        if self.ext == ".csv":
+            return self._open_csv()
+        if self.ext == ".parquet":
+            return self._open_parquet()
+        return self._open_xls()
+
+    def _open_xlsx(self) -> Iterator[Tuple[Any, ...]]:
+        from openpyxl import load_workbook # type: ignore
+        wb = load_workbook(self.path, read_only=True, data_only=True)
+        self._close = wb.close
+        if self.sheet is None or self.sheet == 0:
+            ws = wb.worksheets[0]
+        elif isinstance(self.sheet, int):
+            ws = wb.worksheets[self.sheet]
+        else:
+            ws = wb[self.sheet]
+        rows = ws.iter_rows(values_only=True)
+        self.columns = _clean_header(next(rows, ()))
+        self.total_hint = max((ws.max_row or 1) - 1, 0)
+        return rows
+
+    def _open_csv(self) -> Iterator[Tuple[Any, ...]]:
+        f = open(self.path, "r", newline="", encoding=_detect_csv_encoding(self.path))
+        self._close = f.close
+        reader = csv.reader(f)
+        self.columns = _clean_header(next(reader, []))
+        self.total_hint = max(_count_lines(self.path) - 1, 0)
+        # 빈 문자열은 엑셀의 빈 셀과 같게 None으로 취급
+        return (tuple(v if v != "" else None for v in row) for row in reader)
+
+    def _open_parquet(self) -> Iterator[Tuple[Any, ...]]:
+        try:
+            import pyarrow.parquet as pq # type: ignore
+        except ImportError:
+            raise ImportError("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다.")
+        pf = pq.ParquetFile(self.path)
+        self._close = pf.close if hasattr(pf, "close") else (lambda: None)
+        self.columns = _clean_header(pf.schema_arrow.names)
+        self.total_hint = pf.metadata.num_rows
+
+        def rows():
+            for batch in pf.iter_batches(batch_size=PARQUET_BATCH_ROWS):
+                yield from zip(*(col.to_pylist() for col in batch.columns))
+        return rows()
+
+    def _open_xls(self) -> Iterator[Tuple[Any, ...]]:
+        # 구형 .xls는 행 단위 읽기를 지원하지 않으므로 pandas로 한 번에 읽음
+        df = pd.read_excel(self.path, sheet_name=self.sheet or 0, header=None, dtype=object)
+        df = df.astype(object).where(pd.notna(df), None)
+        rows = df.itertuples(index=False, name=None)
+        self.columns = _clean_header(next(rows, ()))
+        self.total_hint = max(len(df) - 1, 0)
+        return rows
+
+    def __iter__(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        columns = self.columns
+        try:
+            for i, values in enumerate(self._rows):
+                if not any(v is not None and str(v).strip() != "" for v in values):
+                    continue
+                yield i, dict(zip(columns, values))
+        finally:
+            self.close()
+
+    def close(self):
+        self._close()
+        self._close = lambda: None
+
+    def __enter__(self) -> "SheetStream":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def list_sheets(path: str) -> List[str]:
+    """통합 문서의 시트 이름 목록을 반환합니다. 시트 개념이 없는 CSV/Parquet은 빈 목록"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook # type: ignore
+        wb = load_workbook(path, read_only=True)
+        try:
+            return list(wb.sheetnames)
+        finally:
+            wb.close()
+    if ext == ".xls":
+        with pd.ExcelFile(path) as xls:
+            return [str(name) for name in xls.sheet_names]
+    return []
+
+def open_sheet(path: str, sheet: Any = None) -> SheetStream:
+    """파일 확장자에 맞는 스트리밍 리더를 엽니다."""
+    return SheetStream(path, sheet)
+
+def read_table(path: str, sheet: Any = None) -> pd.DataFrame:
+    """작은 파일이나 내보내기용으로 전체 데이터를 DataFrame으로 읽습니다. (행 번호를 인덱스로 사용)"""
+    with open_sheet(path, sheet) as stream:
+        records: List[Dict[str, Any]] = []
+        index: List[int] = []
+        for i, row in stream:
+            index.append(i)
+            records.append(row)
+        return pd.DataFrame.from_records(records, index=index, columns=stream.columns)